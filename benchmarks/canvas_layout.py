@@ -0,0 +1,70 @@
+"""
+Benchmark compositing into and diffing canvases stored as ``Cell`` arrays and as
+:class:`batgrl.text_tools.CellPlanes`.
+
+Usage: ``python benchmarks/canvas_layout.py [--height H] [--width W] [--repeat N]``
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from batgrl.rendering import _changed_spans
+from batgrl.text_tools import Cell, CellPlanes
+from batgrl.texture_tools import _composite
+
+
+def timeit(func, repeat):
+    """Return mean time of calling `func` in milliseconds."""
+    func()  # Warm-up.
+    start = perf_counter()
+    for _ in range(repeat):
+        func()
+    return (perf_counter() - start) / repeat * 1000
+
+
+def random_cells(rng, size):
+    """Return a ``Cell`` array of random characters, styles and colors."""
+    cells = np.zeros(size, Cell)
+    cells["char"] = rng.choice(list("abcdefghijklmnopqrstuvwxyz "), size)
+    cells["bold"] = rng.random(size) < 0.1
+    cells["fg_color"] = rng.integers(0, 256, (*size, 3))
+    cells["bg_color"] = rng.integers(0, 256, (*size, 3))
+    return cells
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--height", type=int, default=70)
+    parser.add_argument("--width", type=int, default=240)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    size = args.height, args.width
+    cells = random_cells(rng, size)
+    last_cells = cells.copy()
+    mask = rng.random(size) < 0.01
+    last_cells["char"][mask] = "#"
+    planes = CellPlanes.from_cells(cells)
+    last_planes = CellPlanes.from_cells(last_cells)
+    texture = rng.integers(0, 256, (*size, 4), np.uint8)
+    rgb = texture[..., :3]
+    a = texture[..., 3:]
+
+    benchmarks = [
+        ("composite", "cells", lambda: _composite(cells["fg_color"], rgb, a, 0.5)),
+        ("composite", "planes", lambda: _composite(planes.fg_color, rgb, a, 0.5)),
+        ("diff", "cells", lambda: (cells != last_cells).nonzero()),
+        ("diff", "planes", lambda: _changed_spans(planes, last_planes)),
+        ("convert", "from_cells", lambda: CellPlanes.from_cells(cells)),
+        ("convert", "to_cells", planes.to_cells),
+    ]
+    for name, layout, func in benchmarks:
+        print(f"{name:>9} ({layout:>10}): {timeit(func, args.repeat):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark :meth:`batgrl.gadgets._root._Root._render` with and without damage
+tracking.
+
+The scene is a dashboard of text gadgets on a pane where a single text gadget changes
+one character each frame.
+
+Usage: ``python benchmarks/damage_tracking.py [--height H] [--width W] [--frames N]``
+"""
+
+import argparse
+from time import perf_counter
+
+from batgrl.colors import BLACK
+from batgrl.gadgets._root import _Root
+from batgrl.gadgets.pane import Pane
+from batgrl.gadgets.text import Text
+from batgrl.geometry import Rect
+
+
+def dashboard(root):
+    """Fill root with a grid of text gadgets and return them."""
+    pane = Pane(size_hint={"height_hint": 1.0, "width_hint": 1.0})
+    root.add_gadget(pane)
+    texts = []
+    h, w = root.size
+    for y in range(0, h - 4, 5):
+        for x in range(0, w - 19, 20):
+            text = Text(size=(3, 18), pos=(y, x), is_transparent=True)
+            text.set_text(f"gadget\n{y:>4}\n{x:>4}")
+            pane.add_gadget(text)
+            texts.append(text)
+    return texts
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--height", type=int, default=70)
+    parser.add_argument("--width", type=int, default=240)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    for damage_tracking in [False, True]:
+        root = _Root(None, "regions", BLACK, (args.height, args.width), damage_tracking)
+        texts = dashboard(root)
+        root._render()
+        start = perf_counter()
+        for i in range(args.frames):
+            text = texts[i % len(texts)]
+            text.canvas["char"][2, 0] = "0123456789"[i % 10]
+            text.invalidate(Rect(2, 3, 0, 1))
+            root._render()
+        elapsed = perf_counter() - start
+        print(
+            f"damage_tracking={damage_tracking!s:>5}: "
+            f"{args.frames / elapsed:10.1f} frames/s ({len(texts)} gadgets)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark moving focus between :class:`batgrl.gadgets.behaviors.focusable.Focusable`
+gadgets.
+
+The scene is a form of ``--fields`` textboxes, each in a pane. Reports the time to
+add the form, to tab through every field, to focus random fields (like clicking
+them), and to remove the form.
+
+Usage: ``python benchmarks/focus_order.py [--fields N]``
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from batgrl.colors import BLACK, DEFAULT_COLOR_THEME
+from batgrl.gadgets._root import _Root
+from batgrl.gadgets.behaviors.focusable import Focusable
+from batgrl.gadgets.behaviors.themable import Themable
+from batgrl.gadgets.pane import Pane
+from batgrl.gadgets.textbox import Textbox
+
+
+def form(nfields):
+    """Return a pane containing `nfields` panes, each containing a textbox."""
+    form = Pane(size=(nfields, 40))
+    fields = []
+    for i in range(nfields):
+        row = Pane(size=(1, 40), pos=(i, 0))
+        field = Textbox(size=(1, 30), pos=(0, 10))
+        row.add_gadget(field)
+        form.add_gadget(row)
+        fields.append(field)
+    return form, fields
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fields", type=int, default=2000)
+    args = parser.parse_args()
+
+    Themable.set_theme(DEFAULT_COLOR_THEME)
+    root = _Root(None, "regions", BLACK, (40, 120))
+    pane, fields = form(args.fields)
+    rng = np.random.default_rng(0)
+    clicks = rng.integers(len(fields), size=len(fields)).tolist()
+
+    def add():
+        root.add_gadget(pane)
+
+    def tab():
+        for _ in fields:
+            Focusable.focus_next()
+
+    def click():
+        for i in clicks:
+            fields[i].focus()
+
+    def remove():
+        root.remove_gadget(pane)
+
+    for name, action in [
+        ("add", add),
+        ("tab", tab),
+        ("click", click),
+        ("remove", remove),
+    ]:
+        start = perf_counter()
+        action()
+        elapsed = perf_counter() - start
+        per_field = elapsed / len(fields) * 1e6
+        print(f"{name:>6}: {elapsed * 1e3:9.1f} ms ({per_field:.1f} us/field)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark an app run in a :class:`batgrl.terminal.HeadlessTerminal`.
+
+The app is a grid of text gadgets, some tweening across a pane, while scripted mouse
+and key input is played back. With a virtual clock (the default), every run renders the
+same frames, so frame times can be compared between runs.
+
+Usage: ``python benchmarks/headless_app.py [--height H] [--width W] [--duration S]
+[--real-clock] [--profile]``
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+import numpy as np
+
+from batgrl.app import App
+from batgrl.gadgets.gadget import Gadget
+from batgrl.gadgets.pane import Pane
+from batgrl.gadgets.text import Text
+from batgrl.geometry import Point
+from batgrl.terminal import HeadlessTerminal
+from batgrl.terminal.events import KeyEvent, MouseEvent
+
+
+class FrameTimer(Gadget):
+    """Record the time each frame is rendered."""
+
+    def __init__(self):
+        super().__init__(size=(1, 1), is_transparent=True)
+        self.times = []
+
+    def _render(self, canvas):
+        """Record frame time."""
+        self.times.append(perf_counter())
+
+
+class TweeningApp(App):
+    """A grid of text gadgets, some tweening across a pane."""
+
+    def __init__(self, timer, **kwargs):
+        super().__init__(**kwargs)
+        self.timer = timer
+
+    async def on_start(self):
+        """Add gadgets and start tweens."""
+        pane = Pane(size_hint={"height_hint": 1.0, "width_hint": 1.0})
+        self.add_gadgets(pane, self.timer)
+        h, w = self.root.size
+        texts = []
+        for y in range(0, h - 2, 3):
+            for x in range(0, w - 11, 12):
+                text = Text(size=(2, 10), pos=(y, x))
+                text.set_text(f"{y:>4},{x:<4}\ngadget")
+                texts.append(text)
+        pane.add_gadgets(texts)
+
+        async def wander(text, i):
+            home = text.pos
+            while True:
+                await text.tween(
+                    duration=0.5 + i % 5 / 10, pos=(home.y + 1, home.x + 2)
+                )
+                await text.tween(duration=0.5, pos=home)
+
+        await asyncio.gather(*(wander(text, i) for i, text in enumerate(texts[::8])))
+
+
+def script(size, duration, rng):
+    """Return scripted mouse moves and key presses ending with ctrl+c."""
+    h, w = size
+    events = []
+    for t in np.arange(0.0, duration, 0.02):
+        y, x = rng.integers(0, h), rng.integers(0, w)
+        events.append(
+            (t, MouseEvent(Point(y, x), "no_button", "mouse_move", *[False] * 3, 0, 0))
+        )
+    for t in np.arange(0.0, duration, 0.1):
+        events.append((t, KeyEvent("tab")))
+    events.append((duration, KeyEvent("c", ctrl=True)))
+    return events
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--height", type=int, default=50)
+    parser.add_argument("--width", type=int, default=160)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--real-clock", action="store_true")
+    parser.add_argument("--profile", action="store_true")
+    args = parser.parse_args()
+
+    size = args.height, args.width
+    terminal = HeadlessTerminal(
+        size,
+        script(size, args.duration, np.random.default_rng(0)),
+        virtual_clock=not args.real_clock,
+        record_output=False,
+    )
+    timer = FrameTimer()
+    app = TweeningApp(timer, render_interval=1 / 60, profile_frames=args.profile)
+    start = perf_counter()
+    app.run(terminal)
+    elapsed = perf_counter() - start
+
+    frame_times = np.diff(timer.times) * 1000
+    nframes = len(timer.times)
+    print(f"{nframes} frames in {elapsed:.2f} s ({args.duration} s of app time)")
+    print(
+        f"frame time: mean {frame_times.mean():.2f} ms, "
+        f"p50 {np.percentile(frame_times, 50):.2f} ms, "
+        f"p95 {np.percentile(frame_times, 95):.2f} ms"
+    )
+    print(f"{terminal.bytes_written / nframes:.0f} bytes/frame")
+
+    if app.profiler is not None:
+        for stage in ("regions", "render", "diff", "encode", "flush"):
+            print(f"{stage:>10}: {app.profiler.mean(stage) * 1000:.3f} ms")
+        for name, elapsed in app.profiler.gadget_times().items():
+            print(f"{name:>10}: {elapsed * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
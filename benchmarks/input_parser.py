@@ -0,0 +1,94 @@
+"""
+Benchmark the VT100 input parser, :meth:`batgrl.terminal.Vt100Terminal._feed`.
+
+Each workload is fed to a :class:`batgrl.terminal.HeadlessTerminal` in reads of
+``--chunk`` characters, like reads from stdin. Reports throughput in MB/s and events
+per second.
+
+Usage: ``python benchmarks/input_parser.py [--size MB] [--chunk N] [--repeat N]``
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from batgrl.terminal import HeadlessTerminal
+
+
+def paste(size, rng):
+    """Return a single bracketed paste of a log file."""
+    lines = []
+    nbytes = 0
+    i = 0
+    while nbytes < size:
+        line = f"2024-01-01 12:00:{i % 60:02} INFO worker-{i % 7}: processed item {i}"
+        lines.append(line)
+        nbytes += len(line) + 1
+        i += 1
+    return "\x1b[200~" + "\n".join(lines) + "\x1b[201~"
+
+
+def mouse_motion(size, rng):
+    """Return a flood of SGR mouse motion reports."""
+    n = size // 14
+    ys = rng.integers(1, 60, n)
+    xs = rng.integers(1, 200, n)
+    return "".join(f"\x1b[<35;{x};{y}M" for y, x in zip(ys.tolist(), xs.tolist()))
+
+
+def typing(size, rng):
+    """Return typed text mixed with enter, backspace, and arrow keys."""
+    words = ["batgrl", "terminal", "gadget", "render", "the", "a", "of"]
+    keys = ["\r", "\x7f", "\x1b[A", "\x1b[B", "\x1b[1;5C", "\x1bb"]
+    parts = []
+    nbytes = 0
+    while nbytes < size:
+        part = words[rng.integers(len(words))] + " "
+        if rng.random() < 0.2:
+            part += keys[rng.integers(len(keys))]
+        parts.append(part)
+        nbytes += len(part)
+    return "".join(parts)
+
+
+WORKLOADS = [paste, mouse_motion, typing]
+
+
+def run(data, chunk, repeat):
+    """Return the best time to parse `data` and the number of events generated."""
+    best = float("inf")
+    nevents = 0
+    for _ in range(repeat):
+        terminal = HeadlessTerminal()
+        start = perf_counter()
+        for i in range(0, len(data), chunk):
+            terminal._feed(data[i : i + chunk])
+        events = terminal.events()
+        best = min(best, perf_counter() - start)
+        nevents = len(events)
+    return best, nevents
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=float, default=5.0)
+    parser.add_argument("--chunk", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    size = int(args.size * 1_000_000)
+    for workload in WORKLOADS:
+        data = workload(size, rng)
+        elapsed, nevents = run(data, args.chunk, args.repeat)
+        mb = len(data.encode()) / 1_000_000
+        print(
+            f"{workload.__name__:>12}: {mb / elapsed:8.1f} MB/s "
+            f"{nevents / elapsed:12.0f} events/s ({nevents} events)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark dispatching mouse events through
+:meth:`batgrl.gadgets.gadget.Gadget.dispatch_mouse`.
+
+The scene is a data table with ``--rows`` rows above a row of buttons. Random mouse
+moves, presses and releases are dispatched, and a frame is rendered every few events.
+With ``--no-index``, the root's index of gadget regions isn't used, so every event is
+dispatched to every gadget.
+
+Usage: ``python benchmarks/mouse_dispatch.py [--rows N] [--events N]
+[--render-every N] [--no-index]``
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+import numpy as np
+
+from batgrl.colors import BLACK, DEFAULT_COLOR_THEME
+from batgrl.gadgets._root import _Root
+from batgrl.gadgets.behaviors.themable import Themable
+from batgrl.gadgets.button import Button
+from batgrl.gadgets.data_table import DataTable
+from batgrl.geometry import Point
+from batgrl.terminal.events import MouseEvent
+
+
+def build(root, nrows):
+    """Add a data table with `nrows` rows and a row of buttons to root."""
+    data = {
+        "id": list(range(nrows)),
+        "name": [f"item-{i:05}" for i in range(nrows)],
+        "stock": [i % 500 for i in range(nrows)],
+    }
+    h, w = root.size
+    root.add_gadget(DataTable(data=data, size=(h - 2, w)))
+    root.add_gadgets(
+        Button(label=f"button {i}", size=(1, 10), pos=(h - 1, 12 * i))
+        for i in range(w // 12)
+    )
+
+
+async def run(nrows, nevents, render_every):
+    """Return seconds spent dispatching `nevents` mouse events."""
+    root = _Root(None, "regions", BLACK, (40, 120))
+    build(root, nrows)
+    await asyncio.sleep(0)  # Let gadgets start any tasks.
+    root._render()
+
+    rng = np.random.default_rng(0)
+    h, w = root.size
+    elapsed = 0.0
+    for i in range(nevents):
+        event_type = rng.choice(
+            ["mouse_move", "mouse_down", "mouse_up"], p=[0.8, 0.1, 0.1]
+        )
+        button = "no_button" if event_type == "mouse_move" else "left"
+        pos = Point(int(rng.integers(h)), int(rng.integers(w)))
+        event = MouseEvent(pos, button, str(event_type), False, False, False, 0, 0)
+        start = perf_counter()
+        root.dispatch_mouse(event)
+        elapsed += perf_counter() - start
+        if i % render_every == 0:
+            root._render()
+    root.prolicide()
+    return elapsed
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--render-every", type=int, default=5)
+    parser.add_argument("--no-index", action="store_true")
+    args = parser.parse_args()
+
+    if args.no_index:
+        _Root._get_mouse_index = lambda self: None
+
+    Themable.set_theme(DEFAULT_COLOR_THEME)
+    elapsed = asyncio.run(run(args.rows, args.events, args.render_every))
+    print(
+        f"{args.rows} rows: {elapsed / args.events * 1e6:.1f} us/event "
+        f"({args.events / elapsed:.0f} events/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark :class:`batgrl.geometry.Region` set operations.
+
+Each workload repeats the region computations done while compositing: clipping each
+gadget by the area not yet covered by gadgets above it then subtracting it from that
+area.
+
+Usage: ``python benchmarks/regions.py [--repeat N]``
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from batgrl.geometry import Point, Region, Size
+
+
+def cover(rects):
+    """Compute visible regions of rects painted back-to-front."""
+    screen = Region.from_rect(Point(0, 0), Size(200, 400))
+    uncovered = screen
+    for pos, size in reversed(rects):
+        region = screen & Region.from_rect(pos, size) & uncovered
+        uncovered -= region
+    return uncovered
+
+
+def windows(rng):
+    """Return overlapping windows of random size."""
+    sizes = rng.integers((5, 10), (60, 120), (200, 2))
+    positions = rng.integers((-10, -10), (190, 390), (200, 2))
+    return [(Point(*pos), Size(*size)) for pos, size in zip(positions, sizes)]
+
+
+def tiles(rng):
+    """Return a dashboard of small non-overlapping tiles."""
+    return [
+        (Point(y, x), Size(3, 9))
+        for y in range(0, 200, 4)
+        for x in range(0, 400, 10)
+        if rng.random() < 0.9
+    ]
+
+
+def cascade(rng):
+    """Return a stack of cascading windows with small offsets."""
+    return [(Point(i, 2 * i), Size(40, 80)) for i in range(150)]
+
+
+def damage(rng):
+    """Return many small damaged rects."""
+    positions = rng.integers(0, (200, 400), (1000, 2))
+    sizes = rng.integers(1, (4, 12), (1000, 2))
+    return [(Point(*pos), Size(*size)) for pos, size in zip(positions, sizes)]
+
+
+def union(rects):
+    """Union all rects."""
+    region = Region()
+    for pos, size in rects:
+        region |= Region.from_rect(pos, size)
+    return region
+
+
+WORKLOADS = [(windows, cover), (tiles, cover), (cascade, cover), (damage, union)]
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for workload, compute in WORKLOADS:
+        rects = workload(np.random.default_rng(0))
+        region = compute(rects)  # Warm-up.
+        start = perf_counter()
+        for _ in range(args.repeat):
+            compute(rects)
+        elapsed = (perf_counter() - start) / args.repeat
+        nrects = sum(1 for _ in region.rects())
+        print(
+            f"{workload.__name__:>8}: {elapsed * 1000:10.2f} ms"
+            f" ({len(rects)} gadgets, {nrects} rects in result)"
+        )
+
+
+if __name__ == "__main__":
+    main()
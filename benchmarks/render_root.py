@@ -0,0 +1,142 @@
+"""
+Benchmark :func:`batgrl.rendering.render_root` on synthetic canvases.
+
+Reports frames per second and bytes written per frame for each scene.
+
+Usage: ``python benchmarks/render_root.py [--height H] [--width W] [--frames N]
+[--color-depth {truecolor,256color,16color}]``
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from batgrl.colors import BLACK
+from batgrl.gadgets._root import _Root
+from batgrl.rendering import ColorDepth, render_root
+from batgrl.terminal import Vt100Terminal
+
+
+class NullTerminal(Vt100Terminal):
+    """A terminal that counts then discards all output."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_alternate_screen = True
+
+    def process_stdin(self):
+        """Discard input."""
+
+    def raw_mode(self):
+        """Do nothing."""
+
+    def restore_console(self):
+        """Do nothing."""
+
+    def attach(self, event_handler):
+        """Do nothing."""
+
+    def unattach(self):
+        """Do nothing."""
+
+    def flush(self):
+        """Count then discard output buffer."""
+        self.bytes_written += len("".join(self._out_buffer).encode(errors="replace"))
+        self._out_buffer.clear()
+
+
+def noise(root, rng):
+    """Every cell changes color every frame, e.g., a full-screen video."""
+    root.canvas["char"] = "▀"
+    root.canvas["fg_color"] = rng.integers(0, 256, (*root.size, 3))
+    root.canvas["bg_color"] = rng.integers(0, 256, (*root.size, 3))
+
+
+def text(root, rng):
+    """Every cell changes character with a handful of color pairs."""
+    root.canvas["char"] = rng.choice(list("abcdefghijklmnopqrstuvwxyz "), root.size)
+    root.canvas["fg_color"] = rng.integers(0, 4, (*root.size, 1)) * 85
+    root.canvas["bold"] = rng.random(root.size) < 0.1
+
+
+def wide(root, rng):
+    """Every cell changes to a mix of full-width and half-width characters."""
+    h, w = root.size
+    is_wide = rng.random((h, w // 2)) < 0.5
+    chars = np.empty((h, w // 2, 2), "U1")
+    chars[..., 0] = np.where(
+        is_wide, rng.choice(list("漢字かなカナ한글🙂🚀"), (h, w // 2)), "a"
+    )
+    chars[..., 1] = np.where(is_wide, "", "b")
+    root.canvas["char"][:, : w // 2 * 2] = chars.reshape(h, -1)
+    root.canvas["fg_color"] = rng.integers(0, 4, (*root.size, 1)) * 85
+
+
+def sparse(root, rng):
+    """About 1% of cells change every frame."""
+    root.canvas[:] = root._last_canvas
+    mask = rng.random(root.size) < 0.01
+    root.canvas["char"][mask] = rng.choice(list("abcdefghijklmnopqrstuvwxyz"))
+    root.canvas["fg_color"][mask] = rng.integers(0, 256, 3)
+
+
+def scroll(root, rng):
+    """Content scrolls up a line every frame, e.g., a log being tailed."""
+    root.canvas[:-1] = root._last_canvas[1:]
+    root.canvas[-1] = root._last_canvas[-1]
+    root.canvas["char"][-1] = rng.choice(
+        list("abcdefghijklmnopqrstuvwxyz "), root.width
+    )
+    root.canvas["fg_color"][-1] = rng.integers(0, 4, (1, 3)) * 85
+
+
+def clock(root, rng):
+    """Only a clock in the top-right corner changes."""
+    root.canvas[:] = root._last_canvas
+    seconds = rng.integers(0, 86400)
+    time = f"{seconds // 3600:02}:{seconds // 60 % 60:02}:{seconds % 60:02}"
+    root.canvas["char"][0, -8:] = list(time)
+
+
+def static(root, rng):
+    """Nothing changes."""
+    root.canvas[:] = root._last_canvas
+
+
+SCENES = [noise, text, wide, sparse, scroll, clock, static]
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--height", type=int, default=70)
+    parser.add_argument("--width", type=int, default=240)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument(
+        "--color-depth", choices=ColorDepth.__args__, default="truecolor"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for scene in SCENES:
+        root = _Root(None, "regions", BLACK, (args.height, args.width))
+        terminal = NullTerminal()
+        render_root(root, terminal, args.color_depth)  # Initial full render.
+        initial_bytes = terminal.bytes_written
+        elapsed = 0.0
+        for _ in range(args.frames):
+            root.canvas, root._last_canvas = root._last_canvas, root.canvas
+            scene(root, rng)
+            start = perf_counter()
+            render_root(root, terminal, args.color_depth)
+            elapsed += perf_counter() - start
+        bytes_per_frame = (terminal.bytes_written - initial_bytes) / args.frames
+        print(
+            f"{scene.__name__:>8}: {args.frames / elapsed:10.1f} frames/s"
+            f"{bytes_per_frame:12.0f} bytes/frame"
+        )
+
+
+if __name__ == "__main__":
+    main()
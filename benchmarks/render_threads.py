@@ -0,0 +1,84 @@
+"""
+Benchmark :meth:`batgrl.gadgets._root._Root._render` compositing tiles on multiple
+threads.
+
+The scene is a stack of full-screen translucent graphics, each with a texture that
+changes every frame. Output with each number of threads is checked against output
+with a single thread.
+
+Usage: ``python benchmarks/render_threads.py [--height H] [--width W] [--frames N]
+[--layers N] [--threads N ...]``
+"""
+
+import argparse
+import os
+from time import perf_counter
+
+import numpy as np
+
+from batgrl.colors import BLACK
+from batgrl.gadgets._root import _Root
+from batgrl.gadgets.graphics import Graphics
+
+
+def layers(root, nlayers):
+    """Fill root with a stack of translucent graphics and return them."""
+    rng = np.random.default_rng(0)
+    graphics = []
+    for _ in range(nlayers):
+        layer = Graphics(
+            size_hint={"height_hint": 1.0, "width_hint": 1.0},
+            is_transparent=True,
+            alpha=0.6,
+        )
+        layer.texture[:] = rng.integers(0, 256, layer.texture.shape, np.uint8)
+        graphics.append(layer)
+    root.add_gadgets(graphics)
+    return graphics
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--height", type=int, default=100)
+    parser.add_argument("--width", type=int, default=300)
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--layers", type=int, default=6)
+    parser.add_argument(
+        "--threads", type=int, nargs="*", default=[1, 2, 4, os.cpu_count()]
+    )
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cores")
+    expected = None
+    base_fps = None
+    for nthreads in sorted(set(args.threads)):
+        root = _Root(
+            None, "regions", BLACK, (args.height, args.width), render_threads=nthreads
+        )
+        graphics = layers(root, args.layers)
+        root._render()
+        start = perf_counter()
+        for i in range(args.frames):
+            layer = graphics[i % len(graphics)]
+            layer.texture[..., :3] += 1
+            root._render()
+        elapsed = perf_counter() - start
+        root._stop_render_threads()
+
+        if expected is None:
+            expected = root.canvas
+            matches = True
+        else:
+            matches = bool((root.canvas == expected).all())
+        fps = args.frames / elapsed
+        if base_fps is None:
+            base_fps = fps
+        print(
+            f"render_threads={nthreads:>2}: {fps:8.1f} frames/s "
+            f"({fps / base_fps:4.2f}x) output matches: {matches}"
+        )
+
+
+if __name__ == "__main__":
+    main()
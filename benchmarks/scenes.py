@@ -0,0 +1,291 @@
+"""
+Benchmark the render pipeline on representative gadget scenes.
+
+Each scene builds a gadget tree, then every frame updates it, composites the gadget
+tree with :meth:`batgrl.gadgets._root._Root._render` and writes it to a
+:class:`batgrl.terminal.HeadlessTerminal` with :func:`batgrl.rendering.render_root`.
+Reports the time to build each scene, frames per second, bytes written per frame, and
+memory allocated while rendering each frame (peak KiB and net blocks retained,
+measured in a separate pass with :mod:`tracemalloc`).
+
+Results can be saved as JSON with ``--save`` and compared to saved results with
+``--compare``, which exits with status 1 if any scene's frame rate dropped or bytes
+per frame grew by more than ``--tolerance``.
+
+With default options, the suite takes about two minutes on a single core, and each
+scene is built in under ten seconds. Building the data table takes longest and grows
+faster than linearly with ``--table-rows`` (10,000 rows take over ten minutes).
+
+Usage: ``python benchmarks/scenes.py [--height H] [--width W] [--frames N]
+[--table-rows N] [--scene NAME ...] [--save PATH] [--compare PATH] [--tolerance T]``
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+from batgrl.colors import BLACK, DEFAULT_COLOR_THEME
+from batgrl.gadgets._root import _Root
+from batgrl.gadgets.behaviors.themable import Themable
+from batgrl.gadgets.data_table import DataTable
+from batgrl.gadgets.graphics import Graphics
+from batgrl.gadgets.markdown import Markdown
+from batgrl.gadgets.pane import Pane
+from batgrl.gadgets.raycaster import Raycaster, RaycasterCamera, Sprite
+from batgrl.gadgets.text import Text
+from batgrl.gadgets.text_field import TextParticleField
+from batgrl.gadgets.window import Window
+from batgrl.rendering import render_root
+from batgrl.terminal import HeadlessTerminal
+
+FULL = {"height_hint": 1.0, "width_hint": 1.0}
+"""Size hint of full-screen gadgets."""
+
+
+def windows(root, rng):
+    """Build forty overlapping translucent windows, one dragged each frame."""
+    root.add_gadget(Pane(size_hint=FULL))
+    h, w = root.size
+    windows = []
+    for i in range(40):
+        window = Window(
+            title=f"Window {i}",
+            size=(int(rng.integers(8, h // 2)), int(rng.integers(20, w // 3))),
+            pos=(int(rng.integers(0, h - 8)), int(rng.integers(0, w - 20))),
+            alpha=0.8,
+        )
+        text = Text()
+        text.set_text("\n".join(f"line {j} of window {i}" for j in range(20)))
+        window.view = text
+        windows.append(window)
+    root.add_gadgets(windows)
+
+    def update(frame):
+        window = windows[frame % len(windows)]
+        window.pull_to_front()
+        window.pos = (frame // 2 % (h - 8), frame % (w - 20))
+
+    return update
+
+
+def data_table(root, rng, nrows=1000):
+    """Build a data table with `nrows` rows that scrolls each frame."""
+    data = {
+        "id": list(range(nrows)),
+        "name": [f"item-{i:05}" for i in range(nrows)],
+        "price": np.round(rng.random(nrows) * 1000, 2).tolist(),
+        "stock": rng.integers(0, 500, nrows).tolist(),
+    }
+    table = DataTable(data=data, size_hint=FULL)
+    root.add_gadget(table)
+
+    def update(frame):
+        table._scroll_view.vertical_proportion = frame / 1000 % 1
+
+    return update
+
+
+def graphics(root, rng):
+    """Build a full-screen texture that changes every frame, e.g., a shader."""
+    graphics = Graphics(size_hint=FULL)
+    root.add_gadget(graphics)
+    h, w = graphics.texture.shape[:2]
+    ys, xs = np.indices((h, w))
+
+    def update(frame):
+        graphics.texture[..., 0] = (xs + frame) % 256
+        graphics.texture[..., 1] = (ys * 2 + frame) % 256
+        graphics.texture[..., 2] = (xs ^ ys) % 256
+        graphics.texture[..., 3] = 255
+
+    return update
+
+
+def particles(root, rng):
+    """Build 50,000 text particles drifting across the screen."""
+    n = 50_000
+    h, w = root.size
+    positions = np.column_stack((rng.integers(0, h, n), rng.integers(0, w, n)))
+    field = TextParticleField(size_hint=FULL, particle_positions=positions)
+    field.particle_cells["char"] = rng.choice(list("*+.o"), n)
+    field.particle_cells["fg_color"] = rng.integers(0, 256, (n, 3))
+    root.add_gadget(field)
+    velocities = rng.integers(-1, 2, (n, 2))
+
+    def update(frame):
+        field.particle_positions += velocities
+        field.particle_positions %= (h, w)
+
+    return update
+
+
+def raycaster(root, rng):
+    """Build a raycaster 200 columns wide with a rotating camera."""
+    caster_map = np.ones((10, 10), np.uint8)
+    caster_map[1:-1, 1:-1] = 0
+    caster_map[4:6, 4:6] = 1
+    checker = np.zeros((64, 64, 4), np.uint8)
+    checker[(np.indices((64, 64)) // 8).sum(axis=0) % 2 == 0] = 200
+    checker[..., 3] = 255
+    camera = RaycasterCamera(pos=(2.5, 2.5))
+    caster = Raycaster(
+        caster_map=caster_map,
+        camera=camera,
+        wall_textures=[checker],
+        sprites=[Sprite(pos=(7.5, 7.5), texture_idx=0)],
+        sprite_textures=[checker],
+        floor=checker,
+        size=(root.height, 200),
+    )
+    root.add_gadget(caster)
+
+    def update(frame):
+        camera.rotate(0.02)
+        caster.cast_rays()
+
+    return update
+
+
+def markdown(root, rng):
+    """Build a long markdown document that scrolls each frame."""
+    sections = []
+    for i in range(50):
+        sections.append(
+            f"## Section {i}\n\n"
+            "Some *italic*, **bold**, and `inline code` text that wraps across "
+            "multiple lines of the terminal when the document is narrow.\n\n"
+            "- first item\n- second item\n  - nested item\n\n"
+            "| a | b | c |\n|---|---|---|\n| 1 | 2 | 3 |\n\n"
+            f"```python\ndef section_{i}():\n    return {i}\n```\n"
+        )
+    document = Markdown(markdown="# Benchmark\n\n" + "\n".join(sections))
+    document.size_hint = FULL
+    root.add_gadget(document)
+
+    def update(frame):
+        document._scroll_view.vertical_proportion = frame / 1000 % 1
+
+    return update
+
+
+SCENES = [windows, data_table, graphics, particles, raycaster, markdown]
+
+
+def render(root, terminal):
+    """Composite and write a frame."""
+    root._render()
+    render_root(root, terminal)
+
+
+async def run_scene(scene, size, frames, **options):
+    """
+    Return setup time, frames per second, bytes per frame, and allocations of a
+    scene.
+    """
+    root = _Root(None, "regions", BLACK, size)
+    terminal = HeadlessTerminal(size, record_output=False)
+    terminal.in_alternate_screen = True
+    start = perf_counter()
+    update = scene(root, np.random.default_rng(0), **options)
+    await asyncio.sleep(0)  # Let gadgets start any tasks.
+    render(root, terminal)  # Initial full render.
+    setup = perf_counter() - start
+
+    initial_bytes = terminal.bytes_written
+    elapsed = 0.0
+    for frame in range(frames):
+        update(frame)
+        start = perf_counter()
+        render(root, terminal)
+        elapsed += perf_counter() - start
+    bytes_per_frame = (terminal.bytes_written - initial_bytes) / frames
+
+    peak = blocks = 0
+    tracemalloc.start()
+    for frame in range(frames, frames + min(frames, 20)):
+        update(frame)
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        blocks_before = sys.getallocatedblocks()
+        render(root, terminal)
+        peak += tracemalloc.get_traced_memory()[1] - current
+        blocks += sys.getallocatedblocks() - blocks_before
+    tracemalloc.stop()
+    nframes = min(frames, 20)
+
+    root.prolicide()
+    return {
+        "setup": setup,
+        "fps": frames / elapsed,
+        "bytes_per_frame": bytes_per_frame,
+        "peak_kib_per_frame": peak / nframes / 1024,
+        "blocks_per_frame": blocks / nframes,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print regressions from baseline and return whether there were any."""
+    regressed = False
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]
+        fps = result["fps"] / old["fps"]
+        bytes_ratio = result["bytes_per_frame"] / max(old["bytes_per_frame"], 1)
+        slower = fps < 1 - tolerance
+        larger = bytes_ratio > 1 + tolerance
+        regressed |= slower or larger
+        flag = " REGRESSED" if slower or larger else ""
+        print(f"{name:>10}: {fps:6.2f}x fps {bytes_ratio:6.2f}x bytes{flag}")
+    return regressed
+
+
+def main():
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--height", type=int, default=50)
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--table-rows", type=int, default=1000)
+    parser.add_argument(
+        "--scene", nargs="*", choices=[scene.__name__ for scene in SCENES]
+    )
+    parser.add_argument("--save", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    Themable.set_theme(DEFAULT_COLOR_THEME)
+    size = args.height, args.width
+    results = {}
+    for scene in SCENES:
+        if args.scene and scene.__name__ not in args.scene:
+            continue
+        options = {"nrows": args.table_rows} if scene is data_table else {}
+        result = asyncio.run(run_scene(scene, size, args.frames, **options))
+        results[scene.__name__] = result
+        print(
+            f"{scene.__name__:>10}: {result['setup']:7.2f} s setup"
+            f"{result['fps']:8.1f} frames/s"
+            f"{result['bytes_per_frame']:10.0f} bytes/frame"
+            f"{result['peak_kib_per_frame']:10.0f} KiB/frame peak"
+            f"{result['blocks_per_frame']:8.1f} net blocks/frame"
+        )
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(results, indent=4))
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,6 @@ from abc import ABC, abstractmethod
 from contextlib import redirect_stderr
 from io import StringIO
 from pathlib import Path
-from time import monotonic
 from typing import Any, Literal
 
 from .colors import BLACK, DEFAULT_COLOR_THEME, Color, ColorTheme
@@ -15,8 +14,15 @@ from .gadgets.behaviors.focusable import Focusable
 from .gadgets.behaviors.themable import Themable
 from .gadgets.gadget import Gadget
 from .geometry import Point, Size
-from .rendering import render_root
-from .terminal import Vt100Terminal, app_mode, get_platform_terminal
+from .profiling import FrameProfiler
+from .rendering import ColorDepth, FrameWriter, render_root
+from .terminal import (
+    HeadlessTerminal,
+    VirtualClockEventLoop,
+    Vt100Terminal,
+    app_mode,
+    get_platform_terminal,
+)
 from .terminal.events import (
     Event,
     FocusEvent,
@@ -48,6 +54,13 @@ class App(ABC):
         Color theme for :class:`batgrl.gadgets.behaviors.themable.Themable` gadgets.
     double_click_timeout : float, default: 0.5
         Max duration of a double-click.
+    coalesce_mouse_moves : bool, default: False
+        Whether consecutive ``"mouse_move"`` events with the same button and
+        modifiers in a batch of input events are merged into a single event before
+        being dispatched. The merged event has the position of the last event and the
+        summed ``dy`` and ``dx`` of all merged events. Reduces work when the terminal
+        floods mouse motion, but gadgets no longer see intermediate positions (e.g.,
+        a paint gadget that draws segments between consecutive positions).
     render_interval : float, default: 0.0
         Duration in seconds between consecutive frame renders.
     redirect_stderr : Path | None, default: None
@@ -57,6 +70,41 @@ class App(ABC):
         gadget back-to-front. ``"regions"`` only paints the visible portion of each
         gadget. ``"painter"`` may be more efficient for a large number of
         non-overlapping gadgets.
+    color_depth : ColorDepth, default: "truecolor"
+        Color depth of terminal output. ``"256color"`` and ``"16color"`` quantize
+        colors to the terminal's palette which produces less output for terminals that
+        don't support 24-bit colors.
+    damage_tracking : bool, default: False
+        Whether to only repaint damaged regions of the screen each frame. Changes in
+        gadget geometry are tracked automatically. Gadgets with
+        :attr:`batgrl.gadgets.gadget.Gadget.tracks_damage` set must report any other
+        changes with :meth:`batgrl.gadgets.gadget.Gadget.invalidate`. All other gadgets
+        are repainted every frame.
+    render_threads : int, default: 1
+        Number of threads compositing gadgets. If greater than 1, the screen is split
+        into as many horizontal tiles which are composited in parallel. Output is the
+        same as with a single thread, but large scenes of many graphics may render
+        faster as NumPy releases the GIL while compositing.
+    render_on_demand : bool, default: False
+        Whether to only render a frame when requested. Frames are requested by input
+        events, changes in gadget geometry, tweens, and
+        :meth:`batgrl.gadgets.gadget.Gadget.invalidate`. Frames are still rendered at
+        most every :attr:`render_interval` seconds.
+    idle_render_interval : float | None, default: 1.0
+        If rendering on demand, max duration in seconds between consecutive frame
+        renders. Changes that don't request a frame will appear after at most this
+        long. If ``None``, frames are only rendered when requested.
+    output_thread : bool, default: False
+        Whether to encode and write frames to the terminal on a dedicated thread. If
+        the terminal is slow, input handling and tweens aren't stalled and frames are
+        dropped instead.
+    profile_frames : bool, default: False
+        Whether to record the timings of each frame in :attr:`profiler`. Recent timings
+        can be shown with a
+        :class:`batgrl.gadgets.frame_profiler_overlay.FrameProfilerOverlay`.
+    profile_path : Path | None, default: None
+        If provided and frames are profiled, the timings of each frame are written to
+        this path as JSON lines.
 
     Attributes
     ----------
@@ -72,12 +120,40 @@ class App(ABC):
         Color theme for :class:`batgrl.gadgets.behaviors.themable.Themable` gadgets.
     double_click_timeout : float
         Max duration of a double-click.
+    coalesce_mouse_moves : bool
+        Whether consecutive ``"mouse_move"`` events are merged before being
+        dispatched.
+    coalesced_mouse_moves : int
+        Number of ``"mouse_move"`` events merged into later events and not dispatched.
     render_interval : float
         Duration in seconds between consecutive frame renders.
     redirect_stderr : Path | None
         Path where stderr is saved.
     render_mode : Literal["regions", "painter"]
         Determines how the gadget tree is rendered.
+    color_depth : ColorDepth
+        Color depth of terminal output.
+    damage_tracking : bool
+        Whether to only repaint damaged regions of the screen each frame.
+    render_threads : int
+        Number of threads compositing gadgets.
+    render_on_demand : bool
+        Whether to only render a frame when requested.
+    idle_render_interval : float | None
+        If rendering on demand, max duration in seconds between consecutive frame
+        renders.
+    output_thread : bool
+        Whether to encode and write frames to the terminal on a dedicated thread.
+    frame_writer : FrameWriter | None
+        Writes frames on a dedicated thread if :attr:`output_thread` is true (only set
+        while app is running).
+    profile_frames : bool
+        Whether to record the timings of each frame in :attr:`profiler`.
+    profile_path : Path | None
+        Path where the timings of each frame are written as JSON lines.
+    profiler : FrameProfiler | None
+        Timings of recent frames if :attr:`profile_frames` is true (set when app is
+        run).
     root : _Root | None
         Root of gadget tree.
     children : list[Gadget]
@@ -87,7 +163,7 @@ class App(ABC):
     -------
     on_start()
         Coroutine scheduled when app is run.
-    run()
+    run(terminal=None)
         Run the app.
     exit(exit_value)
         Exit the app.
@@ -106,12 +182,25 @@ class App(ABC):
         inline_height: int = 10,
         color_theme: ColorTheme = DEFAULT_COLOR_THEME,
         double_click_timeout: float = 0.5,
+        coalesce_mouse_moves: bool = False,
         render_interval: float = 0.0,
         redirect_stderr: Path | None = None,
         render_mode: Literal["regions", "painter"] = "regions",
+        color_depth: ColorDepth = "truecolor",
+        damage_tracking: bool = False,
+        render_threads: int = 1,
+        render_on_demand: bool = False,
+        idle_render_interval: float | None = 1.0,
+        output_thread: bool = False,
+        profile_frames: bool = False,
+        profile_path: Path | None = None,
     ):
         self.root: _Root | None = None
         """Root of gadget tree (only set while app is running)."""
+        self.frame_writer: FrameWriter | None = None
+        """Writes frames on a dedicated thread (only set while app is running)."""
+        self.profiler: FrameProfiler | None = None
+        """Timings of recent frames if frames are profiled (set when app is run)."""
         self.bg_color = bg_color
         """Background color of app."""
         self.title = title
@@ -124,16 +213,36 @@ class App(ABC):
         """Color theme for Themable gadgets."""
         self.double_click_timeout = double_click_timeout
         """Max duration of a double-click."""
+        self.coalesce_mouse_moves = coalesce_mouse_moves
+        """Whether consecutive ``"mouse_move"`` events are merged before dispatch."""
+        self.coalesced_mouse_moves: int = 0
+        """Number of ``"mouse_move"`` events merged into later events."""
         self.render_interval = render_interval
         """Duration in seconds between consecutive frame renders."""
         self.redirect_stderr = redirect_stderr
         """Path where stderr is saved."""
         self.render_mode = render_mode
         """Determines how the gadget tree is rendered."""
+        self.color_depth = color_depth
+        """Color depth of terminal output."""
+        self.damage_tracking = damage_tracking
+        """Whether to only repaint damaged regions of the screen each frame."""
+        self.render_threads = render_threads
+        """Number of threads used to render tiles of the root canvas."""
+        self.render_on_demand = render_on_demand
+        """Whether to only render a frame when requested."""
+        self.idle_render_interval = idle_render_interval
+        """Max duration in seconds between frame renders if rendering on demand."""
+        self.output_thread = output_thread
+        """Whether to encode and write frames to the terminal on a dedicated thread."""
+        self.profile_frames = profile_frames
+        """Whether to record the timings of each frame in :attr:`profiler`."""
+        self.profile_path = profile_path
+        """Path where the timings of each frame are written as JSON lines."""
         self._inline_needs_clear: bool = False
         """Whether to clear terminal when switching to inline mode."""
         self._terminal: Vt100Terminal | None = None
-        """Platform-specific terminal (only set while app is running)."""
+        """Terminal app is running in (only set while app is running)."""
         self._exit_value: Any = None
         """Value set by ``exit(exit_value)`` and returned by ``run()``."""
 
@@ -145,9 +254,18 @@ class App(ABC):
             f"    inline={self.inline},\n"
             f"    inline_height={self.inline_height},\n"
             f"    double_click_timeout={self.double_click_timeout},\n"
+            f"    coalesce_mouse_moves={self.coalesce_mouse_moves},\n"
             f"    render_interval={self.render_interval},\n"
             f"    redirect_stderr={self.redirect_stderr},\n"
             f"    render_mode={self.render_mode!r},\n"
+            f"    color_depth={self.color_depth!r},\n"
+            f"    damage_tracking={self.damage_tracking},\n"
+            f"    render_threads={self.render_threads},\n"
+            f"    render_on_demand={self.render_on_demand},\n"
+            f"    idle_render_interval={self.idle_render_interval},\n"
+            f"    output_thread={self.output_thread},\n"
+            f"    profile_frames={self.profile_frames},\n"
+            f"    profile_path={self.profile_path},\n"
             ")"
         )
 
@@ -174,10 +292,11 @@ class App(ABC):
             self._terminal.exit_alternate_screen()
             height, _ = self._terminal.get_size()
             self.root.height = min(self.inline_height, height)
+            self.root._reset_inline_rows = True
             if self._inline_needs_clear:
                 self._terminal.move_cursor(Point(0, 0))
                 self._terminal.erase_in_display()
-                self._terminal.request_cursor_position_report()
+                self._terminal.request_cursor_position_report(Point(0, 0))
             else:
                 self._terminal.move_cursor()
         else:
@@ -236,16 +355,86 @@ class App(ABC):
         self._render_mode = render_mode
         if self.root is not None:
             self.root.render_mode = render_mode
+            self.root._request_render()
+
+    @property
+    def color_depth(self) -> ColorDepth:
+        """Color depth of terminal output."""
+        return self._color_depth
+
+    @color_depth.setter
+    def color_depth(self, color_depth: ColorDepth):
+        self._color_depth = color_depth
+        if self.frame_writer is not None:
+            self.frame_writer.color_depth = color_depth
+        if self.root is not None:
+            # Repaint every cell with new color depth.
+            self.root._resized = True
+            self.root._request_render()
+
+    @property
+    def damage_tracking(self) -> bool:
+        """Whether to only repaint damaged regions of the screen each frame."""
+        return self._damage_tracking
+
+    @damage_tracking.setter
+    def damage_tracking(self, damage_tracking: bool):
+        self._damage_tracking = damage_tracking
+        if self.root is not None:
+            self.root.damage_tracking = damage_tracking
+            self.root._request_render()
+
+    @property
+    def render_threads(self) -> int:
+        """Number of threads compositing gadgets."""
+        return self._render_threads
+
+    @render_threads.setter
+    def render_threads(self, render_threads: int):
+        self._render_threads = render_threads
+        if self.root is not None:
+            self.root.render_threads = render_threads
+            self.root._stop_render_threads()
+
+    @property
+    def render_on_demand(self) -> bool:
+        """Whether to only render a frame when requested."""
+        return self._render_on_demand
+
+    @render_on_demand.setter
+    def render_on_demand(self, render_on_demand: bool):
+        self._render_on_demand = render_on_demand
+        if self.root is not None:
+            self.root._request_render()
 
     @abstractmethod
     async def on_start(self):
         """Coroutine scheduled when app is run."""
 
-    def run(self) -> Any:
-        """Run the app."""
+    def run(self, terminal: Vt100Terminal | None = None) -> Any:
+        """
+        Run the app.
+
+        Parameters
+        ----------
+        terminal : Vt100Terminal | None, default: None
+            Terminal the app runs in. If not given, a platform-specific terminal is
+            used. To run the app without a tty, use a
+            :class:`batgrl.terminal.HeadlessTerminal`.
+
+        Returns
+        -------
+        Any
+            The value passed to :meth:`exit`.
+        """
+        if isinstance(terminal, HeadlessTerminal) and terminal.virtual_clock:
+            loop_factory = VirtualClockEventLoop
+        else:
+            loop_factory = None
+
         try:
             with redirect_stderr(StringIO()) as defer_stderr:
-                asyncio.run(self._run_async())
+                asyncio.run(self._run_async(terminal), loop_factory=loop_factory)
         except asyncio.CancelledError:
             pass
         finally:
@@ -283,28 +472,52 @@ class App(ABC):
             for task in tasks:
                 task.cancel()
 
-    async def _run_async(self):
+    async def _run_async(self, terminal: Vt100Terminal | None = None):
         """Build environment, create root, and schedule app-specific tasks."""
         self._inline_needs_clear = False
-        terminal = self._terminal = get_platform_terminal()
+        if terminal is None:
+            terminal = get_platform_terminal()
+        self._terminal = terminal
         last_size: Size = terminal.get_size()
         self.root = root = _Root(
             app=self,
             render_mode=self.render_mode,
             bg_color=self.bg_color,
             size=last_size,
+            damage_tracking=self.damage_tracking,
+            render_threads=self.render_threads,
         )
         if self.inline:
             root.height = min(self.inline_height, last_size.height)
+        root._render_requested = render_requested = asyncio.Event()
+        root._loop = loop = asyncio.get_running_loop()
+        if self.profile_frames:
+            self.profiler = FrameProfiler(path=self.profile_path)
+            root._profiler = self.profiler
+        # Fails the app if writing frames on the frame writer's thread fails.
+        frame_writer_failed = loop.create_future()
+
+        def frame_writer_error(error: Exception) -> None:
+            if not frame_writer_failed.done():
+                frame_writer_failed.set_exception(error)
+
+        if self.output_thread:
+            self.frame_writer = FrameWriter(
+                terminal,
+                self.color_depth,
+                profiler=root._profiler,
+                on_error=frame_writer_error,
+            )
+        frame_writer = self.frame_writer
 
         last_mouse_button: MouseButton = "no_button"
-        last_mouse_time = monotonic()
+        last_mouse_time = loop.time()
         last_mouse_nclicks = 0
 
         def determine_nclicks(mouse_event: MouseEvent) -> None:
             """Determine number of consecutive clicks for a `MouseEvent`."""
             nonlocal last_mouse_button, last_mouse_time, last_mouse_nclicks
-            current_time = monotonic()
+            current_time = loop.time()
 
             if mouse_event.event_type != "mouse_down":
                 return
@@ -323,6 +536,11 @@ class App(ABC):
 
         def event_handler(events: list[Event]) -> None:
             """Handle input events."""
+            root._request_render()
+            if self.coalesce_mouse_moves:
+                nevents = len(events)
+                events = _coalesce_mouse_moves(events)
+                self.coalesced_mouse_moves += nevents - len(events)
             for event in events:
                 if isinstance(event, KeyEvent):
                     if (
@@ -361,9 +579,14 @@ class App(ABC):
                         continue
                     last_size = event.size
                     if self.inline:
-                        terminal.move_cursor(Point(0, 0))
-                        terminal.erase_in_display()
-                        terminal.request_cursor_position_report()
+                        # Lines may be reflowed and the app's origin moved. Frames
+                        # end with the cursor at the origin, so request its position
+                        # and keep rendering at the old origin until it's received.
+                        root._reset_inline_rows = True
+                        root._resized = True
+                        terminal.request_cursor_position_report(
+                            terminal.last_cursor_position_response
+                        )
                         height, width = last_size
                         root.size = min(self.inline_height, height), width
                     else:
@@ -371,19 +594,51 @@ class App(ABC):
                         root.size = event.size
 
         async def auto_render():
-            """Render screen every :attr:`render_interval` seconds."""
+            """
+            Render screen every :attr:`render_interval` seconds or, if rendering on
+            demand, when a frame is requested.
+            """
             while True:
+                render_requested.clear()
                 root._render()
-                render_root(root, terminal)
+                if frame_writer is None:
+                    render_root(root, terminal, self.color_depth)
+                else:
+                    frame_writer.submit(root)
                 await asyncio.sleep(self.render_interval)
-
+                if not self.render_on_demand:
+                    continue
+
+                try:
+                    await asyncio.wait_for(
+                        render_requested.wait(), self.idle_render_interval
+                    )
+                except TimeoutError:
+                    pass
+
+        # Render frames skipped while the terminal was behind once it catches up.
+        terminal._drain_handler = root._request_render
         with app_mode(terminal, event_handler):
+            terminal.request_synchronized_update_report()
             terminal.request_cursor_position_report()
             if self.title:
                 terminal.set_title(self.title)
             if not self.inline:
                 terminal.enter_alternate_screen()
-            await asyncio.gather(self.on_start(), auto_render())
+            if frame_writer is not None:
+                frame_writer.start()
+            try:
+                await asyncio.gather(
+                    self.on_start(), auto_render(), frame_writer_failed
+                )
+            finally:
+                if frame_writer is not None:
+                    frame_writer.stop()
+                    self.frame_writer = None
+                root._stop_render_threads()
+                terminal._drain_handler = None
+                if root._profiler is not None:
+                    root._profiler.close()
 
     def add_gadget(self, gadget: Gadget) -> None:
         """
@@ -414,6 +669,35 @@ class App(ABC):
             return self.root.children
 
 
+def _coalesce_mouse_moves(events: list[Event]) -> list[Event]:
+    """
+    Merge consecutive ``"mouse_move"`` events with the same button and modifiers
+    into the last of them, summing their ``dy`` and ``dx``.
+    """
+    coalesced = []
+    last = None
+    for event in events:
+        if (
+            last is not None
+            and isinstance(event, MouseEvent)
+            and event.event_type == "mouse_move"
+            and event.button == last.button
+            and event.alt == last.alt
+            and event.ctrl == last.ctrl
+            and event.shift == last.shift
+        ):
+            event.dy += last.dy
+            event.dx += last.dx
+            coalesced[-1] = event
+        else:
+            coalesced.append(event)
+        if isinstance(event, MouseEvent) and event.event_type == "mouse_move":
+            last = event
+        else:
+            last = None
+    return coalesced
+
+
 def run_gadget_as_app(gadget: Gadget) -> None:
     """
     Run a gadget as a full-screen app.
@@ -2,17 +2,121 @@
 
 from __future__ import annotations
 
-from threading import RLock
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock, get_ident
+from time import perf_counter
 from typing import TYPE_CHECKING, Literal, Self
 
 import numpy as np
+from numpy.typing import NDArray
 
 if TYPE_CHECKING:
     from ..app import App
 
 from ..colors import Color
-from ..text_tools import new_cell
-from .gadget import Gadget, Point, Region, Size
+from ..geometry import Rect
+from ..profiling import FrameProfiler, FrameStats
+from ..terminal.events import MouseEvent
+from ..text_tools import CellPlanes, new_cell
+from .gadget import Cell, Gadget, Point, Region, Size
+
+_RENDER_ATTEMPTS = 3
+"""
+Attempts to render a frame before blocking writers from other threads until the frame
+is rendered.
+"""
+
+
+class _MouseIndex:
+    """
+    Index of the regions of the gadget tree for dispatching mouse events.
+
+    Built from the gadget tree in painting order when regions were last computed.
+    """
+
+    def __init__(
+        self,
+        gadgets: list[Gadget],
+        parents: list[int],
+        subtree_ends: list[int],
+        height: int,
+    ):
+        self.gadgets = gadgets
+        """Root and all its descendents in painting order."""
+        self.parents = parents
+        """Index in ``gadgets`` of the parent of each gadget."""
+        self.subtree_ends = subtree_ends
+        """Index in ``gadgets`` one past the last descendent of each gadget."""
+        self.positions: dict[Gadget, int] = {
+            gadget: i for i, gadget in enumerate(gadgets)
+        }
+        """Index of each gadget in ``gadgets``."""
+        self.children: list[list[Gadget]] = [
+            list(gadget.children) for gadget in gadgets
+        ]
+        """Children of each gadget when the index was built."""
+        self.active: dict[int, set[int]] = {}
+        """
+        For each gadget, indices of children whose subtree has a gadget that doesn't
+        hit-test mouse events.
+        """
+        has_active = [False] * len(gadgets)
+        for i in range(len(gadgets) - 1, 0, -1):
+            if has_active[i] or not gadgets[i].hit_test_mouse:
+                has_active[parents[i]] = True
+                self.active.setdefault(parents[i], set()).add(i)
+
+        self.rows: list[list[tuple[int, int, int]]] = [[] for _ in range(height)]
+        """
+        For each row of the screen, the columns spanned by each gadget's region in that
+        row as ``(start, end, index)``.
+        """
+        for i, gadget in enumerate(gadgets):
+            for band in gadget._region.bands:
+                walls = band.walls
+                spans = [(walls[j], walls[j + 1], i) for j in range(0, len(walls), 2)]
+                for y in range(max(band.y1, 0), min(band.y2, height)):
+                    self.rows[y].extend(spans)
+
+        self._last_hits: tuple[Point, list[int]] | None = None
+        """Last point queried with :meth:`hits` and its result."""
+
+    def hits(self, point: Point) -> list[int]:
+        """Return the indices of gadgets whose region contains `point`."""
+        if self._last_hits is not None and self._last_hits[0] == point:
+            return self._last_hits[1]
+
+        y, x = point
+        if 0 <= y < len(self.rows):
+            hits = [i for start, end, i in self.rows[y] if start <= x < end]
+        else:
+            hits = []
+        self._last_hits = point, hits
+        return hits
+
+    def paths(self, point: Point, captures: Iterable[Gadget]) -> dict[int, set[int]]:
+        """
+        For each gadget, return the indices of children whose subtree has a region
+        containing `point` or a gadget in `captures`.
+        """
+        hits = list(self.hits(point))
+        for gadget in captures:
+            if (i := self.positions.get(gadget)) is not None:
+                hits.append(i)
+
+        paths: dict[int, set[int]] = {}
+        parents = self.parents
+        for i in hits:
+            while i > 0:
+                parent = parents[i]
+                children = paths.setdefault(parent, set())
+                if i in children:
+                    break
+                children.add(i)
+                i = parent
+        return paths
 
 
 class _Root(Gadget):
@@ -28,14 +132,103 @@ class _Root(Gadget):
         render_mode: Literal["regions", "painter"],
         bg_color: Color,
         size: Size,
+        damage_tracking: bool = False,
+        render_threads: int = 1,
     ):
-        self._render_lock = RLock()
+        self._write_lock = RLock()
+        """Serializes changes to gadget geometry."""
+        self._write_depth: int = 0
+        """Number of nested changes to gadget geometry in progress."""
+        self._epoch: int = 0
+        """
+        Incremented when a change to gadget geometry from another thread starts and
+        when it ends. Odd while a change is in progress.
+        """
+        self._render_thread: int = get_ident()
+        """Identifier of thread that renders the gadget tree."""
+        self.render_retries: int = 0
+        """
+        Number of renders repeated because another thread changed gadget geometry
+        while rendering.
+        """
+        self.locked_renders: int = 0
+        """Number of renders that blocked writers after too many retries."""
+        self.contended_writes: int = 0
+        """Number of changes to gadget geometry that waited for another writer."""
+        self.write_wait_time: float = 0.0
+        """Total seconds changes to gadget geometry waited for other writers."""
         self._size = -1, -1
         self.children = []
 
         self._app = app
         self.render_mode = render_mode
         self._cell = new_cell(bg_color=bg_color)
+        self.damage_tracking = damage_tracking
+        self.render_threads = render_threads
+        """
+        Number of threads compositing gadgets. If greater than 1, the canvas is split
+        into as many horizontal tiles which are composited in parallel.
+        """
+        self._executor: ThreadPoolExecutor | None = None
+        """Composites tiles if :attr:`render_threads` is greater than 1."""
+
+        self._invalidated: list[tuple[Gadget, Rect | None]] = []
+        """Gadgets (and optional local rects) invalidated since the last render."""
+        self._repaint_all: bool = True
+        """Whether the next render must repaint the whole canvas."""
+        self._last_damage: Region | None = None
+        """
+        Region repainted in the last render or ``None`` if the whole canvas was
+        repainted.
+        """
+        self._render_requested: asyncio.Event | None = None
+        """If app renders on demand, set when a new frame is requested."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        """Event loop of the app if app renders on demand."""
+        self._last_planes: CellPlanes | None = None
+        """Canvas last written to the terminal by ``render_root``."""
+        self._profiler: FrameProfiler | None = None
+        """Records timings of each frame if app profiles frames."""
+        self._frame_stats: FrameStats | None = None
+        """Stats of the last render if app profiles frames, until it is written."""
+        self._reset_inline_rows: bool = False
+        """
+        Whether the next written frame must feed the lines below the inline origin
+        again, e.g., after the terminal is resized.
+        """
+
+        self.regions_recomputed: int = 0
+        """Number of gadget regions recomputed during the last render."""
+        self._gadgets: list[Gadget] = []
+        """Root and all its descendents in painting order (preorder traversal)."""
+        self._subtree_ends: list[int] = []
+        """Index in ``_gadgets`` one past the last descendent of each gadget."""
+        self._parents: list[int] = []
+        """Index in ``_gadgets`` of the parent of each gadget."""
+        self._geometry: list[tuple] = []
+        """Geometry of each gadget in ``_gadgets`` when regions were last computed."""
+        self._clipped_regions: list[Region] = []
+        """Region of each gadget in ``_gadgets`` clipped by its parent's region."""
+        self._uncovered_regions: list[Region] = []
+        """
+        Region of the screen not covered by each gadget in ``_gadgets`` (if opaque) or
+        by opaque gadgets later in painting order.
+        """
+
+        self._mouse_index: _MouseIndex | None = None
+        """Index of gadget regions built on the first mouse event after a render."""
+        self._mouse_paths: (
+            tuple[MouseEvent, _MouseIndex, dict[int, set[int]]] | None
+        ) = None
+        """Paths to gadgets that may handle the mouse event being dispatched."""
+        self._mouse_captures: set[Gadget] = set()
+        """
+        Gadgets that hit-test mouse events but also handle mouse events outside
+        themselves, e.g., hovered buttons.
+        """
+        self._tree_changed: bool = False
+        """Whether gadgets were added since regions were last computed."""
+
         self.size = size
 
     def on_size(self):
@@ -44,6 +237,7 @@ class _Root(Gadget):
         self.canvas = np.full((h, w), self._cell)
         self._last_canvas = self.canvas.copy()
         self._resized = True
+        self._repaint_all = True
 
     @property
     def _pos(self) -> Point:
@@ -85,6 +279,8 @@ class _Root(Gadget):
     @bg_color.setter
     def bg_color(self, color: Color):
         self._cell["bg_color"] = color
+        self._repaint_all = True
+        self._request_render()
 
     def to_local(self, point: Point) -> Point:
         return point
@@ -92,38 +288,494 @@ class _Root(Gadget):
     def collides_point(self, point: Point) -> bool:
         return point in self.size
 
+    def _request_render(self):
+        """Request a new frame if app renders on demand. Thread-safe."""
+        if self._render_requested is None or self._render_requested.is_set():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is self._loop:
+            self._render_requested.set()
+        else:
+            self._loop.call_soon_threadsafe(self._render_requested.set)
+
+    def _begin_write(self):
+        """
+        Begin a change to gadget geometry. Must be paired with :meth:`_end_write`.
+
+        Writers don't wait for renders. Instead, a change from a thread other than
+        the render thread bumps :attr:`_epoch` so that a render in progress is
+        repeated.
+        """
+        lock = self._write_lock
+        if not lock.acquire(blocking=False):
+            start = perf_counter()
+            lock.acquire()
+            self.contended_writes += 1
+            self.write_wait_time += perf_counter() - start
+
+        self._write_depth += 1
+        if self._write_depth == 1 and get_ident() != self._render_thread:
+            self._epoch += 1
+
+    def _end_write(self):
+        """End a change to gadget geometry."""
+        if self._write_depth == 1 and get_ident() != self._render_thread:
+            self._epoch += 1
+        self._write_depth -= 1
+        self._write_lock.release()
+
+    def _painting_order(self) -> tuple[list[Gadget], list[int], list[int]]:
+        """
+        Return root and all its descendents in painting order, the index of each
+        gadget's parent, and the index one past the last descendent of each gadget.
+        """
+        gadgets = [self]
+        parents = [-1]
+        subtree_ends = [1]
+
+        def visit(parent_index: int):
+            for child in gadgets[parent_index].children:
+                index = len(gadgets)
+                gadgets.append(child)
+                parents.append(parent_index)
+                subtree_ends.append(0)
+                visit(index)
+                subtree_ends[index] = len(gadgets)
+
+        visit(0)
+        subtree_ends[0] = len(gadgets)
+        return gadgets, parents, subtree_ends
+
+    def _update_regions(self) -> Region | None:
+        """
+        Update the region of each gadget in the gadget tree.
+
+        A gadget's region is first clipped by its parent's region. Then, in regions
+        mode, the regions of opaque gadgets later in painting order are subtracted.
+        Regions are only recomputed for gadgets whose geometry changed, their
+        descendents, and gadgets earlier in painting order.
+
+        Returns
+        -------
+        Region | None
+            If damage tracking is enabled, the region of the screen that may have
+            changed due to changes in geometry. ``None`` if the whole screen must be
+            repainted.
+        """
+        gadgets, parents, subtree_ends = self._painting_order()
+        geometry = [(self.render_mode, self.size)]
+        geometry.extend(
+            (
+                gadget.pos,
+                gadget.size,
+                gadget.is_enabled,
+                gadget.is_visible,
+                gadget.is_transparent,
+            )
+            for gadget in gadgets[1:]
+        )
+
+        if (
+            gadgets != self._gadgets
+            or subtree_ends != self._subtree_ends
+            or geometry[0] != self._geometry[0]
+        ):
+            # Tree structure changed, recompute all regions.
+            self._clipped_regions = [Region()] * len(gadgets)
+            self._uncovered_regions = [Region()] * len(gadgets)
+            changed = [0]
+            damage = None
+        else:
+            changed = [
+                i
+                for i, (old, new) in enumerate(zip(self._geometry, geometry))
+                if old != new
+            ]
+            damage = Region() if self.damage_tracking else None
+
+        self._gadgets = gadgets
+        self._subtree_ends = subtree_ends
+        self._parents = parents
+        self._geometry = geometry
+        self._tree_changed = False
+
+        if not changed:
+            self.regions_recomputed = 0
+            return damage
+
+        self._mouse_index = None
+        clipped = self._clipped_regions
+        moved = []
+        last_dirty = 0
+        for i in changed:
+            if i < last_dirty:
+                # Already recomputed as the descendent of a changed gadget.
+                continue
+
+            last_dirty = subtree_ends[i]
+            moved.append(range(i, last_dirty))
+            for j in range(i, last_dirty):
+                gadget = gadgets[j]
+                if j == 0:
+                    clipped[j] = Region.from_rect(self.pos, self.size)
+                elif gadget.is_enabled and gadget.is_visible:
+                    clipped[j] = clipped[parents[j]] & Region.from_rect(
+                        gadget.absolute_pos, gadget.size
+                    )
+                else:
+                    clipped[j] = Region()
+
+        old_regions = [gadget._region for gadget in gadgets[1:last_dirty]]
+
+        if self.render_mode == "painter":
+            for j in range(1, last_dirty):
+                gadgets[j]._region = clipped[j]
+            self._region = clipped[0]
+        else:
+            # Regions of gadgets later in painting order than the last changed gadget
+            # are unchanged, so start from the uncovered region saved for that gadget.
+            uncovered = self._uncovered_regions
+            if last_dirty == len(gadgets):
+                region = clipped[0]
+            else:
+                region = uncovered[last_dirty]
+
+            for j in range(last_dirty - 1, 0, -1):
+                gadget = gadgets[j]
+                if gadget.is_enabled:
+                    gadget._region = clipped[j] & region
+                    if gadget.is_visible and not gadget.is_transparent:
+                        region -= gadget._region
+                else:
+                    gadget._region = clipped[j]
+                uncovered[j] = region
+
+            self._region = region
+
+        self.regions_recomputed = last_dirty
+
+        if damage is None:
+            return None
+
+        # Changed gadgets and their descendents may have moved or changed
+        # transparency so both their old and new regions are damaged. Other gadgets
+        # are only damaged where their region was covered or uncovered.
+        is_moved = [False] * last_dirty
+        for indices in moved:
+            for j in indices:
+                is_moved[j] = True
+
+        for j in range(1, last_dirty):
+            old = old_regions[j - 1]
+            new = gadgets[j]._region
+            if is_moved[j]:
+                damage |= old | new
+            elif old != new:
+                damage |= old ^ new
+        return damage
+
+    def _get_mouse_index(self) -> _MouseIndex | None:
+        """
+        Return the index of gadget regions or ``None`` if gadgets were added or
+        removed since regions were last computed.
+        """
+        if self._tree_changed or not self._gadgets:
+            return None
+
+        if self._mouse_index is None:
+            self._mouse_index = _MouseIndex(
+                self._gadgets, self._parents, self._subtree_ends, self.height
+            )
+        return self._mouse_index
+
+    def _collides_point(self, gadget: Gadget, point: Point) -> bool | None:
+        """
+        Return whether `point` is in the region of `gadget` or any of its descendents
+        (that is visible or enabled) or ``None`` if unknown.
+        """
+        index = self._get_mouse_index()
+        if index is None:
+            return None
+
+        i = index.positions.get(gadget)
+        if i is None:
+            return None
+
+        if point in gadget._region:
+            return True
+
+        end = index.subtree_ends[i]
+        gadgets = index.gadgets
+        return any(
+            i < j < end and (gadgets[j].is_visible or gadgets[j].is_enabled)
+            for j in index.hits(point)
+        )
+
+    def _mouse_targets(self, gadget: Gadget, mouse_event: MouseEvent) -> list[Gadget]:
+        """
+        Return the children of `gadget` that a mouse event is dispatched to, in reverse
+        painting order.
+
+        Children are skipped if no gadget in their subtree collides with the mouse
+        event, captures the mouse, or doesn't hit-test mouse events. Every gadget in a
+        skipped subtree would ignore the event.
+        """
+        index = self._get_mouse_index()
+        if index is None:
+            return gadget.children[::-1]
+
+        i = index.positions.get(gadget)
+        if i is None or gadget.children != index.children[i]:
+            # Children changed since regions were last computed.
+            return gadget.children[::-1]
+
+        if (
+            self._mouse_paths is None
+            or self._mouse_paths[0] is not mouse_event
+            or self._mouse_paths[1] is not index
+        ):
+            paths = index.paths(mouse_event.pos, self._mouse_captures)
+            self._mouse_paths = mouse_event, index, paths
+        paths = self._mouse_paths[2]
+
+        targets = index.active.get(i, set()) | paths.get(i, set())
+        gadgets = index.gadgets
+        return [gadgets[j] for j in sorted(targets, reverse=True)]
+
     def _render(self):
-        """Render gadget tree into `canvas`."""
-        # TODO: Optimize...
-        # - Recalculating all regions every frame isn't necessary if gadget geometry
-        #   hasn't changed.
-        # - If there *is* a change to geometry, regions that are later in z-order can be
-        #   reused.
-        # - Checking for changes in geometry can be done once every few frames if
-        #   geometry has been static for some time.
-
-        with self._render_lock:
-            self._region = Region.from_rect(self.pos, self.size)
-
-            for child in self.walk():
-                child._region = (
-                    child.parent._region
-                    & Region.from_rect(child.absolute_pos, child.size)
-                    if child.is_enabled and child.is_visible
-                    else Region()
-                )
+        """
+        Render gadget tree into `canvas`.
+
+        The gadget tree isn't locked while rendering. If gadget geometry is changed
+        from another thread during a render, the render is repeated from scratch.
+        After :data:`_RENDER_ATTEMPTS` tries, the last render blocks writers.
+        """
+        if self._profiler is None:
+            stats = None
+        else:
+            stats = self._profiler.begin_frame()
 
-            if self.render_mode == "regions":
-                for child in self.walk_reverse():
-                    if child.is_enabled:
-                        child._region &= self._region
-                        if child.is_visible and not child.is_transparent:
-                            self._region -= child._region
+        invalidated, self._invalidated = self._invalidated, []
+        self.canvas, self._last_canvas = self._last_canvas, self.canvas
 
-            self.canvas, self._last_canvas = self._last_canvas, self.canvas
+        for attempt in range(_RENDER_ATTEMPTS):
+            if attempt == _RENDER_ATTEMPTS - 1:
+                with self._write_lock:
+                    self._render_tree(invalidated, stats)
+                self.locked_renders += 1
+                break
 
+            epoch = self._epoch
+            try:
+                self._render_tree(invalidated, stats)
+            except Exception:
+                # Geometry may have been read mid-change by another thread.
+                if epoch == self._epoch and not epoch & 1:
+                    raise
+            else:
+                if epoch == self._epoch and not epoch & 1:
+                    break
+
+            # Regions may have been computed from inconsistent geometry.
+            self.render_retries += 1
+            self._gadgets = []
+            self._repaint_all = True
+
+        if stats is not None:
+            stats.retries = attempt
+            self._frame_stats = stats
+
+    def _render_tree(
+        self, invalidated: list[tuple[Gadget, Rect | None]], stats: FrameStats | None
+    ):
+        """Update regions and composite gadgets into `canvas`."""
+        if stats is not None:
+            start = perf_counter()
+
+        damage = self._update_regions()
+
+        if stats is not None:
+            regions_end = perf_counter()
+            stats.regions += regions_end - start
+
+        if damage is None or self._repaint_all:
+            self._repaint_all = False
+            self._last_damage = None
             self.canvas[:] = self._cell
+            self._render_regions(
+                [
+                    (gadget, gadget._region)
+                    for gadget in self._gadgets[1:]
+                    if gadget.is_enabled and gadget.is_visible
+                ],
+                stats,
+            )
+        else:
+            self._render_damage(damage, invalidated, stats)
+
+        if stats is not None:
+            stats.render += perf_counter() - regions_end
+
+    def _render_gadget(
+        self, gadget: Gadget, canvas: NDArray[Cell], stats: FrameStats | None
+    ):
+        """Render a gadget into `canvas`, timing it if `stats` is given."""
+        if stats is None:
+            gadget._render(canvas)
+            return
+
+        start = perf_counter()
+        gadget._render(canvas)
+        name = type(gadget).__name__
+        stats.gadgets[name] = stats.gadgets.get(name, 0.0) + perf_counter() - start
+
+    def _render_damage(
+        self,
+        damage: Region,
+        invalidated: list[tuple[Gadget, Rect | None]],
+        stats: FrameStats | None = None,
+    ):
+        """
+        Re-composite only the damaged region of the canvas.
+
+        Cells outside the damaged region are copied from the last render.
+        """
+        for gadget, rect in invalidated:
+            if rect is None:
+                damage |= gadget._region
+            else:
+                y, x = gadget.absolute_pos
+                damage |= gadget._region & Region.from_rect(
+                    Point(y + rect.top, x + rect.left),
+                    Size(rect.bottom - rect.top, rect.right - rect.left),
+                )
+
+        for gadget in self._gadgets[1:]:
+            if not gadget.tracks_damage and gadget._region:
+                damage |= gadget._region
+
+        canvas = self.canvas
+        last_canvas = self._last_canvas
+        last_damage, self._last_damage = self._last_damage, damage
+
+        # `canvas` holds the render before last. Outside of the current damage, it
+        # only differs from the last render within the last damage.
+        if last_damage is None:
+            canvas[:] = last_canvas
+        else:
+            for rect in (last_damage - damage).rects():
+                dst = rect.to_slices()
+                canvas[dst] = last_canvas[dst]
+
+        bbox = damage.bbox
+        if bbox is None:
+            return
+
+        for rect in damage.rects():
+            canvas[rect.to_slices()] = self._cell
+
+        jobs = []
+        for gadget in self._gadgets[1:]:
+            if not (gadget.is_enabled and gadget.is_visible):
+                continue
+
+            region = gadget._region
+            gadget_bbox = region.bbox
+            if (
+                gadget_bbox is None
+                or gadget_bbox.top >= bbox.bottom
+                or bbox.top >= gadget_bbox.bottom
+                or gadget_bbox.left >= bbox.right
+                or bbox.left >= gadget_bbox.right
+            ):
+                continue
+
+            damaged = region & damage
+            if damaged:
+                jobs.append((gadget, damaged))
+
+        self._render_regions(jobs, stats)
+
+    def _render_regions(
+        self, jobs: list[tuple[Gadget, Region]], stats: FrameStats | None
+    ):
+        """
+        Render each gadget within a region into `canvas` in order.
+
+        If :attr:`render_threads` is greater than 1, the canvas is split into
+        horizontal tiles and each tile is rendered on its own thread. Gadgets are
+        rendered into a tile by a shallow copy of the gadget with its region clipped
+        to the tile, so gadgets that compute their region (e.g., animations and
+        parallaxes) are only rendered on a single thread.
+        """
+        h, w = self._size
+        ntiles = min(self.render_threads, h)
+        if ntiles <= 1 or any(hasattr(type(gadget), "_region") for gadget, _ in jobs):
+            canvas = self.canvas
+            for gadget, region in jobs:
+                if region is gadget._region:
+                    self._render_gadget(gadget, canvas, stats)
+                    continue
+
+                old_region, gadget._region = gadget._region, region
+                try:
+                    self._render_gadget(gadget, canvas, stats)
+                finally:
+                    gadget._region = old_region
+            return
+
+        bounds = [h * i // ntiles for i in range(ntiles + 1)]
+        tiles = [[] for _ in range(ntiles)]
+        for gadget, region in jobs:
+            bbox = region.bbox
+            if bbox is None:
+                continue
+            for i, tile in enumerate(tiles):
+                top, bottom = bounds[i], bounds[i + 1]
+                if bbox.top >= bottom or top >= bbox.bottom:
+                    continue
+                tile_region = region & Region.from_rect(
+                    Point(top, 0), Size(bottom - top, w)
+                )
+                if tile_region:
+                    proxy = object.__new__(type(gadget))
+                    proxy.__dict__.update(gadget.__dict__)
+                    proxy._region = tile_region
+                    tile.append(proxy)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.render_threads - 1, thread_name_prefix="batgrl-render"
+            )
+        tile_stats = [None if stats is None else FrameStats(0, 0.0) for _ in tiles]
+        futures = [
+            self._executor.submit(self._render_tile, tile, tile_stats[i])
+            for i, tile in enumerate(tiles[1:], start=1)
+        ]
+        try:
+            self._render_tile(tiles[0], tile_stats[0])
+        finally:
+            for future in futures:
+                future.result()
+
+        if stats is not None:
+            for tile_stat in tile_stats:
+                for name, elapsed in tile_stat.gadgets.items():
+                    stats.gadgets[name] = stats.gadgets.get(name, 0.0) + elapsed
+
+    def _render_tile(self, gadgets: list[Gadget], stats: FrameStats | None):
+        """Render gadgets clipped to a tile into `canvas`."""
+        canvas = self.canvas
+        for gadget in gadgets:
+            self._render_gadget(gadget, canvas, stats)
 
-            for child in self.walk():
-                if child.is_enabled and child.is_visible:
-                    child._render(self.canvas)
+    def _stop_render_threads(self):
+        """Shut down threads compositing tiles."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
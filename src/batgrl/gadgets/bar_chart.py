@@ -149,6 +149,12 @@ class BarChart(Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -168,6 +174,8 @@ class BarChart(Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -323,6 +331,7 @@ class BarChart(Gadget):
                 fg_color=self.chart_fg_color,
                 bg_color=self.chart_bg_color,
             )
+            self._y_label_gadget.invalidate()
 
         sv_left = has_y_label + TICK_WIDTH
         sv_width = w - sv_left
@@ -386,6 +395,8 @@ class BarChart(Gadget):
             fg_colors[2 : 2 + len(smooth_bar), x1:x2] = bar_colors[i]
         chars[1, :-1] = "─"
         chars[1, -1] = "┐"
+        self._bars.invalidate()
+        self._y_ticks.invalidate()
 
     def on_size(self):
         """Rebuild bar chart."""
@@ -33,6 +33,9 @@ class ButtonBehavior:
         Whether a mouse up event outside the button will trigger it.
     button_state : ButtonState
         Current button state.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with gadget. A
+        hovered or pressed button captures the mouse until it returns to normal.
 
     Methods
     -------
@@ -48,6 +51,12 @@ class ButtonBehavior:
         Paint the disallowed state.
     """
 
+    hit_test_mouse: bool = True
+    """
+    Whether mouse handlers ignore mouse events that don't collide with gadget. A
+    hovered or pressed button captures the mouse until it returns to normal.
+    """
+
     def __init__(self, *, always_release: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.always_release = always_release
@@ -70,14 +79,32 @@ class ButtonBehavior:
             button_state = "normal"
 
         self._button_state = button_state
-        if self.root:
+        if root := self.root:
+            self._update_mouse_capture(root)
             dispatch[button_state]()
 
+    def _update_mouse_capture(self, root):
+        """
+        Capture the mouse while hovered or pressed to see mouse events that leave the
+        button.
+        """
+        if self._button_state == "hover" or self._button_state == "down":
+            root._mouse_captures.add(self)
+        else:
+            root._mouse_captures.discard(self)
+
     def on_add(self):
         """Paint normal state on add."""
         super().on_add()
+        self._update_mouse_capture(self.root)
         self.update_normal()
 
+    def on_remove(self):
+        """Release mouse capture on remove."""
+        if root := self.root:
+            root._mouse_captures.discard(self)
+        super().on_remove()
+
     def on_mouse(self, mouse_event) -> bool | None:
         """Determine button state from mouse event."""
         if self.button_state == "disallowed":
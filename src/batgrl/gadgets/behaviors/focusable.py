@@ -1,6 +1,5 @@
 """Focus behavior for a gadget."""
 
-from collections import deque
 from weakref import ReferenceType, WeakSet, ref
 
 __all__ = ["Focusable"]
@@ -42,26 +41,62 @@ class Focusable:
         Update gadget when it loses focus.
     """
 
-    __focusables: deque[ReferenceType] = deque()
-    """Focusables that are part of the gadget-tree."""
+    __next: dict[ReferenceType, ReferenceType] = {}
+    """Next focusable in focus order for each focusable in the gadget-tree."""
+    __previous: dict[ReferenceType, ReferenceType] = {}
+    """Previous focusable in focus order for each focusable in the gadget-tree."""
+    __current: ReferenceType | None = None
+    """
+    Last focused focusable (or the focusable after it if it was removed). Focusables
+    added to the gadget-tree are placed before it in focus order.
+    """
+    __node: ReferenceType | None = None
+    """Reference to focusable in focus order."""
     __focused: WeakSet = WeakSet()
     """Focused focusables."""
     any_focused: bool = AnyFocusedProperty()
     """Whether any gadget has focus."""
 
+    @staticmethod
+    def __insert(node: ReferenceType):
+        """Add a focusable to the focus order before the current focusable."""
+        current = Focusable.__current
+        if current is None:
+            Focusable.__next[node] = Focusable.__previous[node] = node
+            Focusable.__current = node
+        else:
+            last = Focusable.__previous[current]
+            Focusable.__next[last] = Focusable.__previous[current] = node
+            Focusable.__next[node] = current
+            Focusable.__previous[node] = last
+
+    @staticmethod
+    def __remove(node: ReferenceType):
+        """Remove a focusable from the focus order."""
+        next_ = Focusable.__next.pop(node)
+        previous = Focusable.__previous.pop(node)
+        if next_ is node:
+            Focusable.__current = None
+        else:
+            Focusable.__next[previous] = next_
+            Focusable.__previous[next_] = previous
+            if Focusable.__current is node:
+                Focusable.__current = next_
+
     @classmethod
     def _focus(cls, step: int):
-        focusables = cls.__focusables
+        order = Focusable.__next if step < 0 else Focusable.__previous
 
-        if cls.any_focused:
-            focusables.rotate(step)
+        if cls.any_focused and Focusable.__current is not None:
+            Focusable.__current = order[Focusable.__current]
 
-        for _ in range(len(focusables)):
-            gadget = focusables[0]()
+        for _ in range(len(order)):
+            node = Focusable.__current
+            gadget = node()
             if gadget is None:
-                focusables.popleft()
+                Focusable.__remove(node)
             elif not gadget.is_visible or not gadget.is_enabled:
-                focusables.rotate(step)
+                Focusable.__current = order[node]
             else:
                 gadget.focus()
                 break
@@ -86,9 +121,12 @@ class Focusable:
         if not self.is_enabled:
             return
 
-        ancestors = WeakSet(
-            ancestor for ancestor in self.ancestors() if isinstance(ancestor, Focusable)
-        )
+        ancestors = WeakSet()
+        ancestor = self.parent
+        while ancestor is not None:
+            if isinstance(ancestor, Focusable):
+                ancestors.add(ancestor)
+            ancestor = ancestor.parent
         ancestors.add(self)
 
         focused = Focusable.__focused
@@ -100,12 +138,8 @@ class Focusable:
         for needs_focus in ancestors - focused:
             needs_focus.on_focus()
 
-        focus_gadgets = Focusable.__focusables
-        while (gadget := focus_gadgets[0]()) is not self:
-            if gadget is None:
-                focus_gadgets.popleft()
-            else:
-                focus_gadgets.rotate(-1)
+        if self.__node in Focusable.__next:
+            Focusable.__current = self.__node
 
     def blur(self):
         """Un-focus gadget."""
@@ -127,13 +161,14 @@ class Focusable:
     def on_add(self):
         """Add to focusable gadgets and focus on add."""
         super().on_add()
-        Focusable.__focusables.append(ref(self))
+        self.__node = ref(self)
+        Focusable.__insert(self.__node)
         self.focus()
 
     def on_remove(self):
         """Remove from focusable gadgets and blur on remove."""
         self.blur()
-        Focusable.__focusables.remove(ref(self))
+        Focusable.__remove(self.__node)
         super().on_remove()
 
     def dispatch_key(self, key_event) -> bool | None:
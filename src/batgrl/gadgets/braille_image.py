@@ -95,6 +95,12 @@ class BrailleImage(Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -112,6 +118,8 @@ class BrailleImage(Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -254,3 +262,4 @@ class BrailleImage(Gadget):
         background = rgb_sectioned.copy()
         background[where_dots] = 0
         canvas["bg_color"] = background.sum(axis=(2, 3)) / ndots_neg[..., None]
+        self._image.invalidate()
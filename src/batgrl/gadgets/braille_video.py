@@ -131,6 +131,12 @@ class BrailleVideo(Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -156,6 +162,8 @@ class BrailleVideo(Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -265,6 +273,7 @@ class BrailleVideo(Gadget):
     def bg_color(self, bg_color: Color):
         self._video.default_bg_color = bg_color
         self._video.canvas["bg_color"] = bg_color
+        self._video.invalidate()
 
     @property
     def source(self) -> Path | str | int:
@@ -326,6 +335,7 @@ class BrailleVideo(Gadget):
             canvas["fg_color"] = shades.astype(np.uint8)
         else:
             canvas["fg_color"] = self.fg_color
+        self._video.invalidate()
 
     def _time_delta(self) -> float:
         return time.monotonic() - self._resource.get(cv2.CAP_PROP_POS_MSEC) / 1000
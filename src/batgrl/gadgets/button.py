@@ -104,6 +104,12 @@ class Button(Themable, ButtonBehavior, Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -133,6 +139,8 @@ class Button(Themable, ButtonBehavior, Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -241,21 +249,25 @@ class Button(Themable, ButtonBehavior, Gadget):
         """Paint the normal state."""
         self._pane.bg_color = self.color_theme.button_normal.bg
         self._label.canvas["fg_color"] = self.color_theme.button_normal.fg
+        self._label.invalidate()
 
     def update_hover(self):
         """Paint the hover state."""
         self._pane.bg_color = self.color_theme.button_hover.bg
         self._label.canvas["fg_color"] = self.color_theme.button_hover.fg
+        self._label.invalidate()
 
     def update_down(self):
         """Paint the down state."""
         self._pane.bg_color = self.color_theme.button_press.bg
         self._label.canvas["fg_color"] = self.color_theme.button_press.fg
+        self._label.invalidate()
 
     def update_disallowed(self):
         """Paint the disallowd state."""
         self._pane.bg_color = self.color_theme.button_disallowed.bg
         self._label.canvas["fg_color"] = self.color_theme.button_disallowed.fg
+        self._label.invalidate()
 
     def on_release(self):
         """Triggered when button is released."""
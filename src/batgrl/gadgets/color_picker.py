@@ -135,6 +135,7 @@ class _HueSelector(Grabbable, Graphics):
     def update_hue(self):
         x = self._hue_indicator.x
         self._hue_indicator.canvas["bg_color"] = self.texture[0, x, :3]
+        self._hue_indicator.invalidate()
         self.shade_selector.update_hue(AColor(*self.texture[0, x]))
 
     def grab(self, mouse_event):
@@ -221,6 +222,12 @@ class ColorPicker(Themable, Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -240,6 +247,8 @@ class ColorPicker(Themable, Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -368,3 +377,4 @@ class ColorPicker(Themable, Gadget):
         self._container.bg_color = primary.bg
         self.label.default_fg_color = self.label.canvas["fg_color"] = primary.fg
         self.label.default_bg_color = self.label.canvas["bg_color"] = primary.bg
+        self.label.invalidate()
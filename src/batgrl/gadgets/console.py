@@ -347,6 +347,12 @@ class Console(Themable, Focusable, Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -378,6 +384,8 @@ class Console(Themable, Focusable, Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -579,6 +587,7 @@ class Console(Themable, Focusable, Gadget):
         self._prompt.default_bg_color = self._prompt.canvas["bg_color"] = primary.bg
         self._output.default_fg_color = self._output.canvas["fg_color"] = primary.fg
         self._output.default_bg_color = self._output.canvas["bg_color"] = primary.bg
+        self._output.invalidate()
         self._input._box.canvas["fg_color"] = primary.fg
         self._input._box.default_fg_color = primary.fg
         self._input._box.canvas["bg_color"] = primary.bg
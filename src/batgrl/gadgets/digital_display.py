@@ -129,6 +129,7 @@ class _Segment:
     def __set__(self, instance, value):
         fg = instance._display.canvas["fg_color"]
         fg[self.slice] = instance.on_color if value else instance.off_color
+        instance._display.invalidate()
 
 
 class DigitalDisplay(Gadget):
@@ -256,6 +257,12 @@ class DigitalDisplay(Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -287,6 +294,8 @@ class DigitalDisplay(Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -413,6 +422,7 @@ class DigitalDisplay(Gadget):
         mask = np.all(fg_color == self.off_color, axis=-1)
         fg_color[mask] = off_color
         self._off_color = off_color
+        self._display.invalidate()
 
     @property
     def on_color(self) -> Color:
@@ -425,6 +435,7 @@ class DigitalDisplay(Gadget):
         mask = np.all(fg_color == self.on_color, axis=-1)
         fg_color[mask] = on_color
         self._on_color = on_color
+        self._display.invalidate()
 
     @property
     def bg_color(self) -> Color:
@@ -435,6 +446,7 @@ class DigitalDisplay(Gadget):
     def bg_color(self, bg_color: Color):
         self._display.canvas["bg_color"] = bg_color
         self._bg_color = bg_color
+        self._display.invalidate()
 
     def show_char(self, char: str):
         """
@@ -449,6 +461,7 @@ class DigitalDisplay(Gadget):
             raise ValueError(f"{char} is not an ascii character")
 
         self._display.canvas["fg_color"] = self.off_color
+        self._display.invalidate()
 
         for segment in _CHAR_TO_SEGMENTS[char]:
             setattr(self, segment, True)
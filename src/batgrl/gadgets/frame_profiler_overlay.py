@@ -0,0 +1,278 @@
+"""A gadget that shows the timings of recent frames."""
+
+import asyncio
+
+from numpy.typing import NDArray
+
+from ..profiling import FrameProfiler
+from .gadget import Cell, Point, PosHint, PosHintDict, Size
+from .text import Text
+
+__all__ = ["FrameProfilerOverlay", "Point", "Size"]
+
+_STAGES = ("regions", "render", "diff", "encode", "flush")
+"""Pipeline stages shown in the overlay."""
+
+
+class FrameProfilerOverlay(Text):
+    r"""
+    A gadget that shows the timings of recent frames.
+
+    Shows the frame rate and the mean time spent computing regions, compositing,
+    diffing, encoding, and flushing each frame along with bytes written per frame and
+    the slowest gadget classes. Stats are averaged over the frames rendered since the
+    last update. The app must be run with ``profile_frames=True``.
+
+    The gadget is resized to fit the stats.
+
+    Parameters
+    ----------
+    update_interval : float, default: 0.5
+        Duration in seconds between updates.
+    max_gadgets : int, default: 5
+        Max number of gadget classes shown.
+    default_cell : NDArray[Cell] | str, default: " "
+        Default cell of text canvas.
+    alpha : float, default: 0.0
+        Transparency of gadget.
+    pos : Point, default: Point(0, 0)
+        Position of upper-left corner in parent.
+    pos_hint : PosHint | PosHintDict | None , default: None
+        Position as a proportion of parent's height and width.
+    is_transparent : bool, default: False
+        Whether gadget is transparent.
+    is_visible : bool, default: True
+        Whether gadget is visible. Gadget will still receive input events if not
+        visible.
+    is_enabled : bool, default: True
+        Whether gadget is enabled. A disabled gadget is not painted and doesn't receive
+        input events.
+
+    Attributes
+    ----------
+    update_interval : float
+        Duration in seconds between updates.
+    max_gadgets : int
+        Max number of gadget classes shown.
+    canvas : NDArray[Cell]
+        The array of characters for the gadget.
+    default_cell : NDArray[Cell]
+        Default cell of text canvas.
+    default_fg_color : Color
+        Foreground color of default cell.
+    default_bg_color : Color
+        Background color of default cell.
+    alpha : float
+        Transparency of gadget.
+    size : Size
+        Size of gadget.
+    height : int
+        Height of gadget.
+    rows : int
+        Alias for :attr:`height`.
+    width : int
+        Width of gadget.
+    columns : int
+        Alias for :attr:`width`.
+    pos : Point
+        Position of upper-left corner.
+    top : int
+        Y-coordinate of top of gadget.
+    y : int
+        Y-coordinate of top of gadget.
+    left : int
+        X-coordinate of left side of gadget.
+    x : int
+        X-coordinate of left side of gadget.
+    bottom : int
+        Y-coordinate of bottom of gadget.
+    right : int
+        X-coordinate of right side of gadget.
+    center : Point
+        Position of center of gadget.
+    absolute_pos : Point
+        Absolute position on screen.
+    size_hint : SizeHint
+        Size as a proportion of parent's height and width.
+    pos_hint : PosHint
+        Position as a proportion of parent's height and width.
+    parent: Gadget | None
+        Parent gadget.
+    children : list[Gadget]
+        Children gadgets.
+    is_transparent : bool
+        Whether gadget is transparent.
+    is_visible : bool
+        Whether gadget is visible.
+    is_enabled : bool
+        Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
+    root : Gadget | None
+        If gadget is in gadget tree, return the root gadget.
+    app : App
+        The running app.
+
+    Methods
+    -------
+    update_stats()
+        Show stats of frames rendered since the last update.
+    add_border(style="light", ...)
+        Add a border to the gadget.
+    add_syntax_highlighting(lexer, style)
+        Add syntax highlighting to current text in canvas.
+    add_str(str, pos, ...)
+        Add a single line of text to the canvas.
+    set_text(text, ...)
+        Resize gadget to fit text, erase canvas, then fill canvas with text.
+    clear()
+        Fill canvas with default cell.
+    shift(n=1)
+        Shift content in canvas up (or down in case of negative `n`).
+    on_size()
+        Update gadget after a resize.
+    apply_hints()
+        Apply size and pos hints.
+    to_local(point)
+        Convert point in absolute coordinates to local coordinates.
+    collides_point(point)
+        Return true if point collides with visible portion of gadget.
+    collides_gadget(other)
+        Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
+    add_gadget(gadget)
+        Add a child gadget.
+    add_gadgets(\*gadgets)
+        Add multiple child gadgets.
+    remove_gadget(gadget)
+        Remove a child gadget.
+    pull_to_front()
+        Move to end of gadget stack so gadget is drawn last.
+    walk_from_root()
+        Yield all descendents of the root gadget (preorder traversal).
+    walk()
+        Yield all descendents of this gadget (preorder traversal).
+    walk_reverse()
+        Yield all descendents of this gadget (reverse postorder traversal).
+    ancestors()
+        Yield all ancestors of this gadget.
+    bind(prop, callback)
+        Bind `callback` to a gadget property.
+    unbind(uid)
+        Unbind a callback from a gadget property.
+    on_key(key_event)
+        Handle a key press event.
+    on_mouse(mouse_event)
+        Handle a mouse event.
+    on_paste(paste_event)
+        Handle a paste event.
+    on_terminal_focus(focus_event)
+        Handle a focus event.
+    tween(...)
+        Sequentially update gadget properties over time.
+    on_add()
+        Apply size hints and call children's `on_add`.
+    on_remove()
+        Call children's `on_remove`.
+    prolicide()
+        Recursively remove all children.
+    destroy()
+        Remove this gadget and recursively remove all its children.
+    """
+
+    def __init__(
+        self,
+        *,
+        update_interval: float = 0.5,
+        max_gadgets: int = 5,
+        default_cell: NDArray[Cell] | str = " ",
+        alpha: float = 0.0,
+        pos: Point = Point(0, 0),
+        pos_hint: PosHint | PosHintDict | None = None,
+        is_transparent: bool = False,
+        is_visible: bool = True,
+        is_enabled: bool = True,
+    ):
+        super().__init__(
+            default_cell=default_cell,
+            alpha=alpha,
+            pos=pos,
+            pos_hint=pos_hint,
+            is_transparent=is_transparent,
+            is_visible=is_visible,
+            is_enabled=is_enabled,
+        )
+        self.update_interval = update_interval
+        """Duration in seconds between updates."""
+        self.max_gadgets = max_gadgets
+        """Max number of gadget classes shown."""
+        self._last_frame: int = -1
+        """Index of the last frame shown."""
+        self._update_task: asyncio.Task | None = None
+        """Task that periodically updates stats."""
+
+    def on_add(self):
+        """Start updating stats."""
+        super().on_add()
+        self._update_task = asyncio.create_task(self._update_periodically())
+
+    def on_remove(self):
+        """Stop updating stats."""
+        super().on_remove()
+        if self._update_task is not None:
+            self._update_task.cancel()
+            self._update_task = None
+
+    async def _update_periodically(self):
+        while True:
+            self.update_stats()
+            await asyncio.sleep(self.update_interval)
+
+    def update_stats(self):
+        """Show stats of frames rendered since the last update."""
+        profiler: FrameProfiler | None = self.root and self.root.app.profiler
+        if profiler is None:
+            self.set_text(
+                "Frame profiling disabled.\nRun app with profile_frames=True."
+            )
+            return
+
+        frames = [
+            stats for stats in profiler.recent() if stats.frame > self._last_frame
+        ]
+        if not frames:
+            return
+
+        # Frames written on another thread may be recorded out of order.
+        self._last_frame = max(stats.frame for stats in frames)
+        n = len(frames)
+        starts = [stats.start for stats in frames]
+        duration = max(starts) - min(starts)
+        fps = (n - 1) / duration if duration > 0 else 0.0
+
+        def mean(metric: str) -> float:
+            return sum(getattr(stats, metric) for stats in frames) / n
+
+        rows = [("fps", f"{fps:.1f}")]
+        rows.extend(
+            (stage, f"{mean(stage) * 1000:.2f} ms") for stage in ("latency", *_STAGES)
+        )
+        rows.append(("bytes", f"{mean('bytes_written'):.0f}"))
+        rows.append(("dropped", f"{sum(stats.dropped for stats in frames)}"))
+        rows.append(("retries", f"{sum(stats.retries for stats in frames)}"))
+        gadget_totals = {}
+        for stats in frames:
+            for name, elapsed in stats.gadgets.items():
+                gadget_totals[name] = gadget_totals.get(name, 0.0) + elapsed
+        gadget_times = sorted(gadget_totals.items(), key=lambda item: -item[1])
+        rows.extend(
+            (name, f"{total / n * 1000:.2f} ms")
+            for name, total in gadget_times[: self.max_gadgets]
+        )
+        lines = [f"{label[:14]:<14}{value:>11}" for label, value in rows]
+        self.set_text("\n".join(lines))
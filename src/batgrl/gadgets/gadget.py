@@ -6,7 +6,6 @@ from dataclasses import asdict, dataclass
 from functools import wraps
 from itertools import count
 from numbers import Real
-from time import monotonic
 from typing import Coroutine, Literal, Self, TypedDict
 from weakref import WeakKeyDictionary
 
@@ -14,7 +13,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from ..easings import EASINGS, Easing
-from ..geometry import Point, Region, Size, clamp, lerp, round_down
+from ..geometry import Point, Rect, Region, Size, clamp, lerp, round_down
 from ..terminal.events import FocusEvent, KeyEvent, MouseEvent, PasteEvent
 from ..text_tools import Cell, new_cell
 
@@ -355,6 +354,17 @@ class Gadget:
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`. Gadgets that don't track damage are repainted every frame
+        if the app's damage tracking is enabled. Subclasses of gadgets that define
+        their own rendering don't inherit this and must set it themselves.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the gadget
+        or its descendents. Subtrees of gadgets that hit-test mouse events are skipped
+        when dispatching a mouse event that doesn't collide with them. Gadgets that
+        override :meth:`on_mouse` or :meth:`dispatch_mouse` receive every mouse event
+        unless they opt in.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -372,6 +382,8 @@ class Gadget:
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -415,6 +427,30 @@ class Gadget:
     __bindings: dict[int, str] = {}
     """UID to property name mapping."""
 
+    tracks_damage: bool = True
+    """Whether all changes to gadget's appearance are reported with `invalidate()`."""
+
+    hit_test_mouse: bool = True
+    """Whether mouse handlers ignore mouse events that don't collide with gadget."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "tracks_damage" not in cls.__dict__ and any(
+            "_render" in base.__dict__ for base in cls.__mro__ if base is not Gadget
+        ):
+            # A gadget with its own rendering, or a subclass of one (which may
+            # write to its base's buffers), may change without calling
+            # `invalidate()`, so it is repainted every frame unless it opts in.
+            cls.tracks_damage = False
+        if "hit_test_mouse" not in cls.__dict__ and not all(
+            base.__dict__.get("hit_test_mouse", False)
+            for base in cls.__mro__
+            if "on_mouse" in base.__dict__ or "dispatch_mouse" in base.__dict__
+        ):
+            # A mouse handler (possibly from a mixin) may handle mouse events outside
+            # of the gadget, so it receives every mouse event unless it opts in.
+            cls.hit_test_mouse = False
+
     def __init__(
         self,
         *,
@@ -474,18 +510,23 @@ class Gadget:
         h, w = size
         size = Size(clamp(int(h), 0, None), clamp(int(w), 0, None))
 
-        if self.root:
-            self.root._render_lock.acquire()
+        root = self.root
+        if root is not None:
+            root._begin_write()
 
-        self._size = size
-        self._apply_pos_hints()
-        self.on_size()
+        try:
+            self._size = size
+            self._apply_pos_hints()
+            self.on_size()
 
-        for child in self.children:
-            child.apply_hints()
+            for child in self.children:
+                child.apply_hints()
+        finally:
+            if root is not None:
+                root._end_write()
 
-        if self.root:
-            self.root._render_lock.release()
+        if root is not None:
+            root._request_render()
 
     @property
     def height(self) -> int:
@@ -520,11 +561,16 @@ class Gadget:
         y, x = pos
         pos = Point(int(y), int(x))
 
-        if self.root is None:
+        root = self.root
+        if root is None:
             self._pos = pos
         else:
-            with self.root._render_lock:
+            root._begin_write()
+            try:
                 self._pos = pos
+            finally:
+                root._end_write()
+            root._request_render()
 
     @property
     def top(self) -> int:
@@ -741,6 +787,11 @@ class Gadget:
         if not self.is_visible or not self.is_enabled:
             return False
 
+        if (root := self.root) is not None:
+            collides = root._collides_point(self, point)
+            if collides is not None:
+                return collides
+
         return point in self._region or any(
             point in child._region
             for child in self.walk()
@@ -776,6 +827,23 @@ class Gadget:
             or other_left >= self_right
         )
 
+    def invalidate(self, rect: Rect | None = None):
+        """
+        Mark gadget (or a rect of gadget) as needing to be repainted.
+
+        Only needed if the app's damage tracking is enabled or if the app renders on
+        demand. Changes to a gadget's geometry are detected automatically.
+
+        Parameters
+        ----------
+        rect : Rect | None, default: None
+            Rect in local coordinates to repaint. If not given, the whole gadget is
+            repainted.
+        """
+        if root := self.root:
+            root._invalidated.append((self, rect))
+            root._request_render()
+
     def add_gadget(self, gadget: Self):
         """
         Add a child gadget.
@@ -788,7 +856,8 @@ class Gadget:
         self.children.append(gadget)
         gadget.parent = self
 
-        if self.root is not None:
+        if (root := self.root) is not None:
+            root._tree_changed = True
             gadget.on_add()
 
     def add_gadgets(self, *gadgets: Self):
@@ -816,7 +885,8 @@ class Gadget:
         gadget : Gadget
             The gadget to remove from children.
         """
-        if self.root is not None:
+        if (root := self.root) is not None:
+            root._tree_changed = True
             gadget.on_remove()
 
         self.children.remove(gadget)
@@ -944,7 +1014,9 @@ class Gadget:
         """
         Dispatch a mouse event until handled.
 
-        A mouse event is handled if a handler returns ``True``.
+        A mouse event is handled if a handler returns ``True``. Children that
+        :attr:`hit_test_mouse` (and all their descendents) are skipped if the mouse
+        event doesn't collide with them.
 
         Parameters
         ----------
@@ -956,9 +1028,13 @@ class Gadget:
         bool | None
             Whether the dispatch was handled.
         """
+        if (root := self.root) is None:
+            children = reversed(self.children)
+        else:
+            children = root._mouse_targets(self, mouse_event)
         return any(
             gadget.dispatch_mouse(mouse_event)
-            for gadget in reversed(self.children)
+            for gadget in children
             if gadget.is_enabled
         ) or self.on_mouse(mouse_event)
 
@@ -1173,7 +1249,8 @@ class Gadget:
         Running several tweens on the same properties concurrently will probably result
         in unexpected behavior.
         """
-        end_time = monotonic() + duration
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + duration
         start_values = tuple(
             asdict(getattr(self, attr))
             if isinstance(getattr(self, attr), (PosHint, SizeHint))
@@ -1195,7 +1272,7 @@ class Gadget:
         if on_start is not None:
             on_start()
 
-        while (current_time := monotonic()) < end_time:
+        while (current_time := loop.time()) < end_time:
             p = easing_function(1 - (end_time - current_time) / duration)
 
             for start_value, (prop, target) in zip(start_values, properties.items()):
@@ -1204,10 +1281,12 @@ class Gadget:
             if on_progress is not None:
                 on_progress(p)
 
+            self.invalidate()
             await asyncio.sleep(0)
 
         for prop, target in properties.items():
             setattr(self, prop, target)
+        self.invalidate()
 
         if on_complete is not None:
             on_complete()
@@ -33,6 +33,9 @@ class Graphics(Gadget):
     :attr:`texture`. Note that the height of :attr:`texture` is twice the height of the
     gadget.
 
+    Graphic gadgets track damage: changes made by writing to :attr:`texture` directly
+    must be reported with :meth:`invalidate`.
+
     Parameters
     ----------
     default_color : AColor, default: AColor(0, 0, 0, 0)
@@ -110,6 +113,12 @@ class Graphics(Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -131,6 +140,8 @@ class Graphics(Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -171,6 +182,8 @@ class Graphics(Gadget):
         Remove this gadget and recursively remove all its children.
     """
 
+    tracks_damage = True
+
     def __init__(
         self,
         *,
@@ -211,6 +224,7 @@ class Graphics(Gadget):
     @bindable
     def alpha(self, alpha: float):
         self._alpha = clamp(float(alpha), 0.0, 1.0)
+        self.invalidate()
 
     def on_size(self):
         """Resize texture array."""
@@ -265,3 +279,4 @@ class Graphics(Gadget):
     def clear(self):
         """Fill texture with default color."""
         self.texture[:] = self.default_color
+        self.invalidate()
@@ -205,6 +205,12 @@ class LinePlot(Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -222,6 +228,8 @@ class LinePlot(Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -413,6 +421,7 @@ class LinePlot(Gadget):
             if isinstance(child, Text):
                 child.canvas["fg_color"] = plot_fg_color
                 child.default_fg_color = plot_fg_color
+                child.invalidate()
             elif isinstance(child, Pane):
                 child.fg_color = plot_fg_color
 
@@ -431,6 +440,7 @@ class LinePlot(Gadget):
             if isinstance(child, Text):
                 child.canvas["bg_color"] = plot_bg_color
                 child.default_bg_color = plot_bg_color
+                child.invalidate()
             elif isinstance(child, Pane):
                 child.bg_color = plot_bg_color
 
@@ -472,6 +482,7 @@ class LinePlot(Gadget):
         if y_label is not None:
             self._y_label_gadget.size = str_width(y_label), 1
             add_text(self._y_label_gadget.canvas[:, 0], y_label)
+            self._y_label_gadget.invalidate()
 
         self._build_plot()
 
@@ -565,6 +576,7 @@ class LinePlot(Gadget):
                 where_boxes = boxes != " "
                 chars_view[where_boxes] = boxes[where_boxes]
                 colors_view[where_boxes] = color
+        self._traces.invalidate()
 
         # Regenerate Ticks
         self._y_ticks.size = self._traces.height, TICK_WIDTH
@@ -600,6 +612,8 @@ class LinePlot(Gadget):
                 pos=(1, column),
             )
         self._x_ticks.canvas["char"][0, plot_right - 1] = "┐"
+        self._x_ticks.invalidate()
+        self._y_ticks.invalidate()
 
     def on_size(self):
         """Rebuild plot on resize."""
@@ -201,6 +201,7 @@ class _Link(_HasTitle, ButtonBehavior, Gadget):
         for text, underline, mask in self.texts:
             text.canvas[["fg_color", "bg_color"]][mask] = link
             text.canvas["underline"] = underline
+            text.invalidate()
         for graphic in self.graphics:
             graphic.outline.is_enabled = False
 
@@ -209,6 +210,7 @@ class _Link(_HasTitle, ButtonBehavior, Gadget):
         for text, _, mask in self.texts:
             text.canvas[["fg_color", "bg_color"]][mask] = hover
             text.canvas["underline"] = True
+            text.invalidate()
         for graphic in self.graphics:
             graphic.outline.is_enabled = True
 
@@ -273,6 +275,8 @@ class _List(GridLayout):
 
 
 class _Quote(Pane):
+    tracks_damage = True
+
     def __init__(self, content: Gadget, depth):
         super().__init__()
         quote_colors = Themable.color_theme.markdown_quote
@@ -766,6 +770,12 @@ class Markdown(Themable, Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -785,6 +795,8 @@ class Markdown(Themable, Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -898,6 +910,7 @@ class Markdown(Themable, Gadget):
         self._link_hint.content.default_cell = title_cell
         self._link_hint.canvas[:] = title_cell
         self._link_hint.content.canvas[:] = title_cell
+        self._link_hint.content.invalidate()
         self._build_markdown()
 
     def on_size(self):
@@ -73,6 +73,8 @@ class _MenuItem(Themable, ToggleButtonBehavior, Pane):
         self.bg_color = color_pair.bg
         self.left_label.canvas[["fg_color", "bg_color"]] = color_pair
         self.right_label.canvas[["fg_color", "bg_color"]] = color_pair
+        self.left_label.invalidate()
+        self.right_label.invalidate()
 
     @property
     def alpha(self) -> float:
@@ -137,11 +139,13 @@ class _MenuItem(Themable, ToggleButtonBehavior, Pane):
         """Paint the off state."""
         if self.item_callback is not None and nargs(self.item_callback) == 1:
             self.left_label.canvas["char"][0, 1] = CHECK_OFF
+            self.left_label.invalidate()
 
     def update_on(self):
         """Paint the on state."""
         if self.item_callback is not None and nargs(self.item_callback) == 1:
             self.left_label.canvas["char"][0, 1] = CHECK_ON
+            self.left_label.invalidate()
 
     def on_mouse(self, mouse_event):
         """Save last mouse position."""
@@ -291,6 +295,12 @@ class Menu(GridLayout):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -317,6 +327,8 @@ class Menu(GridLayout):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -818,6 +830,12 @@ class MenuBar(GridLayout):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -844,6 +862,8 @@ class MenuBar(GridLayout):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
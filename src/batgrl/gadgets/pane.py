@@ -95,6 +95,12 @@ class Pane(Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -112,6 +118,8 @@ class Pane(Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -152,6 +160,8 @@ class Pane(Gadget):
         Remove this gadget and recursively remove all its children.
     """
 
+    tracks_damage = True
+
     def __init__(
         self,
         *,
@@ -174,10 +184,19 @@ class Pane(Gadget):
             is_visible=is_visible,
             is_enabled=is_enabled,
         )
-        self.bg_color: Color = bg_color
-        """Background color of gadget."""
+        self.bg_color = bg_color
         self.alpha = alpha
 
+    @property
+    def bg_color(self) -> Color:
+        """Background color of gadget."""
+        return self._bg_color
+
+    @bg_color.setter
+    def bg_color(self, bg_color: Color):
+        self._bg_color = bg_color
+        self.invalidate()
+
     @property
     def alpha(self) -> float:
         """Transparency of gadget."""
@@ -187,6 +206,7 @@ class Pane(Gadget):
     @bindable
     def alpha(self, alpha: float):
         self._alpha = clamp(float(alpha), 0.0, 1.0)
+        self.invalidate()
 
     def _render(self, canvas: NDArray[Cell]):
         """Render visible region of gadget."""
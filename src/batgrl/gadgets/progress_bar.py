@@ -101,6 +101,12 @@ class ProgressBar(Themable, Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -120,6 +126,8 @@ class ProgressBar(Themable, Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -240,6 +248,7 @@ class ProgressBar(Themable, Gadget):
         if offset != 0:
             canvas["fg_color"][:, x] = self.color_theme.progress_bar.bg
             canvas["bg_color"][:, x] = self.color_theme.progress_bar.fg
+        self._bar.invalidate()
 
     def _paint_small_vertical_bar(self, progress):
         bar_height = max(1, (self.height - 1) // 2)
@@ -254,6 +263,7 @@ class ProgressBar(Themable, Gadget):
         if offset != 0:
             canvas["fg_color"][::-1][y] = self.color_theme.progress_bar.bg
             canvas["bg_color"][::-1][y] = self.color_theme.progress_bar.fg
+        self._bar.invalidate()
 
     async def _loading_animation(self):
         if (
@@ -265,6 +275,7 @@ class ProgressBar(Themable, Gadget):
             return
 
         self._bar.canvas["char"] = " "
+        self._bar.invalidate()
 
         if self._is_horizontal:
             steps = 8 * self.width
@@ -295,6 +306,7 @@ class ProgressBar(Themable, Gadget):
     def update_theme(self):
         """Paint the gadget with current theme."""
         self._bar.canvas[["fg_color", "bg_color"]] = self.color_theme.progress_bar
+        self._bar.invalidate()
         self.default_fg_color = self.color_theme.progress_bar.fg
         self.default_bg_color = self.color_theme.progress_bar.bg
 
@@ -308,3 +320,4 @@ class ProgressBar(Themable, Gadget):
         else:
             smooth_bar = smooth_vertical_bar(self.height, self.progress)
             canvas["char"][::-1][: len(smooth_bar)].T[:] = smooth_bar
+        self._bar.invalidate()
@@ -144,6 +144,12 @@ class Slider(Grabbable, Pane):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -167,6 +173,8 @@ class Slider(Grabbable, Pane):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -207,6 +215,8 @@ class Slider(Grabbable, Pane):
         Remove this gadget and recursively remove all its children.
     """
 
+    tracks_damage = True
+
     def __init__(
         self,
         *,
@@ -303,6 +313,7 @@ class Slider(Grabbable, Pane):
     def handle_color(self, handle_color: Color | str):
         self._handle.default_fg_color = handle_color
         self._handle.canvas["fg_color"] = handle_color
+        self._handle.invalidate()
 
     @property
     def slider_color(self) -> Color:
@@ -313,6 +324,7 @@ class Slider(Grabbable, Pane):
     def slider_color(self, slider_color: Color | str):
         self._slider.default_fg_color = slider_color
         self._slider.canvas["fg_color"][:, self._handle.x :] = slider_color
+        self._slider.invalidate()
 
     @property
     def fill_color(self) -> Color:
@@ -323,6 +335,7 @@ class Slider(Grabbable, Pane):
     def fill_color(self, color: Color):
         self._fill_color = color
         self._slider.canvas["fg_color"][:, : self._handle.x] = color
+        self._slider.invalidate()
 
     @property
     def proportion(self) -> float:
@@ -341,6 +354,7 @@ class Slider(Grabbable, Pane):
         self._handle.x = x = round(self._proportion * self.fill_width)
         self._slider.canvas["fg_color"][:, :x] = self.fill_color
         self._slider.canvas["fg_color"][:, x:] = self.slider_color
+        self._slider.invalidate()
 
         if self.callback is not None:
             self.callback(self._value)
@@ -140,6 +140,12 @@ class Sparkline(Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -157,6 +163,8 @@ class Sparkline(Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -274,6 +282,7 @@ class Sparkline(Gadget):
         self._selector.bg_color = bg_color
         self._sparkline.default_bg_color = bg_color
         self._sparkline.canvas["bg_color"] = bg_color
+        self._sparkline.invalidate()
 
     @property
     def highlight_color(self) -> Color:
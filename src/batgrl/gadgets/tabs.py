@@ -152,6 +152,12 @@ class Tabs(Themable, Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -175,6 +181,8 @@ class Tabs(Themable, Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -244,6 +252,7 @@ class Tabs(Themable, Gadget):
 
         def _update_sep():
             self.separator.canvas["char"] = "━"
+            self.separator.invalidate()
 
         self.bind("size", _update_sep)
 
@@ -293,10 +302,12 @@ class Tabs(Themable, Gadget):
         self.tab_window.bg_color = title_inactive.bg
         self.separator.default_cell[["fg_color", "bg_color"]] = title_inactive
         self.separator.canvas[["fg_color", "bg_color"]] = title_inactive
+        self.separator.invalidate()
 
         title_active = self.color_theme.titlebar_normal
         self._tab_underline.default_cell[["fg_color", "bg_color"]] = title_active
         self._tab_underline.canvas[["fg_color", "bg_color"]] = title_active
+        self._tab_underline.invalidate()
 
     def add_tab(self, title: str, content: Gadget):
         """
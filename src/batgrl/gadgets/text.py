@@ -92,6 +92,10 @@ class Text(Gadget):
     r"""
     A text gadget. Displays arbitrary text data.
 
+    Text gadgets track damage: changes made with :meth:`add_str`, :meth:`set_text` and
+    other methods are reported automatically, but changes made by writing to
+    :attr:`canvas` directly must be reported with :meth:`invalidate`.
+
     Parameters
     ----------
     default_cell : NDArray[Cell] | str, default: " "
@@ -169,6 +173,12 @@ class Text(Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -198,6 +208,8 @@ class Text(Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -238,6 +250,8 @@ class Text(Gadget):
         Remove this gadget and recursively remove all its children.
     """
 
+    tracks_damage = True
+
     def __init__(
         self,
         *,
@@ -301,6 +315,7 @@ class Text(Gadget):
     @bindable
     def alpha(self, alpha: float):
         self._alpha = clamp(float(alpha), 0.0, 1.0)
+        self.invalidate()
 
     def on_size(self):
         """Resize canvas preserving as much content as possible."""
@@ -357,6 +372,7 @@ class Text(Gadget):
         if bg_color is not None:
             self.canvas["bg_color"][[0, -1]] = bg_color
             self.canvas["bg_color"][:, [0, -1]] = bg_color
+        self.invalidate()
 
     def add_syntax_highlighting(
         self, lexer: Lexer | None = None, style: Style = Neptune
@@ -402,6 +418,7 @@ class Text(Gadget):
                 self.canvas[y, x:end]["italic"] = token_style["italic"]
                 self.canvas[y, x:end]["underline"] = token_style["underline"]
                 x = end
+        self.invalidate()
 
     def add_str(
         self,
@@ -452,6 +469,7 @@ class Text(Gadget):
             markdown=markdown,
             truncate_text=truncate_str,
         )
+        self.invalidate()
 
     def set_text(
         self,
@@ -493,6 +511,7 @@ class Text(Gadget):
     def clear(self):
         """Fill canvas with default cell."""
         self.canvas[:] = self.default_cell
+        self.invalidate()
 
     def shift(self, n: int = 1):
         """
@@ -506,6 +525,7 @@ class Text(Gadget):
         elif n < 0:
             self.canvas[-n:] = self.canvas[:n]
             self.canvas[:-n] = self.default_cell
+        self.invalidate()
 
     def _render(self, canvas: NDArray[Cell]):
         """Render visible region of gadget."""
@@ -68,6 +68,7 @@ def _create_on_progress(
                 cover.canvas[last_bottom + 1 : beam.bottom + 1, beam.x][
                     "fg_color"
                 ] = WHITE
+                cover.invalidate()
                 last_bottom = beam.bottom
 
     elif kind == "left":
@@ -79,6 +80,7 @@ def _create_on_progress(
                 left = max(beam.left, 0)
                 pass_count[beam.y, left:last_left] += 1
                 cover.canvas[beam.y, left:last_left]["fg_color"] = WHITE
+                cover.invalidate()
                 last_left = beam.left
 
     elif kind == "right":
@@ -91,6 +93,7 @@ def _create_on_progress(
                 cover.canvas[beam.y, last_right + 1 : beam.right + 1][
                     "fg_color"
                 ] = WHITE
+                cover.invalidate()
                 last_right = beam.right
 
     else:
@@ -102,6 +105,7 @@ def _create_on_progress(
                 top = max(beam.top, 0)
                 pass_count[top:last_top, beam.x] += 1
                 cover.canvas[top:last_top, beam.x]["fg_color"] = WHITE
+                cover.invalidate()
                 last_top = beam.top
 
     return on_progress
@@ -172,4 +176,5 @@ async def _fade_cover(pass_count: NDArray[np.int32], cover: Text, text: Text):
         passed_mask = pass_count >= 1
         faded = cover_fg * 0.99 + text_fg * 0.01
         cover_fg[passed_mask] = faded.astype(np.uint8)[passed_mask]
+        cover.invalidate()
         await asyncio.sleep(0)
@@ -3,7 +3,6 @@
 import asyncio
 from math import cos, dist, sin, tau
 from random import choice, random
-from time import monotonic
 
 import numpy as np
 
@@ -157,11 +156,12 @@ async def _move_to_rings(
 async def _spin_rings(
     radius_to_particles: dict[int, list[Particle]], center: Point, reverse: bool = False
 ):
-    start = monotonic()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
     theta = tau / 100
 
     while True:
-        elapsed = monotonic() - start
+        elapsed = loop.time() - start
         if elapsed > 3:
             return
 
@@ -34,6 +34,8 @@ async def spotlights_effect(text: Text):
     """
     cover = Text(size=text.size)
     cover.canvas[:] = text.canvas
+    # Spotlights are drawn through views of `cover.canvas`, so repaint it every frame.
+    cover.tracks_damage = False
 
     in_fg = text.canvas["fg_color"]
     in_bg = text.canvas["bg_color"]
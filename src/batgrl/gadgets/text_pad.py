@@ -110,6 +110,12 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -169,6 +175,8 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -397,6 +405,7 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
                     colors[i, : ll[i]] = highlight
         else:  # If no selection or selection is empty, add line highlight.
             colors[self.cursor.y, :] = self.color_theme.text_pad_line_highlight
+        self._pad.invalidate()
 
     @property
     def is_selecting(self) -> bool:
@@ -469,6 +478,7 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
 
         remaining = canvas[ey + 1 :]
         canvas[sy + 1 : sy + 1 + len(remaining)] = remaining
+        pad.invalidate()
 
         del ll[sy + 1 : ey + 1]
         height = max(len(ll), self._scroll_view.port_height)
@@ -159,6 +159,12 @@ class Textbox(Themable, Focusable, Grabbable, Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -214,6 +220,8 @@ class Textbox(Themable, Focusable, Grabbable, Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -356,6 +364,7 @@ class Textbox(Themable, Focusable, Grabbable, Gadget):
         self._placeholder_gadget.default_bg_color = placeholder.bg
         self._placeholder_gadget.canvas["fg_color"] = placeholder.fg
         self._placeholder_gadget.canvas["bg_color"] = placeholder.bg
+        self._placeholder_gadget.invalidate()
 
         self._highlight_selection()
 
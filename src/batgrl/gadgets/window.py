@@ -23,6 +23,8 @@ __all__ = ["Window", "Point", "Size"]
 
 
 class _TitleBar(Grabbable, Pane):
+    tracks_damage = True
+
     def __init__(self):
         super().__init__(
             pos=(1, 2),
@@ -139,6 +141,12 @@ class Window(Themable, Focusable, Grabbable, Gadget):
         Whether gadget is visible.
     is_enabled : bool
         Whether gadget is enabled.
+    tracks_damage : bool
+        Whether all changes to gadget's appearance are reported with
+        :meth:`invalidate`.
+    hit_test_mouse : bool
+        Whether mouse handlers ignore mouse events that don't collide with the
+        gadget or its descendents.
     root : Gadget | None
         If gadget is in gadget tree, return the root gadget.
     app : App
@@ -170,6 +178,8 @@ class Window(Themable, Focusable, Grabbable, Gadget):
         Return true if point collides with visible portion of gadget.
     collides_gadget(other)
         Return true if other is within gadget's bounding box.
+    invalidate(rect=None)
+        Mark gadget (or a rect of gadget) as needing to be repainted.
     add_gadget(gadget)
         Add a child gadget.
     add_gadgets(\*gadgets)
@@ -413,6 +423,7 @@ class Window(Themable, Focusable, Grabbable, Gadget):
         self._titlebar._label.default_bg_color = bg
         self._titlebar._label.canvas["fg_color"] = fg
         self._titlebar._label.canvas["bg_color"] = bg
+        self._titlebar._label.invalidate()
         self._top_border.bg_color = border
         self._bot_border.bg_color = border
         self._left_border.bg_color = border
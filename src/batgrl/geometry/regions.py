@@ -45,9 +45,10 @@ rect. Bands are a sorted list of walls with each band having a top y-coordinate
 bottom y-coordinate. And finally, Regions are a sorted list of non-intersecting Bands.
 """
 
-from bisect import bisect
-from collections.abc import Callable, Iterator
+from bisect import bisect, bisect_left, bisect_right
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Self
 
 from .basic import Point, Size
@@ -156,225 +157,341 @@ class _Band:
         return y < self.y1
 
 
-def _merge(op: Callable[[bool, bool], bool], a: list[int], b: list[int]) -> list[int]:
+_Op = tuple[bool, bool, bool, bool]
+"""
+A set operation as a truth table indexed by ``inside_a << 1 | inside_b``.
+
+``op[2]`` is whether the parts of ``a`` outside of ``b`` are kept and ``op[1]`` is
+whether the parts of ``b`` outside of ``a`` are kept.
+"""
+
+_AND: _Op = (False, False, False, True)
+_OR: _Op = (False, True, True, True)
+_SUB: _Op = (False, False, True, False)
+_XOR: _Op = (False, True, True, False)
+
+_y1 = attrgetter("y1")
+_y2 = attrgetter("y2")
+
+
+def _merge_rect(op: _Op, a: list[int], left: int, right: int) -> list[int]:
+    """Merge the walls of a band with a single rect for any operation but xor."""
+    if op is _AND:
+        # Walls strictly between left and right, and left and right themselves if
+        # they are inside a rect of `a`.
+        start = bisect_right(a, left)
+        end = bisect_left(a, right)
+        walls = a[start:end]
+        if start % 2 == 1:
+            walls.insert(0, left)
+        if end % 2 == 1:
+            walls.append(right)
+        return walls
+
+    # Walls left of the rect and right of the rect with left and right added if they
+    # are outside (for or) or inside (for sub) a rect of `a`.
+    start = bisect_left(a, left)
+    end = bisect_right(a, right)
+    walls = a[:start]
+    if op is _SUB:
+        if start % 2 == 1:
+            walls.append(left)
+        if end % 2 == 1:
+            walls.append(right)
+    else:  # _OR
+        if start % 2 == 0:
+            walls.append(left)
+        if end % 2 == 0:
+            walls.append(right)
+    walls.extend(a[end:])
+    return walls
+
+
+def _merge(op: _Op, a: list[int], b: list[int]) -> list[int]:
     """Merge the walls of two bands given a set operation."""
+    if not b:
+        return a if op[2] else []
+    if not a:
+        return b if op[1] else []
+    if op is not _XOR:
+        if len(b) == 2:
+            return _merge_rect(op, a, b[0], b[1])
+        if len(a) == 2 and op is not _SUB:
+            return _merge_rect(op, b, a[0], a[1])
+
     i = j = 0
+    len_a = len(a)
+    len_b = len(b)
     inside_a = inside_b = inside_region = False
     walls = []
 
-    while i < len(a) or j < len(b):
-        current_a = a[i] if i < len(a) else float("inf")
-        current_b = b[j] if j < len(b) else float("inf")
-        threshold = min(current_a, current_b)
-
-        if current_a == threshold:
+    while i < len_a and j < len_b:
+        current_a = a[i]
+        current_b = b[j]
+        if current_a <= current_b:
+            threshold = current_a
             inside_a = not inside_a
             i += 1
-
-        if current_b == threshold:
+            if current_a == current_b:
+                inside_b = not inside_b
+                j += 1
+        else:
+            threshold = current_b
             inside_b = not inside_b
             j += 1
 
-        if op(inside_a, inside_b) != inside_region:
+        if op[inside_a << 1 | inside_b] != inside_region:
             inside_region = not inside_region
             walls.append(threshold)
 
+    # One band is exhausted so we are outside of it. The rest of the other band is
+    # either kept as-is or discarded.
+    if i < len_a and op[2]:
+        walls.extend(a[i:])
+    elif j < len_b and op[1]:
+        walls.extend(b[j:])
+
     return walls
 
 
-@dataclass(slots=True, unsafe_hash=True)
-class Region:
+def _extend(bands: list[_Band], other: list[_Band]):
     """
-    Collection of mutually exclusive bands of rects.
+    Extend `bands` with `other`, joining the last band of `bands` with the first band
+    of `other` if they are contiguous with the same walls.
 
-    Parameters
-    ----------
-    bands : list[_Band], default: []
-        Bands that make up the region.
-
-    Attributes
-    ----------
-    bands : list[_Band]
-        Bands that make up the region.
-
-    bbox : Rect | None
-        Bounding box of region.
-
-    Methods
-    -------
-    rects()
-        Yield rects that make up the region.
-    from_rect(post, size)
-        Return a new region from a rect position and size.
+    Bands are never mutated so that they can be shared between regions.
     """
+    if bands and other:
+        last = bands[-1]
+        first = other[0]
+        if last.y2 == first.y1 and last.walls == first.walls:
+            bands[-1] = _Band(last.y1, first.y2, last.walls)
+            bands.extend(other[1:])
+            return
+    bands.extend(other)
+
+
+def _merge_bands(op: _Op, a: list[_Band], b: list[_Band]) -> list[_Band]:
+    """Merge two lists of bands given a set operation."""
+    bands: list[_Band] = []
+
+    def add(y1: int, y2: int, walls: list[int]):
+        """Add a band, joining it with the last band if possible."""
+        if y1 >= y2 or not walls:
+            return
+        if bands:
+            last = bands[-1]
+            if last.y2 == y1 and last.walls == walls:
+                bands[-1] = _Band(last.y1, y2, walls)
+                return
+        bands.append(_Band(y1, y2, walls))
 
-    bands: list[_Band] = field(default_factory=list)
+    i = j = 0
+    scanline = -float("inf")
 
-    def _coalesce(self):
-        """Join contiguous bands with the same walls to reduce rects."""
-        bands = self.bands = [band for band in self.bands if len(band.walls) > 0]
-
-        i = 0
-        while i < len(bands) - 1:
-            a, b = bands[i], bands[i + 1]
-            if b.y1 <= a.y2 and a.walls == b.walls:
-                a.y2 = b.y2
-                del bands[i + 1]
-            else:
+    while i < len(a) and j < len(b):
+        r, s = a[i], b[j]
+        if r.y1 <= s.y1:
+            if scanline < r.y1:
+                scanline = r.y1
+            if r.y2 < s.y1:
+                ## ---------------
+                ## - - - - - - - - scanline
+                ##        r
+                ## ---------------
+                ##        ~~~~~~~~~~~~~~~
+                ##               s
+                ##        ~~~~~~~~~~~~~~~
+                add(scanline, r.y2, _merge(op, r.walls, []))
+                scanline = r.y2
                 i += 1
-
-    def _merge_regions(self, other: Self, op: Callable[[bool, bool], bool]) -> Self:
-        bands = []
-        i = j = 0
-        scanline = -float("inf")
-
-        while i < len(self.bands) and j < len(other.bands):
-            r, s = self.bands[i], other.bands[j]
-            if r.y1 <= s.y1:
-                if scanline < r.y1:
-                    scanline = r.y1
-                if r.y2 < s.y1:
+            elif r.y2 < s.y2:
+                if scanline < s.y1:
                     ## ---------------
                     ## - - - - - - - - scanline
                     ##        r
-                    ## ---------------
                     ##        ~~~~~~~~~~~~~~~
+                    ## ---------------
                     ##               s
                     ##        ~~~~~~~~~~~~~~~
-                    bands.append(_Band(scanline, r.y2, _merge(op, r.walls, [])))
-                    scanline = r.y2
-                    i += 1
-                elif r.y2 < s.y2:
-                    if scanline < s.y1:
-                        ## ---------------
-                        ## - - - - - - - - scanline
-                        ##        r
-                        ##        ~~~~~~~~~~~~~~~
-                        ## ---------------
-                        ##               s
-                        ##        ~~~~~~~~~~~~~~~
-                        bands.append(_Band(scanline, s.y1, _merge(op, r.walls, [])))
-                    if s.y1 < r.y2:
-                        ## ---------------
-                        ##        r
-                        ##        ~-~-~-~-~-~-~-~ scanline
-                        ## ---------------
-                        ##               s
-                        ##        ~~~~~~~~~~~~~~~
-                        bands.append(_Band(s.y1, r.y2, _merge(op, r.walls, s.walls)))
-                    scanline = r.y2
-                    i += 1
-                else:  # r.y2 >= s.y2
-                    if scanline < s.y1:
-                        ## ---------------
-                        ## - - - - - - - - scanline
-                        ##        r
-                        ##        ~~~~~~~~~~~~~~~
-                        ##               s
-                        ##        ~~~~~~~~~~~~~~~
-                        ## ---------------
-                        bands.append(_Band(scanline, s.y1, _merge(op, r.walls, [])))
+                    add(scanline, s.y1, _merge(op, r.walls, []))
+                if s.y1 < r.y2:
                     ## ---------------
                     ##        r
                     ##        ~-~-~-~-~-~-~-~ scanline
+                    ## ---------------
                     ##               s
                     ##        ~~~~~~~~~~~~~~~
-                    ## ---------------
-                    bands.append(_Band(s.y1, s.y2, _merge(op, r.walls, s.walls)))
-                    scanline = s.y2
-                    if s.y2 == r.y2:
-                        i += 1
-                    j += 1
-            else:  # s.y1 < r.y1
+                    add(s.y1, r.y2, _merge(op, r.walls, s.walls))
+                scanline = r.y2
+                i += 1
+            else:  # r.y2 >= s.y2
                 if scanline < s.y1:
-                    scanline = s.y1
-                if s.y2 < r.y1:
+                    ## ---------------
+                    ## - - - - - - - - scanline
+                    ##        r
+                    ##        ~~~~~~~~~~~~~~~
+                    ##               s
+                    ##        ~~~~~~~~~~~~~~~
+                    ## ---------------
+                    add(scanline, s.y1, _merge(op, r.walls, []))
+                ## ---------------
+                ##        r
+                ##        ~-~-~-~-~-~-~-~ scanline
+                ##               s
+                ##        ~~~~~~~~~~~~~~~
+                ## ---------------
+                add(s.y1, s.y2, _merge(op, r.walls, s.walls))
+                scanline = s.y2
+                if s.y2 == r.y2:
+                    i += 1
+                j += 1
+        else:  # s.y1 < r.y1
+            if scanline < s.y1:
+                scanline = s.y1
+            if s.y2 < r.y1:
+                ## ~~~~~~~~~~~~~~~
+                ## - - - - - - - - scanline
+                ##        s
+                ## ~~~~~~~~~~~~~~~
+                ##        _______________
+                ##               r
+                ##        _______________
+                add(scanline, s.y2, _merge(op, [], s.walls))
+                scanline = s.y2
+                j += 1
+            elif s.y2 < r.y2:
+                if scanline < r.y1:
                     ## ~~~~~~~~~~~~~~~
                     ## - - - - - - - - scanline
                     ##        s
+                    ##        ---------------
                     ## ~~~~~~~~~~~~~~~
-                    ##        _______________
                     ##               r
-                    ##        _______________
-                    bands.append(_Band(scanline, s.y2, _merge(op, [], s.walls)))
-                    scanline = s.y2
-                    j += 1
-                elif s.y2 < r.y2:
-                    if scanline < r.y1:
-                        ## ~~~~~~~~~~~~~~~
-                        ## - - - - - - - - scanline
-                        ##        s
-                        ##        ---------------
-                        ## ~~~~~~~~~~~~~~~
-                        ##               r
-                        ##        ---------------
-                        bands.append(_Band(scanline, r.y1, _merge(op, [], s.walls)))
-                    if r.y1 < s.y2:
-                        ## ~~~~~~~~~~~~~~~
-                        ##        s
-                        ##        --------------- scanline
-                        ## ~~~~~~~~~~~~~~~
-                        ##               r
-                        ##        ---------------
-                        bands.append(_Band(r.y1, s.y2, _merge(op, r.walls, s.walls)))
-                    scanline = s.y2
-                    j += 1
-                else:  # s.y2 >= r.y2
-                    if scanline < r.y1:
-                        ## ~~~~~~~~~~~~~~~
-                        ## - - - - - - - - scanline
-                        ##        s
-                        ##        ---------------
-                        ##               r
-                        ##        ---------------
-                        ## ~~~~~~~~~~~~~~~
-                        bands.append(_Band(scanline, r.y1, _merge(op, [], s.walls)))
+                    ##        ---------------
+                    add(scanline, r.y1, _merge(op, [], s.walls))
+                if r.y1 < s.y2:
                     ## ~~~~~~~~~~~~~~~
                     ##        s
                     ##        --------------- scanline
+                    ## ~~~~~~~~~~~~~~~
                     ##               r
                     ##        ---------------
+                    add(r.y1, s.y2, _merge(op, r.walls, s.walls))
+                scanline = s.y2
+                j += 1
+            else:  # s.y2 >= r.y2
+                if scanline < r.y1:
                     ## ~~~~~~~~~~~~~~~
-                    bands.append(_Band(r.y1, r.y2, _merge(op, r.walls, s.walls)))
-                    scanline = r.y2
-                    if r.y2 == s.y2:
-                        j += 1
-                    i += 1
+                    ## - - - - - - - - scanline
+                    ##        s
+                    ##        ---------------
+                    ##               r
+                    ##        ---------------
+                    ## ~~~~~~~~~~~~~~~
+                    add(scanline, r.y1, _merge(op, [], s.walls))
+                ## ~~~~~~~~~~~~~~~
+                ##        s
+                ##        --------------- scanline
+                ##               r
+                ##        ---------------
+                ## ~~~~~~~~~~~~~~~
+                add(r.y1, r.y2, _merge(op, r.walls, s.walls))
+                scanline = r.y2
+                if r.y2 == s.y2:
+                    j += 1
+                i += 1
 
-        while i < len(self.bands):
-            r = self.bands[i]
-            if scanline < r.y1:
-                scanline = r.y1
-            bands.append(_Band(scanline, r.y2, _merge(op, r.walls, [])))
-            i += 1
+    while i < len(a):
+        r = a[i]
+        if scanline < r.y1:
+            scanline = r.y1
+        add(scanline, r.y2, _merge(op, r.walls, []))
+        i += 1
+
+    while j < len(b):
+        s = b[j]
+        if scanline < s.y1:
+            scanline = s.y1
+        add(scanline, s.y2, _merge(op, [], s.walls))
+        j += 1
+
+    return bands
 
-        while j < len(other.bands):
-            s = other.bands[j]
-            if scanline < s.y1:
-                scanline = s.y1
-            bands.append(_Band(scanline, s.y2, _merge(op, [], s.walls)))
-            j += 1
 
-        region = Region(bands=bands)
-        region._coalesce()
-        return region
+@dataclass(slots=True, unsafe_hash=True)
+class Region:
+    """
+    Collection of mutually exclusive bands of rects.
+
+    Parameters
+    ----------
+    bands : list[_Band], default: []
+        Bands that make up the region.
+
+    Attributes
+    ----------
+    bands : list[_Band]
+        Bands that make up the region.
+
+    bbox : Rect | None
+        Bounding box of region.
+
+    Methods
+    -------
+    rects()
+        Yield rects that make up the region.
+    from_rect(post, size)
+        Return a new region from a rect position and size.
+    """
+
+    bands: list[_Band] = field(default_factory=list)
 
-    # TODO: in-place merge and iand, ior, iadd, isub, ixor methods
+    def _merge_regions(self, other: Self, op: _Op) -> Self:
+        a = self.bands
+        b = other.bands
+        kept_a = a if op[2] else []
+        kept_b = b if op[1] else []
+        if not a or not b:
+            return Region(kept_a + kept_b)
+
+        top = max(a[0].y1, b[0].y1)
+        bottom = min(a[-1].y2, b[-1].y2)
+        if top >= bottom:
+            # Regions don't overlap vertically.
+            bands = kept_a.copy() if a[0].y1 < b[0].y1 else kept_b.copy()
+            _extend(bands, kept_b if a[0].y1 < b[0].y1 else kept_a)
+            return Region(bands)
+
+        # Only bands within the vertical overlap of the regions need to be merged.
+        # Bands above or below the overlap are only in one of the regions so they are
+        # kept or discarded as a whole. At most one region has bands above the overlap
+        # and at most one region has bands below.
+        a_start = bisect_right(a, top, key=_y2)
+        a_end = bisect_left(a, bottom, key=_y1)
+        b_start = bisect_right(b, top, key=_y2)
+        b_end = bisect_left(b, bottom, key=_y1)
+
+        bands = kept_a[:a_start] + kept_b[:b_start]
+        _extend(bands, _merge_bands(op, a[a_start:a_end], b[b_start:b_end]))
+        _extend(bands, kept_a[a_end:])
+        _extend(bands, kept_b[b_end:])
+        return Region(bands)
 
     def __and__(self, other: Self) -> Self:
-        return self._merge_regions(other, lambda a, b: a & b)
+        return self._merge_regions(other, _AND)
 
     def __or__(self, other: Self) -> Self:
-        return self._merge_regions(other, lambda a, b: a | b)
+        return self._merge_regions(other, _OR)
 
     def __add__(self, other: Self) -> Self:
-        return self._merge_regions(other, lambda a, b: a | b)
+        return self._merge_regions(other, _OR)
 
     def __sub__(self, other: Self) -> Self:
-        return self._merge_regions(other, lambda a, b: a & (not b))
+        return self._merge_regions(other, _SUB)
 
     def __xor__(self, other: Self) -> Self:
-        return self._merge_regions(other, lambda a, b: a ^ b)
+        return self._merge_regions(other, _XOR)
 
     def __bool__(self):
         return len(self.bands) > 0
@@ -413,11 +530,13 @@ class Region:
         Returns
         -------
         Region
-            A new region.
+            A new region. The region is empty if the rect has no area.
         """
         y, x = pos
         h, w = size
-        return cls([_Band(y, y + h, (x, x + w))])
+        if h <= 0 or w <= 0:
+            return cls()
+        return cls([_Band(y, y + h, [x, x + w])])
 
     def __contains__(self, point: Point) -> bool:
         """Whether point is in region."""
@@ -0,0 +1,290 @@
+"""Per-frame timings of the render pipeline."""
+
+import json
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import TextIO
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ["FrameProfiler", "FrameStats"]
+
+
+@dataclass(slots=True)
+class FrameStats:
+    """
+    Timings and output size of a single frame.
+
+    All timings are in seconds.
+
+    Parameters
+    ----------
+    frame : int
+        Index of frame.
+    start : float
+        Value of :func:`time.perf_counter` when frame began rendering.
+    regions : float, default: 0.0
+        Time spent computing gadget regions.
+    render : float, default: 0.0
+        Time spent compositing gadgets into the root canvas.
+    gadgets : dict[str, float], default: {}
+        Time spent in ``_render`` of each gadget class.
+    retries : int, default: 0
+        Number of times compositing was repeated because gadget geometry was changed
+        from another thread.
+    diff : float, default: 0.0
+        Time spent diffing frame against the last written frame.
+    encode : float, default: 0.0
+        Time spent encoding changed cells as escape sequences.
+    bytes_written : int, default: 0
+        Number of bytes written to the terminal.
+    flush : float, default: 0.0
+        Time spent writing output to the terminal.
+    latency : float, default: 0.0
+        Time from when frame began rendering until it was written.
+    dropped : bool, default: False
+        Whether frame was dropped by a :class:`batgrl.rendering.FrameWriter` instead
+        of being written.
+
+    Attributes
+    ----------
+    frame : int
+        Index of frame.
+    start : float
+        Value of :func:`time.perf_counter` when frame began rendering.
+    regions : float
+        Time spent computing gadget regions.
+    render : float
+        Time spent compositing gadgets into the root canvas.
+    gadgets : dict[str, float]
+        Time spent in ``_render`` of each gadget class.
+    retries : int
+        Number of times compositing was repeated because gadget geometry was changed
+        from another thread.
+    diff : float
+        Time spent diffing frame against the last written frame.
+    encode : float
+        Time spent encoding changed cells as escape sequences.
+    bytes_written : int
+        Number of bytes written to the terminal.
+    flush : float
+        Time spent writing output to the terminal.
+    latency : float
+        Time from when frame began rendering until it was written.
+    dropped : bool
+        Whether frame was dropped instead of being written.
+    """
+
+    frame: int
+    start: float
+    regions: float = 0.0
+    render: float = 0.0
+    gadgets: dict[str, float] = field(default_factory=dict)
+    retries: int = 0
+    diff: float = 0.0
+    encode: float = 0.0
+    bytes_written: int = 0
+    flush: float = 0.0
+    latency: float = 0.0
+    dropped: bool = False
+
+
+_METRICS = frozenset(
+    f.name for f in fields(FrameStats) if f.name not in {"frame", "gadgets", "dropped"}
+)
+"""Fields of ``FrameStats`` that can be aggregated."""
+
+
+class FrameProfiler:
+    """
+    Collect per-frame timings of the render pipeline.
+
+    Enabled in an app with ``App(profile_frames=True)``. The stats of recent frames
+    are kept in memory and, optionally, every frame's stats are written to a JSON
+    lines file.
+
+    Parameters
+    ----------
+    history : int, default: 600
+        Number of recent frames kept.
+    path : Path | None, default: None
+        If given, the stats of each frame are written to this file as JSON lines.
+
+    Attributes
+    ----------
+    history : int
+        Number of recent frames kept.
+    path : Path | None
+        If given, the stats of each frame are written to this file as JSON lines.
+    frames_profiled : int
+        Number of frames begun.
+
+    Methods
+    -------
+    begin_frame()
+        Return stats for a new frame.
+    end_frame(stats)
+        Record the stats of a finished frame.
+    recent(n=None)
+        Return the stats of the last `n` recorded frames.
+    mean(metric, n=None)
+        Return the mean of a metric over the last `n` recorded frames.
+    gadget_times(n=None)
+        Return mean render time of each gadget class over the last `n` recorded
+        frames.
+    histogram(metric, bins=10, n=None)
+        Return a histogram of a metric over the last `n` recorded frames.
+    close()
+        Close JSON lines file.
+    """
+
+    def __init__(self, history: int = 600, path: Path | None = None):
+        self.history = history
+        """Number of recent frames kept."""
+        self.path = path
+        """If given, the stats of each frame are written to this file as JSON lines."""
+        self.frames_profiled: int = 0
+        """Number of frames begun."""
+        self._frames: deque[FrameStats] = deque(maxlen=history)
+        """Stats of recent frames."""
+        self._file: TextIO | None = None
+        """JSON lines file if :attr:`path` is given."""
+        self._lock = Lock()
+        """Guards recorded frames. Frames may be recorded by a frame writer thread."""
+
+    def begin_frame(self) -> FrameStats:
+        """
+        Return stats for a new frame.
+
+        Returns
+        -------
+        FrameStats
+            Stats for a new frame.
+        """
+        stats = FrameStats(self.frames_profiled, perf_counter())
+        self.frames_profiled += 1
+        return stats
+
+    def end_frame(self, stats: FrameStats) -> None:
+        """
+        Record the stats of a finished frame.
+
+        Parameters
+        ----------
+        stats : FrameStats
+            Stats of a finished frame.
+        """
+        stats.latency = perf_counter() - stats.start
+        with self._lock:
+            self._frames.append(stats)
+            if self.path is None:
+                return
+            if self._file is None:
+                self._file = open(self.path, "w")
+            self._file.write(json.dumps(asdict(stats)) + "\n")
+
+    def recent(self, n: int | None = None) -> list[FrameStats]:
+        """
+        Return the stats of the last `n` recorded frames.
+
+        Parameters
+        ----------
+        n : int | None, default: None
+            Number of frames. If ``None``, all kept frames are returned.
+
+        Returns
+        -------
+        list[FrameStats]
+            Stats of the last `n` recorded frames, oldest first.
+        """
+        with self._lock:
+            frames = list(self._frames)
+        if n is not None:
+            frames = frames[-n:] if n > 0 else []
+        return frames
+
+    def _values(self, metric: str, n: int | None) -> NDArray[np.float64]:
+        """Return values of a metric over the last `n` recorded frames."""
+        frames = self.recent(n)
+        if metric in _METRICS:
+            return np.array([getattr(stats, metric) for stats in frames], float)
+        return np.array([stats.gadgets.get(metric, 0.0) for stats in frames], float)
+
+    def mean(self, metric: str, n: int | None = None) -> float:
+        """
+        Return the mean of a metric over the last `n` recorded frames.
+
+        Parameters
+        ----------
+        metric : str
+            Name of a timing or size attribute of :class:`FrameStats` (e.g.,
+            ``"encode"``) or of a gadget class.
+        n : int | None, default: None
+            Number of frames. If ``None``, all kept frames are used.
+
+        Returns
+        -------
+        float
+            Mean of metric or ``0.0`` if no frames are recorded.
+        """
+        values = self._values(metric, n)
+        return float(values.mean()) if len(values) else 0.0
+
+    def gadget_times(self, n: int | None = None) -> dict[str, float]:
+        """
+        Return mean render time of each gadget class over the last `n` recorded
+        frames.
+
+        Parameters
+        ----------
+        n : int | None, default: None
+            Number of frames. If ``None``, all kept frames are used.
+
+        Returns
+        -------
+        dict[str, float]
+            Mean render time of each gadget class, slowest first.
+        """
+        frames = self.recent(n)
+        totals = {}
+        for stats in frames:
+            for name, elapsed in stats.gadgets.items():
+                totals[name] = totals.get(name, 0.0) + elapsed
+        return {
+            name: total / len(frames)
+            for name, total in sorted(totals.items(), key=lambda item: -item[1])
+        }
+
+    def histogram(
+        self, metric: str, bins: int | NDArray[np.float64] = 10, n: int | None = None
+    ) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """
+        Return a histogram of a metric over the last `n` recorded frames.
+
+        Parameters
+        ----------
+        metric : str
+            Name of a timing or size attribute of :class:`FrameStats` (e.g.,
+            ``"encode"``) or of a gadget class.
+        bins : int | NDArray[np.float64], default: 10
+            Number of equal-width bins or monotonically increasing bin edges.
+        n : int | None, default: None
+            Number of frames. If ``None``, all kept frames are used.
+
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.float64]]
+            Number of frames in each bin and the bin edges.
+        """
+        return np.histogram(self._values(metric, n), bins)
+
+    def close(self) -> None:
+        """Close JSON lines file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -1,118 +1,1078 @@
 """Functions that render the gadget tree's root canvas into the terminal."""
 
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from functools import cache
+from threading import Condition, Thread
+from time import perf_counter
+from typing import Literal
+
 import numpy as np
+from numpy.typing import NDArray
 
 from .gadgets._root import _Root
+from .geometry import Point
+from .profiling import FrameProfiler, FrameStats
 from .terminal import Vt100Terminal
-from .text_tools import char_width
+from .terminal.vt100_terminal import (
+    BEGIN_SYNCHRONIZED_UPDATE,
+    DEVICE_STATUS_REPORT,
+    END_SYNCHRONIZED_UPDATE,
+)
+from .text_tools import Cell, CellPlanes, _codepoint_widths
+
+__all__ = ["ColorDepth", "FrameWriter", "render_root"]
+
+ColorDepth = Literal["truecolor", "256color", "16color"]
+"""
+Color depth of terminal output.
+
+``"truecolor"`` outputs 24-bit colors. ``"256color"`` and ``"16color"`` quantize colors
+to the xterm 256-color and 16-color palettes, respectively.
+"""
+
+
+_STYLE_PARAMS = (("1", "22"), ("3", "23"), ("4", "24"), ("9", "29"), ("53", "55"))
+"""SGR parameters that set and reset each style (bold, italic, underline, etc.)."""
+
+
+def _style_reset(style: int) -> str:
+    """Return SGR parameters that reset all attributes then set packed style bits."""
+    return ";".join(
+        ["0", *(on for i, (on, _) in enumerate(_STYLE_PARAMS) if style >> i & 1)]
+    )
+
+
+def _style_transition(last_style: int, style: int, may_reset: bool) -> str:
+    """
+    Return SGR parameters that change packed style bits ``last_style`` into
+    ``style``.
+
+    If ``may_reset`` is true, all attributes are reset first if that is shorter.
+    """
+    changed = last_style ^ style
+    delta = ";".join(
+        off if last_style >> i & 1 else on
+        for i, (on, off) in enumerate(_STYLE_PARAMS)
+        if changed >> i & 1
+    )
+    if may_reset and len(reset := _style_reset(style)) < len(delta):
+        return reset
+    return delta
+
+
+_STYLE_DELTAS = np.array(
+    [
+        _style_transition(last, style, False)
+        for last in range(32)
+        for style in range(32)
+    ],
+    object,
+)
+"""SGR parameters that change style bits indexed by ``last_style << 5 | style``."""
+_STYLE_RESETS = np.array(
+    [_style_transition(last, style, True) for last in range(32) for style in range(32)],
+    object,
+)
+"""
+SGR parameters that change style bits (possibly resetting all attributes) indexed by
+``last_style << 5 | style``. Only valid if both colors are set afterwards.
+"""
+_DECIMALS = np.array([str(i) for i in range(256)], object)
+"""Decimal strings of each byte value."""
+_SEPARATORS = np.array(["", ";"], object)
+"""Separator between SGR parameters indexed by whether a parameter precedes it."""
+
+
+_ANSI_COLORS = np.array(
+    [
+        [0, 0, 0],
+        [205, 0, 0],
+        [0, 205, 0],
+        [205, 205, 0],
+        [0, 0, 238],
+        [205, 0, 205],
+        [0, 205, 205],
+        [229, 229, 229],
+        [127, 127, 127],
+        [255, 0, 0],
+        [0, 255, 0],
+        [255, 255, 0],
+        [92, 92, 255],
+        [255, 0, 255],
+        [0, 255, 255],
+        [255, 255, 255],
+    ],
+    np.int32,
+)
+"""Colors of the 16-color palette (xterm defaults)."""
+_CUBE_LEVELS = np.array([0, 95, 135, 175, 215, 255], np.int32)
+"""Channel values of the 6x6x6 color cube of the 256-color palette."""
+_CUBE_INDICES = np.digitize(np.arange(256), [48, 115, 155, 195, 235]).astype(np.uint32)
+"""Lookup table of the nearest color cube level for each channel value."""
+
+
+def _pack_colors(colors: NDArray[np.uint8]) -> NDArray[np.uint32]:
+    """Pack an array of RGB colors into 24-bit integers."""
+    return (
+        colors[..., 0].astype(np.uint32) << 16
+        | colors[..., 1].astype(np.uint32) << 8
+        | colors[..., 2]
+    )
+
+
+def _quantize(
+    colors: NDArray[np.uint32], color_depth: ColorDepth
+) -> NDArray[np.uint32]:
+    """Quantize packed 24-bit colors to palette indices."""
+    rgb = np.stack([colors >> 16, colors >> 8 & 0xFF, colors & 0xFF], axis=-1)
+    rgb = rgb.astype(np.int32)
+
+    if color_depth == "16color":
+        distances = ((rgb[:, None] - _ANSI_COLORS) ** 2).sum(axis=-1)
+        return distances.argmin(axis=-1).astype(np.uint32)
+
+    # Indices 16-231 of the 256-color palette are a 6x6x6 color cube and indices
+    # 232-255 a grayscale ramp from 8 to 238. Indices 0-15 are skipped as terminals
+    # often customize them. Whichever of the nearest cube color or nearest gray is
+    # closer is chosen.
+    cube = _CUBE_INDICES[rgb]
+    cube_distances = ((_CUBE_LEVELS[cube] - rgb) ** 2).sum(axis=-1)
+    grays = np.clip((rgb.sum(axis=-1) // 3 - 3) // 10, 0, 23)
+    gray_distances = ((8 + 10 * grays[:, None] - rgb) ** 2).sum(axis=-1)
+    return np.where(
+        gray_distances < cube_distances,
+        232 + grays,
+        16 + 36 * cube[:, 0] + 6 * cube[:, 1] + cube[:, 2],
+    ).astype(np.uint32)
+
+
+def _color_keys(
+    colors: NDArray[np.uint8], color_depth: ColorDepth
+) -> NDArray[np.uint32]:
+    """
+    Return packed 24-bit colors for truecolor output or palette indices otherwise.
+
+    Colors are quantized once per unique color.
+    """
+    packed = _pack_colors(colors)
+    if color_depth == "truecolor":
+        return packed
+    unique_colors, inverse = np.unique(packed, return_inverse=True)
+    return _quantize(unique_colors, color_depth)[inverse]
+
+
+@cache
+def _palette_params(foreground: bool, color_depth: ColorDepth) -> NDArray[np.object_]:
+    """Return a lookup table of SGR parameters that set a palette color."""
+    if color_depth == "256color":
+        prefix = "38;5;" if foreground else "48;5;"
+        return np.array([f"{prefix}{i}" for i in range(256)], object)
+
+    # Normal colors are set with 30-37 (40-47 for background) and bright colors with
+    # 90-97 (100-107 for background).
+    normal, bright = (30, 90) if foreground else (40, 100)
+    return np.array(
+        [str(normal + i) for i in range(8)] + [str(bright + i) for i in range(8)],
+        object,
+    )
+
+
+def _color_params(
+    keys: NDArray[np.uint32], foreground: bool, color_depth: ColorDepth
+) -> NDArray[np.object_]:
+    """
+    Return SGR parameters that set colors from keys returned by :func:`_color_keys`.
+
+    Parameters for 24-bit colors are generated once per unique color.
+    """
+    if color_depth != "truecolor":
+        return _palette_params(foreground, color_depth)[keys]
+
+    unique_colors, inverse = np.unique(keys, return_inverse=True)
+    params = (
+        ("38;2;" if foreground else "48;2;")
+        + _DECIMALS[unique_colors >> 16]
+        + ";"
+        + _DECIMALS[unique_colors >> 8 & 0xFF]
+        + ";"
+        + _DECIMALS[unique_colors & 0xFF]
+    )
+    return params[inverse]
+
+
+@cache
+def _cursor_tables(
+    h: int, w: int
+) -> tuple[NDArray[np.object_], NDArray[np.object_], NDArray[np.object_]]:
+    """
+    Return lookup tables of cursor movement escapes for a canvas of size ``(h, w)``.
+
+    The tables are, in order, the start of a cursor position escape for each row, the
+    end of a cursor position escape for each column, and a cursor down escape for
+    each vertical distance (the escape for a distance of 0 is empty).
+    """
+    rows = np.array([f"\x1b[{y + 1};" for y in range(h)], object)
+    columns = np.array([f"{x + 1}H" for x in range(w)], object)
+    downs = np.array(["", *(f"\x1b[{dy}B" for dy in range(1, h + 1))], object)
+    return rows, columns, downs
+
+
+@cache
+def _column_table(w: int) -> NDArray[np.object_]:
+    """Return a lookup table of cursor horizontal absolute escapes for each column."""
+    return np.array([f"\x1b[{x + 1}G" for x in range(w)], object)
+
+
+def _encode_cells(
+    planes: CellPlanes,
+    ys: NDArray[np.intp],
+    xs: NDArray[np.intp],
+    inline: bool,
+    color_depth: ColorDepth,
+) -> str:
+    """
+    Encode cells of a canvas at the given (row-major ordered) indices into a string of
+    escapes.
+
+    The encoder tracks the terminal's cursor and attribute state: cursor movement is
+    skipped for contiguous cells and SGR escapes only set the attributes that changed
+    since the last painted cell. Escapes are built in bulk with NumPy.
+    """
+    h, w = planes.shape
+    codepoints = planes.codepoints
+    cell_codepoints = codepoints[ys, xs]
+    xs = xs.copy()
+    # Cells painted as whitespace instead of their character.
+    blank = np.zeros(len(ys), bool)
+
+    # The following ensures full-width glyphs "have enough room" else they are not
+    # painted.
+    is_empty = cell_codepoints == 0
+    # `""` is used to indicate the character before it is a full-width character. If
+    # this char is appearing in the diffs, we probably need to repaint the full-width
+    # character before it, but if the character before it isn't full-width paint
+    # whitespace instead.
+    empty = is_empty.nonzero()[0]
+    if len(empty) > 0:
+        empty_ys = ys[empty]
+        empty_xs = xs[empty]
+        follows_wide = (empty_xs > 0) & (
+            _codepoint_widths(codepoints[empty_ys, empty_xs - 1]) == 2
+        )
+        repaint = empty[follows_wide]
+        xs[repaint] -= 1
+        blank[empty[~follows_wide]] = True
+
+    # If a character is full-width, but the following character isn't `""`, assume
+    # the full-width character is being clipped, and paint whitespace instead.
+    maybe_clipped = (~is_empty & (xs + 1 < w)).nonzero()[0]
+    if len(maybe_clipped) > 0:
+        clipped = (codepoints[ys[maybe_clipped], xs[maybe_clipped] + 1] != 0) & (
+            _codepoint_widths(cell_codepoints[maybe_clipped]) == 2
+        )
+        blank[maybe_clipped[clipped]] = True
+
+    # Repainting full-width characters may have duplicated some positions.
+    positions = ys * w + xs
+    is_first = np.ones(len(positions), bool)
+    is_first[1:] = positions[1:] != positions[:-1]
+    ys = ys[is_first]
+    xs = xs[is_first]
+    blank = blank[is_first]
+    cell_chars = np.where(blank, " ", planes.chars[ys, xs])
+    widths = np.where(blank, 1, _codepoint_widths(codepoints[ys, xs]))
+    ncells = len(ys)
+
+    # The cursor advances by the width of each painted character, so no cursor
+    # movement is needed for a cell immediately following the last painted cell.
+    same_row = np.zeros(ncells, bool)
+    same_row[1:] = ys[1:] == ys[:-1]
+    contiguous = np.zeros(ncells, bool)
+    contiguous[1:] = same_row[1:] & (xs[1:] == xs[:-1] + widths[:-1])
+    jumps = ~contiguous
+
+    rows, columns, downs = _cursor_tables(h, w)
+    moves = np.full(ncells, "", object)
+    if inline:
+        # Note that `ys` are non-decreasing. Move down rows as needed, then move to
+        # column `x + 1`.
+        dys = np.diff(ys, prepend=0)
+        moves[jumps] = downs[dys[jumps]] + _column_table(w)[xs[jumps]]
+    else:
+        # Move to column `x + 1` if cursor is on the right row else move cursor to
+        # position `(y + 1, x + 1)`.
+        horizontal = jumps & same_row
+        moves[horizontal] = _column_table(w)[xs[horizontal]]
+        absolute = jumps & ~same_row
+        moves[absolute] = rows[ys[absolute]] + columns[xs[absolute]]
+
+    # The first cell resets all attributes. Afterwards, only attributes that differ
+    # from the last painted cell are set.
+    styles = planes.styles[ys, xs]
+    fgs = _color_keys(planes.fg_color[ys, xs], color_depth)
+    bgs = _color_keys(planes.bg_color[ys, xs], color_depth)
+    set_style = np.ones(ncells, bool)
+    set_style[1:] = styles[1:] != styles[:-1]
+    set_fg = np.ones(ncells, bool)
+    set_fg[1:] = fgs[1:] != fgs[:-1]
+    set_bg = np.ones(ncells, bool)
+    set_bg[1:] = bgs[1:] != bgs[:-1]
+
+    transitions = np.empty(ncells, np.intp)
+    transitions[0] = styles[0]
+    transitions[1:] = styles[:-1].astype(np.intp) << 5 | styles[1:]
+    style_params = np.where(
+        set_fg & set_bg, _STYLE_RESETS[transitions], _STYLE_DELTAS[transitions]
+    )
+    style_params[0] = _style_reset(styles[0])
+
+    params = np.full(ncells, "", object)
+    has_params = np.zeros(ncells, bool)
+    for is_set, values in (
+        (set_style, style_params[set_style]),
+        (set_fg, _color_params(fgs[set_fg], True, color_depth)),
+        (set_bg, _color_params(bgs[set_bg], False, color_depth)),
+    ):
+        params[is_set] += _SEPARATORS[has_params[is_set].view(np.uint8)] + values
+        has_params |= is_set
+
+    sgrs = np.full(ncells, "", object)
+    sgrs[has_params] = "\x1b[" + params[has_params] + "m"
+
+    return "".join(
+        np.column_stack((moves, sgrs, cell_chars.astype(object))).ravel().tolist()
+    )
+
+
+def _changed_rows(planes: CellPlanes, last_planes: CellPlanes) -> NDArray[np.bool_]:
+    """
+    Return whether each row differs between planes.
+
+    Rows of each plane are compared as packed 64-bit words (with any remaining bytes
+    compared individually), so unchanged rows cost a few word comparisons instead of a
+    comparison of every field of every cell.
+    """
+    h = planes.shape[0]
+    changed = np.zeros(h, bool)
+    for plane, last_plane in (
+        (planes.codepoints, last_planes.codepoints),
+        (planes.styles, last_planes.styles),
+        (planes.fg_color, last_planes.fg_color),
+        (planes.bg_color, last_planes.bg_color),
+    ):
+        rows = plane.reshape(h, -1).view(np.uint8)
+        last_rows = last_plane.reshape(h, -1).view(np.uint8)
+        nwords = rows.shape[1] // 8 * 8
+        changed |= (
+            rows[:, :nwords].view(np.uint64) != last_rows[:, :nwords].view(np.uint64)
+        ).any(axis=1)
+        if nwords < rows.shape[1]:
+            changed |= (rows[:, nwords:] != last_rows[:, nwords:]).any(axis=1)
+    return changed
+
+
+def _changed_spans(
+    planes: CellPlanes,
+    last_planes: CellPlanes,
+    changed_rows: NDArray[np.bool_] | None = None,
+) -> tuple[NDArray[np.intp], NDArray[np.intp], NDArray[np.intp]]:
+    """
+    Return the rows, starts and (exclusive) stops of the (row-major ordered) runs of
+    cells that differ between planes.
+
+    Cells are only compared in rows found to differ by :func:`_changed_rows` (or in
+    `changed_rows` if given).
+    """
+    if changed_rows is None:
+        changed_rows = _changed_rows(planes, last_planes)
+    rows = changed_rows.nonzero()[0]
+    w = planes.shape[1]
+    changed = np.zeros((len(rows), w + 2), np.int8)
+    if len(rows) > 0:
+        cells = changed[:, 1:-1].view(bool)
+        cells |= planes.codepoints[rows] != last_planes.codepoints[rows]
+        cells |= planes.styles[rows] != last_planes.styles[rows]
+        cells |= (planes.fg_color[rows] != last_planes.fg_color[rows]).any(axis=-1)
+        cells |= (planes.bg_color[rows] != last_planes.bg_color[rows]).any(axis=-1)
+
+    # Runs start where the padded change mask rises and stop where it falls.
+    edges = np.diff(changed, axis=1)
+    span_rows, starts = (edges == 1).nonzero()
+    stops = (edges == -1).nonzero()[1]
+    return rows[span_rows], starts, stops
+
+
+def _span_cells(
+    ys: NDArray[np.intp], starts: NDArray[np.intp], stops: NDArray[np.intp]
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Return the (row-major ordered) indices of cells in spans."""
+    lengths = stops - starts
+    offsets = np.cumsum(lengths) - lengths
+    xs = np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)
+    return np.repeat(ys, lengths), xs
+
+
+_HASH_WEIGHTS = np.random.default_rng(0).integers(0, 2**64, 1 << 12, np.uint64) | 1
+"""Random odd multipliers for hashing rows of 64-bit words."""
+
+
+def _row_hashes(planes: CellPlanes) -> NDArray[np.uint64]:
+    """Return a 64-bit hash of each row of planes."""
+    h = planes.shape[0]
+    rows = np.concatenate(
+        [
+            planes.codepoints.reshape(h, -1).view(np.uint8),
+            planes.styles.reshape(h, -1),
+            planes.fg_color.reshape(h, -1),
+            planes.bg_color.reshape(h, -1),
+        ],
+        axis=1,
+    )
+    nbytes = -(-rows.shape[1] // 8) * 8
+    words = np.zeros((h, nbytes), np.uint8)
+    words[:, : rows.shape[1]] = rows
+    words = words.view(np.uint64)
+    weights = np.resize(_HASH_WEIGHTS, words.shape[1])
+    # Products and sums wrap around, making this a multiplicative hash of each row.
+    return (words * weights).sum(axis=1, dtype=np.uint64)
+
+
+def _find_scroll(
+    planes: CellPlanes, last_planes: CellPlanes, changed: NDArray[np.bool_]
+) -> tuple[int, int, int] | None:
+    """
+    Find a block of rows of `last_planes` that moved vertically in `planes`.
+
+    `changed` is whether each row differs between planes. Returns ``(top, bottom,
+    shift)`` if scrolling rows ``top`` to ``bottom`` (exclusive) of the terminal up by
+    ``shift`` rows (down if ``shift`` is negative) saves repainting rows, else
+    ``None``.
+    """
+    if changed.sum() < 2:
+        return None
+
+    hashes = _row_hashes(planes)
+    last_hashes = _row_hashes(last_planes)
+
+    # Each changed row whose contents appear exactly once in the last frame votes for
+    # a shift.
+    unique_hashes, first, counts = np.unique(
+        last_hashes, return_index=True, return_counts=True
+    )
+    changed_rows = changed.nonzero()[0]
+    i = np.searchsorted(unique_hashes, hashes[changed_rows]).clip(
+        max=len(unique_hashes) - 1
+    )
+    votes = (unique_hashes[i] == hashes[changed_rows]) & (counts[i] == 1)
+    shifts = first[i[votes]] - changed_rows[votes]
+    shifts = shifts[shifts != 0]
+    if len(shifts) == 0:
+        return None
+    values, nvotes = np.unique(shifts, return_counts=True)
+    shift = int(values[nvotes.argmax()])
+
+    # Rows `y` where `planes[y] == last_planes[y + shift]` (for rows `y` for which
+    # `y + shift` is a row).
+    h = planes.shape[0]
+    lo, hi = max(0, -shift), min(h, h - shift)
+    matched = np.zeros(h + 2, np.int8)
+    matched[lo + 1 : hi + 1] = hashes[lo:hi] == last_hashes[lo + shift : hi + shift]
+    edges = np.diff(matched)
+    starts = (edges == 1).nonzero()[0]
+    stops = (edges == -1).nonzero()[0]
+
+    # Choose the run of matched rows that saves the most repainted rows. Rows exposed
+    # by the scroll must be repainted.
+    cumulative_changed = np.concatenate([[0], np.cumsum(changed)])
+    if shift > 0:
+        exposed_starts, exposed_stops = stops, stops + shift
+    else:
+        exposed_starts, exposed_stops = starts + shift, starts
+    saved = (cumulative_changed[stops] - cumulative_changed[starts]) - (
+        (exposed_stops - exposed_starts)
+        - (cumulative_changed[exposed_stops] - cumulative_changed[exposed_starts])
+    )
+    best = saved.argmax()
+    if saved[best] <= 0:
+        return None
+
+    start, stop = int(starts[best]), int(stops[best])
+    # Rule out hash collisions.
+    src = slice(start + shift, stop + shift)
+    dst = slice(start, stop)
+    if not (
+        np.array_equal(planes.codepoints[dst], last_planes.codepoints[src])
+        and np.array_equal(planes.styles[dst], last_planes.styles[src])
+        and np.array_equal(planes.fg_color[dst], last_planes.fg_color[src])
+        and np.array_equal(planes.bg_color[dst], last_planes.bg_color[src])
+    ):
+        return None
+
+    if shift > 0:
+        return start, stop + shift, shift
+    return start + shift, stop, shift
+
+
+def _scroll_planes(planes: CellPlanes, top: int, bottom: int, shift: int) -> CellPlanes:
+    """
+    Return a copy of planes with rows ``top`` to ``bottom`` (exclusive) scrolled up by
+    ``shift`` rows (down if ``shift`` is negative).
+
+    Exposed rows are filled with an invalid codepoint so that they differ from any
+    frame.
+    """
+    scrolled = planes.copy()
+    if shift > 0:
+        src, dst, exposed = (
+            slice(top + shift, bottom),
+            slice(top, bottom - shift),
+            slice(bottom - shift, bottom),
+        )
+    else:
+        src, dst, exposed = (
+            slice(top, bottom + shift),
+            slice(top - shift, bottom),
+            slice(top, top - shift),
+        )
+    for plane, scrolled_plane in (
+        (planes.codepoints, scrolled.codepoints),
+        (planes.styles, scrolled.styles),
+        (planes.fg_color, scrolled.fg_color),
+        (planes.bg_color, scrolled.bg_color),
+    ):
+        scrolled_plane[dst] = plane[src]
+    scrolled.codepoints[exposed] = 0xFFFFFFFF
+    return scrolled
+
+
+def _scroll_escapes(top: int, bottom: int, shift: int) -> str:
+    """
+    Return escapes that scroll rows ``top`` to ``bottom`` (exclusive) of the terminal
+    up by ``shift`` rows (down if ``shift`` is negative).
+
+    A scroll region is set and lines are deleted (or inserted) at its top, then the
+    scroll region is reset. Both move the cursor.
+    """
+    if shift > 0:
+        lines = f"\x1b[{shift}M"
+    else:
+        lines = f"\x1b[{-shift}L"
+    return f"\x1b[{top + 1};{bottom}r\x1b[{top + 1};1H{lines}\x1b[r"
+
+
+def _write_frame(
+    terminal: Vt100Terminal,
+    planes: CellPlanes,
+    last_planes: CellPlanes | None,
+    color_depth: ColorDepth,
+    stats: FrameStats | None = None,
+    defer: Callable[..., None] | None = None,
+    reset_inline_rows: bool = False,
+) -> None:
+    """
+    Write the difference between `planes` and `last_planes` to a terminal. If
+    `last_planes` is ``None``, all of `planes` is written. If `stats` is given, the
+    time spent in each stage and the bytes written are recorded in it.
+
+    If the frame is written from a thread other than the input parser's, `defer` is
+    given and called with a function and its arguments to update terminal state
+    shared with the input parser on the input parser's thread.
+
+    If `reset_inline_rows` is true, lines below the inline origin are fed again, e.g.,
+    because the terminal was resized. Inline state is only changed by the thread that
+    writes frames.
+
+    The frame is added to the terminal's output buffer as a single string so that it
+    isn't interleaved with output from other threads. If the terminal supports
+    synchronized updates, the frame is wrapped in them so that it's presented
+    atomically.
+
+    Inline frames are rendered below an origin, the terminal's last cursor position
+    response. Lines are only fed below the origin as the frame grows taller than the
+    lines already fed. Feeding lines may scroll the terminal, so the new origin is
+    predicted and frames continue to render at the predicted origin while a cursor
+    position report is pending. If the report corrects the origin, the next frame is
+    fully repainted at the corrected origin. A report is requested within the frame,
+    so the frame is still written with a single flush.
+    """
+    h, w = planes.shape
+    inline = not terminal.in_alternate_screen
+    scroll = None
+    start = perf_counter()
+
+    if reset_inline_rows:
+        terminal._inline_rows = 0
+
+    if not inline:
+        terminal._inline_origin = None
+    elif terminal.last_cursor_position_response != terminal._inline_origin:
+        # Origin was corrected by a cursor position report (or nothing was rendered
+        # inline yet). Repaint the whole frame and confirm the lines below it.
+        terminal._inline_rows = 0
+        last_planes = None
+
+    if last_planes is not None:
+        # If rows moved vertically, e.g., scrolling content, scroll them in the
+        # terminal and diff against the scrolled last frame.
+        changed = _changed_rows(planes, last_planes)
+        scroll = _find_scroll(planes, last_planes, changed)
+        if scroll is not None:
+            last_planes = _scroll_planes(last_planes, *scroll)
+            changed = _changed_rows(planes, last_planes)
+        ys, starts, stops = _changed_spans(planes, last_planes, changed)
+        if len(ys) == 0:
+            # Nothing to render, but flush any other pending output.
+            _flush(terminal, stats, start)
+            return
+        ys, xs = _span_cells(ys, starts, stops)
+
+    synchronized = terminal.supports_synchronized_update
+    # Save cursor
+    out = [BEGIN_SYNCHRONIZED_UPDATE, "\x1b7"] if synchronized else ["\x1b7"]
+    if inline:
+        y, x = terminal.last_cursor_position_response
+        out.append(f"\x1b[{y + 1};{x + 1}H")
+        if scroll is not None:
+            top, bottom, shift = scroll
+            out.append(_scroll_escapes(top + y, bottom + y, shift))
+            out.append(f"\x1b[{y + 1};{x + 1}H")
+    elif scroll is not None:
+        out.append(_scroll_escapes(*scroll))
+
+    if last_planes is None:
+        ys, xs = np.indices((h, w)).reshape(2, h * w)
+        if inline:
+            y, x = _feed_inline_rows(terminal, h, y, x, out, defer)
+            # Erase any stale lines below the frame, then return to origin.
+            out.append(f"\x1b[{y + h + 1};1H\x1b[0J\x1b[{y + 1};{x + 1}H")
+
+    if stats is not None:
+        encode_start = perf_counter()
+        stats.diff = encode_start - start
+    if len(ys) > 0:
+        out.append(_encode_cells(planes, ys, xs, inline, color_depth))
+
+    # Restore cursor
+    out.append("\x1b8")
+    if inline:
+        # The cursor rests at the origin so that a cursor position report finds the
+        # origin if the terminal reflows lines, e.g., when resized.
+        out.append(f"\x1b[{y + 1};{x + 1}H")
+        terminal._inline_origin = Point(y, x)
+    if synchronized:
+        out.append(END_SYNCHRONIZED_UPDATE)
+    terminal._out_buffer.append("".join(out))
+    if stats is not None:
+        stats.encode = perf_counter() - encode_start
+    _flush(terminal, stats)
+
+
+def _feed_inline_rows(
+    terminal: Vt100Terminal,
+    h: int,
+    y: int,
+    x: int,
+    out: list[str],
+    defer: Callable[..., None] | None,
+) -> tuple[int, int]:
+    """
+    Feed lines so that an inline frame of height `h` fits below the origin
+    ``(y, x)`` and return the new origin.
+
+    Only lines that weren't already fed are fed. If any are, the terminal scrolls
+    if they don't fit, so the new origin is predicted from the terminal's height
+    and, if no report is pending, a cursor position report is requested to confirm
+    it. The request is added to `out` and the input parser is told of it with
+    `defer`, if given.
+    """
+    rows = terminal._inline_rows
+    if rows >= h:
+        return y, x
+
+    if rows > 0:
+        out.append(f"\x1b[{rows}B")
+    # Feed lines, then move cursor back up to the first column of the new origin.
+    out.append("\x0a" * (h - rows) + f"\x1b[{h}F")
+    terminal._inline_rows = h
+    height, _ = terminal.get_size()
+    origin = Point(max(0, min(y, height - 1 - h)), 0)
+    requested = not terminal._expect_device_status_report
+    if requested:
+        out.append(DEVICE_STATUS_REPORT)
+    if defer is None:
+        _predict_origin(terminal, origin, requested)
+    else:
+        defer(_predict_origin, terminal, origin, requested)
+    return origin
+
+
+def _predict_origin(terminal: Vt100Terminal, origin: Point, requested: bool) -> None:
+    """
+    Set the terminal's last cursor position response to a predicted inline origin.
+    If `requested`, a cursor position report confirming it was requested.
+    """
+    if requested:
+        terminal._expect_cursor_position_report(origin)
+    elif terminal._expect_device_status_report:
+        # Pending report will correct the origin by how far off its own
+        # prediction was.
+        terminal.last_cursor_position_response = origin
+    # Otherwise, the pending report was received since the origin was predicted.
+    # The reported origin differs from the rendered origin, so the next frame is
+    # repainted at the reported origin.
+
+
+def _flush(
+    terminal: Vt100Terminal, stats: FrameStats | None, diff_start: float | None = None
+) -> None:
+    """
+    Flush terminal output. If `stats` is given, record flush time and bytes written
+    and, if `diff_start` is given, the time spent diffing since then.
+    """
+    if stats is None:
+        terminal.flush()
+        return
+
+    start = perf_counter()
+    if diff_start is not None:
+        stats.diff = start - diff_start
+    bytes_written = terminal.bytes_written
+    terminal.flush()
+    stats.flush = perf_counter() - start
+    stats.bytes_written = terminal.bytes_written - bytes_written
+
 
+def _origin_unknown(terminal: Vt100Terminal) -> bool:
+    """
+    Return whether a cursor position report is pending and the cursor position
+    wasn't predicted. Inline frames can't be rendered until the report is received.
+    """
+    return (
+        terminal._expect_device_status_report
+        and terminal._expected_cursor_position is None
+    )
 
-def render_root(root: _Root, terminal: Vt100Terminal) -> None:
+
+def render_root(
+    root: _Root, terminal: Vt100Terminal, color_depth: ColorDepth = "truecolor"
+) -> None:
     """
     Render root canvas into a terminal.
 
+    The frame is skipped if the terminal is behind. Since frames are diffed against
+    the last written frame, the next written frame includes the skipped changes.
+
     Parameters
     ----------
     root : _Root
         Root gadget of gadget tree.
     terminal : Vt100Terminal
         A VT100 terminal.
+    color_depth : ColorDepth, default: "truecolor"
+        Color depth of terminal output.
     """
-    if terminal._expect_device_status_report:
+    stats, root._frame_stats = root._frame_stats, None
+    if terminal.is_behind or _origin_unknown(terminal):
+        if stats is not None:
+            stats.dropped = True
+            root._profiler.end_frame(stats)
         return
 
-    canvas = root.canvas
-    h, w = root.size
-    write = terminal._out_buffer.append
-    inline = not terminal.in_alternate_screen
-    last_y = 0
+    planes = CellPlanes.from_cells(root.canvas)
+    last_planes = root._last_planes
+    if root._resized or last_planes is None or last_planes.shape != planes.shape:
+        root._resized = False
+        last_planes = None
+    reset_inline_rows, root._reset_inline_rows = root._reset_inline_rows, False
+    _write_frame(
+        terminal,
+        planes,
+        last_planes,
+        color_depth,
+        stats,
+        reset_inline_rows=reset_inline_rows,
+    )
+    root._last_planes = planes
+    if stats is not None:
+        root._profiler.end_frame(stats)
 
-    # Save cursor
-    write("\x1b7")
-    if inline:
-        terminal.move_cursor()
 
-    if root._resized:
-        root._resized = False
-        ys, xs = np.indices((h, w)).reshape(2, h * w)
-        if inline:
-            terminal.erase_in_display()
-            # Feed lines to ensure enough render height.
-            write("\x0a" * root.height)
-            # Move cursor back up.
-            write(f"\x1b[{root.height}F")
-            # If terminal scrolled when lines were fed, cursor origin would've changed,
-            # so request a cpr.
-            terminal.request_cursor_position_report()
-    else:
-        diffs = root._last_canvas != canvas
-        ys, xs = diffs.nonzero()
-
-    for y, x, cell in zip(ys, xs, canvas[ys, xs]):
-        (
-            char,
-            bold,
-            italic,
-            underline,
-            strikethrough,
-            overline,
-            (fr, fg, fb),  # foreground color
-            (br, bg, bb),  # background color
-        ) = cell.item()
-
-        # The following conditions ensure full-width glyphs "have enough room" else
-        # they are not painted.
-        if char == "":
-            # `""` is used to indicate the character before it is a full-width
-            # character. If this char is appearing in the diffs, we probably need to
-            # repaint the full-width character before it, but if the character
-            # before it isn't full-width paint whitespace instead.
-            if x > 0 and char_width(canvas["char"][y, x - 1].item()) == 2:
-                x -= 1
-                (
-                    char,
-                    bold,
-                    italic,
-                    underline,
-                    strikethrough,
-                    overline,
-                    (fr, fg, fb),
-                    (br, bg, bb),
-                ) = canvas[y, x].item()
-            else:
-                char = " "
-        elif (
-            x + 1 < w
-            and canvas["char"][y, x + 1].item() != ""
-            and char_width(char) == 2
-        ):
-            # If the character is full-width, but the following character isn't
-            # `""`, assume the full-width character is being clipped, and paint
-            # whitespace instead.
-            char = " "
+class FrameWriter:
+    """
+    Encode and write frames to a terminal on a dedicated thread.
 
-        if inline:
-            # Note that `y`s are non-decreasing.
-            if last_y < y:
-                # Move down `y - last_y` rows.
-                write(f"\x1b[{y - last_y}B")
-            # Move to column `x + 1`.
-            write(f"\x1b[{x + 1}G")
-        else:
-            # Move cursor to position `(y + 1, x + 1)`.
-            write(f"\x1b[{y + 1};{x + 1}H")
-        last_y = y
-
-        write(
-            "\x1b[0;"  # Reset attributes.
-            f"{'1;' if bold else ''}"
-            f"{'3;' if italic else ''}"
-            f"{'4;' if underline else ''}"
-            f"{'9;' if strikethrough else ''}"
-            f"{'53;' if overline else ''}"
-            f"38;2;{fr};{fg};{fb};48;2;{br};{bg};{bb}m"  # Set color pair.
-            f"{char}"
-        )
-    # Restore cursor
-    write("\x1b8")
-    terminal.flush()
+    Frames are submitted as snapshots of the root canvas. Each written frame is diffed
+    against the last written frame, so if the writer falls behind, waiting frames can
+    be dropped in favor of newer frames without losing any changes. Frames also wait
+    while the terminal is behind.
+
+    If started from an event loop, terminal state shared with the input parser (such
+    as requested cursor position reports) is updated on the event loop's thread. If
+    writing a frame raises an exception, the writer thread stops and the exception is
+    passed to `on_error` on the event loop's thread and raised by the next call to
+    :meth:`submit`.
+
+    Parameters
+    ----------
+    terminal : Vt100Terminal
+        A VT100 terminal.
+    color_depth : ColorDepth, default: "truecolor"
+        Color depth of terminal output.
+    max_queued : int, default: 1
+        Max number of frames waiting to be written. If a frame is submitted while the
+        queue is full, the oldest waiting frame is dropped.
+    profiler : FrameProfiler | None, default: None
+        If given, records the timings of submitted frames.
+    on_error : Callable[[Exception], None] | None, default: None
+        If given, called on the event loop's thread with an exception raised writing
+        a frame.
+
+    Attributes
+    ----------
+    terminal : Vt100Terminal
+        A VT100 terminal.
+    color_depth : ColorDepth
+        Color depth of terminal output.
+    max_queued : int
+        Max number of frames waiting to be written.
+    profiler : FrameProfiler | None
+        If given, records the timings of submitted frames.
+    on_error : Callable[[Exception], None] | None
+        If given, called on the event loop's thread with an exception raised writing
+        a frame.
+    frames_submitted : int
+        Number of frames submitted.
+    frames_written : int
+        Number of frames written.
+    frames_dropped : int
+        Number of frames dropped because the writer fell behind.
+    queued : int
+        Number of frames waiting to be written.
+    is_running : bool
+        Whether writer thread is running.
+
+    Methods
+    -------
+    start()
+        Start writer thread.
+    stop()
+        Write any waiting frames then stop writer thread.
+    submit(root)
+        Submit a snapshot of the root canvas to be written.
+    """
+
+    def __init__(
+        self,
+        terminal: Vt100Terminal,
+        color_depth: ColorDepth = "truecolor",
+        max_queued: int = 1,
+        profiler: FrameProfiler | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ):
+        self.terminal = terminal
+        """A VT100 terminal."""
+        self.color_depth = color_depth
+        """Color depth of terminal output."""
+        self.max_queued = max_queued
+        """Max number of frames waiting to be written."""
+        self.profiler = profiler
+        """If given, records the timings of submitted frames."""
+        self.on_error = on_error
+        """
+        If given, called on the event loop's thread with an exception raised writing a
+        frame.
+        """
+        self.frames_submitted: int = 0
+        """Number of frames submitted."""
+        self.frames_written: int = 0
+        """Number of frames written."""
+        self.frames_dropped: int = 0
+        """Number of frames dropped because the writer fell behind."""
+
+        self._queue: deque[tuple[NDArray[Cell], FrameStats | None]] = deque()
+        """Frames (and their stats if profiled) waiting to be written."""
+        self._repaint: bool = True
+        """Whether the next written frame must repaint every cell."""
+        self._reset_inline_rows: bool = False
+        """Whether the next written frame must feed lines below the inline origin."""
+        self._last_planes: CellPlanes | None = None
+        """Last frame written."""
+        self._condition = Condition()
+        """Signals writer thread that frames are waiting or that it should stop."""
+        self._thread: Thread | None = None
+        """Writer thread."""
+        self._stopping: bool = False
+        """Whether writer thread should stop."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        """Event loop of the input parser if writer was started from one."""
+        self._deferred: int = 0
+        """Number of terminal updates waiting to be run on the event loop."""
+        self._error: Exception | None = None
+        """Exception that stopped the writer thread."""
+
+    @property
+    def queued(self) -> int:
+        """Number of frames waiting to be written."""
+        return len(self._queue)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether writer thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start writer thread."""
+        if self.is_running:
+            return
+
+        self._stopping = False
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self._thread = Thread(target=self._run, name="FrameWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Write any waiting frames then stop writer thread.
+
+        Waiting frames are written even if the terminal is behind. If inline frames
+        are waiting for the cursor position, they can't be placed and are dropped.
+        """
+        if self._thread is None:
+            return
+
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join()
+        self._thread = None
+
+    def submit(self, root: _Root) -> None:
+        """
+        Submit a snapshot of the root canvas to be written.
+
+        Parameters
+        ----------
+        root : _Root
+            Root gadget of gadget tree.
+
+        Raises
+        ------
+        Exception
+            The exception that stopped the writer thread, if any.
+        """
+        if self._error is not None:
+            raise self._error
+
+        canvas = root.canvas.copy()
+        stats, root._frame_stats = root._frame_stats, None
+        with self._condition:
+            if root._resized:
+                root._resized = False
+                self._repaint = True
+            if root._reset_inline_rows:
+                root._reset_inline_rows = False
+                self._reset_inline_rows = True
+            if len(self._queue) >= self.max_queued:
+                _, dropped = self._queue.popleft()
+                self.frames_dropped += 1
+                if dropped is not None and self.profiler is not None:
+                    dropped.dropped = True
+                    self.profiler.end_frame(dropped)
+            self._queue.append((canvas, stats))
+            self.frames_submitted += 1
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """Write frames until stopped or until writing a frame raises an exception."""
+        try:
+            self._write_frames()
+        except Exception as error:
+            self._error = error
+            if self._loop is None:
+                raise
+            if self.on_error is not None:
+                self._loop.call_soon_threadsafe(self.on_error, error)
+
+    def _write_frames(self) -> None:
+        """Write frames until stopped."""
+        terminal = self.terminal
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._queue and not self._stopping:
+                    condition.wait()
+                if not self._queue:
+                    return
+                if self._stopping:
+                    # The event loop is waiting for the writer thread to stop, so
+                    # don't wait for the terminal or terminal updates.
+                    if _origin_unknown(terminal) or self._deferred > 0:
+                        self._drop_queued()
+                        return
+                elif (
+                    terminal.is_behind
+                    or _origin_unknown(terminal)
+                    or self._deferred > 0
+                ):
+                    # Wait until the terminal catches up or, if the cursor position is
+                    # unknown, until the report is received. Also wait for terminal
+                    # updates from the last frame. Newer frames may replace this one
+                    # in the meantime.
+                    condition.wait(0.01)
+                    continue
+
+                canvas, stats = self._queue.popleft()
+                repaint = self._repaint
+                self._repaint = False
+                reset_inline_rows = self._reset_inline_rows
+                self._reset_inline_rows = False
+
+            if self.profiler is None:
+                stats = None
+            planes = CellPlanes.from_cells(canvas)
+            last_planes = self._last_planes
+            if repaint or last_planes is None or last_planes.shape != planes.shape:
+                last_planes = None
+            defer = None if self._loop is None else self._defer
+            _write_frame(
+                terminal,
+                planes,
+                last_planes,
+                self.color_depth,
+                stats,
+                defer,
+                reset_inline_rows,
+            )
+            self._last_planes = planes
+            self.frames_written += 1
+            if stats is not None:
+                self.profiler.end_frame(stats)
+
+    def _drop_queued(self) -> None:
+        """Drop all waiting frames."""
+        while self._queue:
+            _, stats = self._queue.popleft()
+            self.frames_dropped += 1
+            if stats is not None and self.profiler is not None:
+                stats.dropped = True
+                self.profiler.end_frame(stats)
+
+    def _defer(self, func: Callable[..., None], *args) -> None:
+        """Call ``func(*args)`` on the event loop's thread."""
+        with self._condition:
+            self._deferred += 1
+        self._loop.call_soon_threadsafe(self._run_deferred, func, *args)
+
+    def _run_deferred(self, func: Callable[..., None], *args) -> None:
+        """Call ``func(*args)`` and wake writer thread."""
+        try:
+            func(*args)
+        finally:
+            with self._condition:
+                self._deferred -= 1
+                self._condition.notify()
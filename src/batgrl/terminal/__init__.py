@@ -7,9 +7,18 @@ from contextlib import contextmanager
 from typing import ContextManager
 
 from .events import Event
+from .headless_terminal import HeadlessTerminal, VirtualClockEventLoop
+from .vt100_screen import Vt100Screen
 from .vt100_terminal import Vt100Terminal
 
-__all__ = ["Vt100Terminal", "get_platform_terminal", "app_mode"]
+__all__ = [
+    "HeadlessTerminal",
+    "VirtualClockEventLoop",
+    "Vt100Screen",
+    "Vt100Terminal",
+    "get_platform_terminal",
+    "app_mode",
+]
 
 
 def get_platform_terminal() -> Vt100Terminal:
@@ -0,0 +1,324 @@
+"""A VT100 terminal without a tty."""
+
+import asyncio
+import selectors
+from collections.abc import Callable, Iterable
+
+from ..geometry import Point, Size
+from .events import Event, ResizeEvent
+from .vt100_screen import Vt100Screen
+from .vt100_terminal import DEVICE_STATUS_REPORT, Vt100Terminal
+
+__all__ = ["HeadlessTerminal", "VirtualClockEventLoop"]
+
+
+class _VirtualClockSelector(selectors.DefaultSelector):
+    """A selector that advances a virtual clock instead of waiting."""
+
+    def __init__(self):
+        super().__init__()
+        self.loop: VirtualClockEventLoop | None = None
+        """Event loop whose clock is advanced."""
+
+    def select(self, timeout: float | None = None):
+        """
+        Poll for I/O events. If none are ready, advance the virtual clock by `timeout`
+        (but at least by the loop's tick) instead of waiting.
+        """
+        if timeout is None:
+            return super().select()
+
+        ready = super().select(0)
+        if not ready:
+            self.loop._virtual_time += max(timeout, self.loop.tick)
+        return ready
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """
+    An event loop with a virtual clock.
+
+    The clock advances by a fixed tick every iteration of the loop and, whenever the
+    loop would wait for its next scheduled callback, skips ahead to it instead. Sleeps
+    and timeouts take no time, while callbacks, including busy loops like tweens that
+    repeatedly ``await asyncio.sleep(0)``, run in the same order and at the same
+    (virtual) times on every run.
+
+    Parameters
+    ----------
+    tick : float, default: 0.001
+        Seconds the clock advances every iteration of the loop.
+
+    Attributes
+    ----------
+    tick : float
+        Seconds the clock advances every iteration of the loop.
+    """
+
+    def __init__(self, tick: float = 0.001):
+        selector = _VirtualClockSelector()
+        super().__init__(selector)
+        selector.loop = self
+        self.tick = tick
+        """Seconds the clock advances every iteration of the loop."""
+        self._virtual_time: float = 0.0
+        """Seconds since loop was created."""
+
+    def time(self) -> float:
+        """Return the virtual time of the loop."""
+        return self._virtual_time
+
+
+class HeadlessTerminal(Vt100Terminal):
+    """
+    A VT100 terminal without a tty.
+
+    Input is scripted and output is written to memory, so apps can run (e.g., to be
+    benchmarked or tested) in CI or containers without a pty. Run an app in a
+    headless terminal with ``app.run(terminal=HeadlessTerminal(...))``.
+
+    Parameters
+    ----------
+    size : Size, default: Size(24, 80)
+        Size of terminal.
+    script : Iterable[tuple[float, Event | str]], default: ()
+        Input played back once terminal is attached. Each item is a time in seconds
+        after attaching and either an input event or input data for the terminal's
+        input parser. End with a ctrl+c :class:`batgrl.terminal.events.KeyEvent` to
+        exit the app.
+    emulate_screen : bool, default: False
+        Whether to reconstruct the screen from output in :attr:`screen`.
+    virtual_clock : bool, default: False
+        Whether an app run in this terminal uses a :class:`VirtualClockEventLoop`. If
+        true, the app runs as fast as possible while scripted input, frames and
+        tweens happen at deterministic times. Otherwise, the app runs in real time.
+    record_output : bool, default: True
+        Whether to keep all output in :attr:`output`.
+    synchronized_update : bool, default: True
+        Whether terminal reports support for synchronized updates (DEC mode 2026).
+
+    Attributes
+    ----------
+    size : Size
+        Size of terminal.
+    script : list[tuple[float, Event | str]]
+        Input played back once terminal is attached.
+    screen : Vt100Screen | None
+        Screen reconstructed from output if ``emulate_screen`` is true.
+    virtual_clock : bool
+        Whether an app run in this terminal uses a :class:`VirtualClockEventLoop`.
+    record_output : bool
+        Whether to keep all output in :attr:`output`.
+    synchronized_update : bool
+        Whether terminal reports support for synchronized updates.
+    output : str
+        All output written to terminal if :attr:`record_output` is true.
+    in_alternate_screen : bool
+        Whether the alternate screen buffer is enabled.
+    last_cursor_position_response : Point
+        Last reported cursor position.
+    supports_synchronized_update : bool
+        Whether terminal reported support for synchronized updates (DEC mode 2026).
+    bytes_written : int
+        Total number of bytes written to the output stream.
+    pending_bytes : int
+        Number of flushed bytes not yet written because the output stream is full.
+    is_behind : bool
+        Whether the output stream can't keep up with flushed output.
+
+    Methods
+    -------
+    send(data)
+        Send input to terminal.
+    process_stdin()
+        Do nothing. Input is scripted or sent with :meth:`send`.
+    raw_mode()
+        Do nothing.
+    restore_console()
+        Do nothing.
+    attach()
+        Start generating events from scripted input.
+    unattach()
+        Stop generating events from scripted input.
+    events()
+        Return a list of input events and reset the event buffer.
+    get_size()
+        Get terminal size.
+    flush()
+        Write buffer to memory.
+    set_title(title)
+        Set terminal title.
+    enter_alternate_screen()
+        Enter alternate screen buffer.
+    exit_alternate_screen()
+        Exit alternate screen buffer.
+    enable_mouse_support()
+        Enable mouse support in terminal.
+    disable_mouse_support()
+        Disable mouse support in terminal.
+    reset_attributes()
+        Reset character attributes.
+    enable_bracketed_paste()
+        Enable bracketed paste in terminal.
+    disable_bracketed_paste()
+        Disable bracketed paste in terminal.
+    show_cursor()
+        Show cursor in terminal.
+    hide_cursor()
+        Hide cursor in terminal.
+    enable_reporting_focus()
+        Enable reporting terminal focus.
+    disable_reporting_focus()
+        Disable reporting terminal focus.
+    request_cursor_position_report(expected=None)
+        Report current cursor position.
+    request_synchronized_update_report()
+        Report whether terminal supports synchronized updates.
+    move_cursor(pos)
+        Move cursor to ``pos``.
+    erase_in_display(n)
+        Clear part of the screen.
+    """
+
+    def __init__(
+        self,
+        size: Size = Size(24, 80),
+        script: Iterable[tuple[float, Event | str]] = (),
+        emulate_screen: bool = False,
+        virtual_clock: bool = False,
+        record_output: bool = True,
+        synchronized_update: bool = True,
+    ):
+        super().__init__()
+        self.size = Size(*size)
+        """Size of terminal."""
+        self.script = list(script)
+        """Input played back once terminal is attached."""
+        self.screen: Vt100Screen | None = (
+            Vt100Screen(self.size) if emulate_screen else None
+        )
+        """Screen reconstructed from output if ``emulate_screen`` is true."""
+        self.virtual_clock = virtual_clock
+        """Whether an app run in this terminal uses a ``VirtualClockEventLoop``."""
+        self.record_output = record_output
+        """Whether to keep all output in :attr:`output`."""
+        self.synchronized_update = synchronized_update
+        """Whether terminal reports support for synchronized updates."""
+        self._output: list[str] = []
+        """Output written to terminal."""
+        self._script_handles: list[asyncio.TimerHandle] = []
+        """Handles of scheduled scripted input."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        """Event loop that reports are sent on while attached."""
+
+    @property
+    def output(self) -> str:
+        """All output written to terminal if :attr:`record_output` is true."""
+        output = "".join(self._output)
+        self._output = [output]
+        return output
+
+    def send(self, data: Event | str) -> None:
+        """
+        Send input to terminal.
+
+        Parameters
+        ----------
+        data : Event | str
+            An input event or input data for the terminal's input parser.
+        """
+        if isinstance(data, str):
+            self._feed(data)
+        else:
+            if isinstance(data, ResizeEvent):
+                self.size = Size(*data.size)
+                if self.screen is not None:
+                    self.screen.resize(self.size)
+            self._event_buffer.append(data)
+
+        if self._event_handler is not None:
+            self._event_handler(self.events())
+
+    def process_stdin(self) -> None:
+        """Do nothing. Input is scripted or sent with :meth:`send`."""
+
+    def raw_mode(self) -> None:
+        """Do nothing."""
+
+    def restore_console(self) -> None:
+        """Do nothing."""
+
+    def attach(self, event_handler: Callable[[list[Event]], None]) -> None:
+        """
+        Start generating events from scripted input.
+
+        Parameters
+        ----------
+        event_handler : Callable[[list[Event]], None]
+            Callable that handles input events.
+        """
+        self._event_buffer.clear()
+        self._event_handler = event_handler
+        self._loop = loop = asyncio.get_running_loop()
+        self._script_handles = [
+            loop.call_later(delay, self.send, data) for delay, data in self.script
+        ]
+
+    def unattach(self) -> None:
+        """Stop generating events from scripted input."""
+        self._event_handler = None
+        self._loop = None
+        for handle in self._script_handles:
+            handle.cancel()
+        self._script_handles.clear()
+
+    def get_size(self) -> Size:
+        """Get terminal size."""
+        return self.size
+
+    def _write(self, data: str) -> None:
+        """Write data to memory and report cursor position for any requests in it."""
+        self.bytes_written += len(data.encode(errors="replace"))
+        if self.record_output:
+            self._output.append(data)
+        *requested, rest = data.split(DEVICE_STATUS_REPORT)
+        for chunk in requested:
+            if self.screen is None:
+                # Report expected position, once it's known on the event loop.
+                self._report(None)
+            else:
+                self.screen.feed(chunk)
+                self._report(self._cursor_position_report(self.screen.cursor))
+        if self.screen is not None:
+            self.screen.feed(rest)
+
+    def request_synchronized_update_report(self):
+        """Report whether terminal supports synchronized updates."""
+        super().request_synchronized_update_report()
+        self._report(f"\x1b[?2026;{2 if self.synchronized_update else 0}$y")
+
+    def _report(self, report: str | None) -> None:
+        """
+        Send a report as input on the event loop, once control returns to it, or
+        immediately if not attached. If `report` is ``None``, the expected cursor
+        position is reported.
+        """
+        if self._loop is None:
+            self._send_report(report)
+        else:
+            # May be called from a non-event-loop thread (e.g., a frame writer).
+            self._loop.call_soon_threadsafe(self._send_report, report)
+
+    def _send_report(self, report: str | None) -> None:
+        """Send a report as input."""
+        if report is None:
+            report = self._cursor_position_report(
+                self._expected_cursor_position or Point(0, 0)
+            )
+        self.send(report)
+
+    @staticmethod
+    def _cursor_position_report(cursor: Point) -> str:
+        """Return a cursor position report."""
+        y, x = cursor
+        return f"\x1b[{y + 1};{x + 1}R"
@@ -14,6 +14,7 @@ from .events import Event, ResizeEvent
 from .vt100_terminal import Vt100Terminal
 
 STDIN: Final[int] = sys.stdin.fileno()
+STDOUT: Final[int] = sys.stdout.fileno()
 
 
 class LinuxTerminal(Vt100Terminal):
@@ -26,6 +27,14 @@ class LinuxTerminal(Vt100Terminal):
         Whether the alternate screen buffer is enabled.
     last_cursor_position_response : Point
         Last reported cursor position.
+    supports_synchronized_update : bool
+        Whether terminal reported support for synchronized updates (DEC mode 2026).
+    bytes_written : int
+        Total number of bytes written to the output stream.
+    pending_bytes : int
+        Number of flushed bytes not yet written because the output stream is full.
+    is_behind : bool
+        Whether the output stream can't keep up with flushed output.
 
     Methods
     -------
@@ -44,7 +53,7 @@ class LinuxTerminal(Vt100Terminal):
     get_size()
         Get terminal size.
     flush()
-        Write buffer to output stream and flush.
+        Write buffer to output stream without blocking once attached.
     set_title(title)
         Set terminal title.
     enter_alternate_screen()
@@ -69,14 +78,25 @@ class LinuxTerminal(Vt100Terminal):
         Enable reporting terminal focus.
     disable_reporting_focus()
         Disable reporting terminal focus.
-    request_cursor_position_report()
+    request_cursor_position_report(expected=None)
         Report current cursor position.
+    request_synchronized_update_report()
+        Report whether terminal supports synchronized updates.
     move_cursor(pos)
         Move cursor to ``pos``.
     erase_in_display(n)
         Clear part of the screen.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        """Event loop that writes pending bytes while attached."""
+        self._pending: bytearray = bytearray()
+        """Bytes waiting for tty to become writable."""
+        self._fd: int | None = None
+        """Non-blocking file descriptor of the tty written to while attached."""
+
     def process_stdin(self) -> None:
         """Read from stdin and feed data into input parser to generate events."""
         reads = []
@@ -128,6 +148,21 @@ class LinuxTerminal(Vt100Terminal):
         loop = asyncio.get_running_loop()
         loop.add_reader(STDIN, process)
 
+        # Write without blocking the event loop. Output the terminal can't accept
+        # yet is kept as pending bytes and written when the tty becomes writable.
+        # The tty is opened again so that stdout (which shares its open file
+        # description with stdin and stderr) stays blocking for everyone else.
+        sys.stdout.flush()
+        try:
+            self._fd = os.open(
+                os.ttyname(STDOUT), os.O_WRONLY | os.O_NONBLOCK | os.O_NOCTTY
+            )
+        except OSError:
+            # Not a tty, e.g., output is redirected. Write blocking.
+            self._fd = None
+        else:
+            self._loop = loop
+
         def on_resize(*_):
             self._event_buffer.append(ResizeEvent(self.get_size()))
             loop.call_soon_threadsafe(process)
@@ -140,3 +175,75 @@ class LinuxTerminal(Vt100Terminal):
         loop = asyncio.get_running_loop()
         loop.remove_reader(STDIN)
         signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+
+        with self._write_lock:
+            if self._fd is None:
+                return
+            self._loop = None
+            loop.remove_writer(self._fd)
+            # Write any pending bytes (now blocking).
+            pending = bytes(self._pending)
+            self._pending.clear()
+            self.pending_bytes = 0
+            if pending:
+                self._write_blocking(pending)
+            os.close(self._fd)
+            self._fd = None
+
+    def _write(self, data: str) -> None:
+        """
+        Write data to output stream. Once attached, data the output stream can't
+        accept yet is kept pending and written when it becomes writable.
+        """
+        data = data.encode(errors="replace")
+        self.bytes_written += len(data)
+        if self._loop is None:
+            self._write_blocking(data)
+            return
+
+        if self._pending:
+            # Preserve order: tty is already waiting for earlier bytes.
+            self._pending += data
+            self.pending_bytes = len(self._pending)
+            return
+
+        try:
+            written = os.write(self._fd, data)
+        except BlockingIOError:
+            written = 0
+        if written < len(data):
+            self._pending += data[written:]
+            self.pending_bytes = len(self._pending)
+            # May be called from a non-event-loop thread (e.g., a frame writer).
+            self._loop.call_soon_threadsafe(self._add_writer)
+
+    def _write_blocking(self, data: bytes) -> None:
+        """Write data to output stream and flush, blocking until it's written."""
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+
+    def _add_writer(self) -> None:
+        """Write pending bytes when tty becomes writable."""
+        if self._loop is not None:
+            self._loop.add_writer(self._fd, self._write_pending)
+
+    def _write_pending(self) -> None:
+        """Write as many pending bytes as tty accepts."""
+        with self._write_lock:
+            if self._fd is None:
+                return
+            try:
+                written = os.write(self._fd, self._pending)
+            except BlockingIOError:
+                return
+            except OSError:
+                # Terminal is gone, e.g., a closed connection. Nothing to write to.
+                written = len(self._pending)
+            del self._pending[:written]
+            self.pending_bytes = len(self._pending)
+            if self._pending:
+                return
+            self._loop.remove_writer(self._fd)
+
+        if self._drain_handler is not None:
+            self._drain_handler()
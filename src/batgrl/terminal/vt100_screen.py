@@ -0,0 +1,419 @@
+"""A VT100 screen reconstructed from terminal output."""
+
+import re
+from typing import Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..colors import BLACK, WHITE, Color
+from ..geometry import Point, Size
+from ..text_tools import Cell, char_width
+
+__all__ = ["Vt100Screen"]
+
+TOKENS_RE: Final[re.Pattern[str]] = re.compile(
+    r"\x1b\[(?P<private>[?<=>]?)(?P<params>[0-9;:]*)(?P<intermediate>[ -/]*)"
+    r"(?P<final>[@-~])"
+    r"|(?P<osc>\x1b\][^\x07\x1b]*(?:\x07|\x1b\\))"
+    r"|\x1b(?P<escape>[^\[\]])"
+    r"|(?P<text>[^\x1b]+)"
+    r"|(?P<partial>\x1b(?:\[[?<=>]?[0-9;:]*[ -/]*|\][^\x07\x1b]*)?\Z)"
+    r"|\x1b",
+    re.DOTALL,
+)
+"""Escape sequences, text, or an incomplete escape sequence at the end of data."""
+
+
+def _xterm_palette() -> list[Color]:
+    """Return the colors of the xterm 256-color palette."""
+    palette = [
+        (0, 0, 0),
+        (205, 0, 0),
+        (0, 205, 0),
+        (205, 205, 0),
+        (0, 0, 238),
+        (205, 0, 205),
+        (0, 205, 205),
+        (229, 229, 229),
+        (127, 127, 127),
+        (255, 0, 0),
+        (0, 255, 0),
+        (255, 255, 0),
+        (92, 92, 255),
+        (255, 0, 255),
+        (0, 255, 255),
+        (255, 255, 255),
+    ]
+    levels = [0, 95, 135, 175, 215, 255]
+    palette.extend((r, g, b) for r in levels for g in levels for b in levels)
+    palette.extend((8 + 10 * i,) * 3 for i in range(24))
+    return [Color(*rgb) for rgb in palette]
+
+
+_PALETTE: Final[list[Color]] = _xterm_palette()
+"""Colors of the xterm 256-color palette."""
+_STYLE_SGR: Final[dict[int, tuple[int, bool]]] = {
+    1: (0, True),
+    3: (1, True),
+    4: (2, True),
+    9: (3, True),
+    53: (4, True),
+    22: (0, False),
+    23: (1, False),
+    24: (2, False),
+    29: (3, False),
+    55: (4, False),
+}
+"""Index and value of the style (bold, italic, etc.) set by each SGR parameter."""
+
+
+class Vt100Screen:
+    """
+    A VT100 screen reconstructed from terminal output.
+
+    Only the subset of VT100 escape sequences output by batgrl is interpreted: cursor
+    movement, erasing, SGR attributes, scroll regions, line insertion and deletion,
+    the alternate screen buffer, and synchronized updates. Other escape sequences are
+    ignored.
+
+    Parameters
+    ----------
+    size : Size
+        Size of screen.
+
+    Attributes
+    ----------
+    size : Size
+        Size of screen.
+    canvas : NDArray[Cell]
+        Cells of screen.
+    cursor : Point
+        Position of cursor.
+    cursor_visible : bool
+        Whether cursor is visible.
+    in_alternate_screen : bool
+        Whether the alternate screen buffer is enabled.
+    in_synchronized_update : bool
+        Whether a synchronized update (DEC mode 2026) has begun but not ended.
+    synchronized_updates : int
+        Number of synchronized updates ended.
+    title : str
+        Terminal title.
+
+    Methods
+    -------
+    feed(data)
+        Interpret terminal output.
+    resize(size)
+        Resize screen.
+    display()
+        Return characters of screen as a string.
+    """
+
+    def __init__(self, size: Size):
+        self.size = Size(*size)
+        """Size of screen."""
+        self.cursor_visible: bool = True
+        """Whether cursor is visible."""
+        self.in_alternate_screen: bool = False
+        """Whether the alternate screen buffer is enabled."""
+        self.in_synchronized_update: bool = False
+        """Whether a synchronized update (DEC mode 2026) has begun but not ended."""
+        self.synchronized_updates: int = 0
+        """Number of synchronized updates ended."""
+        self.title: str = ""
+        """Terminal title."""
+
+        self._y: int = 0
+        """Row of cursor."""
+        self._x: int = 0
+        """Column of cursor (equal to width if a wrap is pending)."""
+        self._pen: tuple = (False,) * 5 + (WHITE, BLACK)
+        """Styles, foreground and background color of printed characters."""
+        self._saved: tuple[int, int, tuple] = 0, 0, self._pen
+        """Cursor position and pen saved by DECSC."""
+        self._top: int = 0
+        """Top row of scroll region."""
+        self._bottom: int = self.size.height
+        """Row after the bottom row of scroll region."""
+        self._rows: list[list[tuple]] = self._blank_rows(self.size.height)
+        """Cells of screen as tuples."""
+        self._main_rows: list[list[tuple]] | None = None
+        """Cells of main screen while the alternate screen buffer is enabled."""
+        self._partial: str = ""
+        """Incomplete escape sequence at the end of the last data fed."""
+
+    @property
+    def cursor(self) -> Point:
+        """Position of cursor."""
+        return Point(self._y, min(self._x, self.size.width - 1))
+
+    @property
+    def canvas(self) -> NDArray[Cell]:
+        """Cells of screen."""
+        return np.array(self._rows, Cell).reshape(self.size)
+
+    def display(self) -> str:
+        """
+        Return characters of screen as a string.
+
+        Returns
+        -------
+        str
+            Rows of characters joined by newlines.
+        """
+        return "\n".join("".join(cell[0] for cell in row) for row in self._rows)
+
+    def resize(self, size: Size) -> None:
+        """
+        Resize screen.
+
+        Content is kept from the top-left corner and the scroll region is reset.
+
+        Parameters
+        ----------
+        size : Size
+            New size of screen.
+        """
+        h, w = self.size = Size(*size)
+        for rows in (self._rows, self._main_rows):
+            if rows is None:
+                continue
+            del rows[h:]
+            for row in rows:
+                del row[w:]
+                row.extend(self._blank_row(w - len(row)))
+            rows.extend(self._blank_rows(h - len(rows)))
+        self._y = min(self._y, h - 1)
+        self._x = min(self._x, w)
+        self._top = 0
+        self._bottom = h
+
+    def feed(self, data: str) -> None:
+        """
+        Interpret terminal output.
+
+        Parameters
+        ----------
+        data : str
+            Terminal output.
+        """
+        data = self._partial + data
+        self._partial = ""
+        for match in TOKENS_RE.finditer(data):
+            if (text := match["text"]) is not None:
+                self._print(text)
+            elif (final := match["final"]) is not None:
+                self._csi(
+                    match["private"], match["params"], match["intermediate"], final
+                )
+            elif (escape := match["escape"]) is not None:
+                if escape == "7":
+                    self._saved = self._y, self._x, self._pen
+                elif escape == "8":
+                    self._y, self._x, self._pen = self._saved
+            elif (osc := match["osc"]) is not None:
+                command, _, text = osc[2:].rstrip("\x07\x1b\\").partition(";")
+                if command in ("0", "2"):
+                    self.title = text
+            elif match["partial"] is not None:
+                self._partial = match["partial"]
+
+    def _blank_row(self, width: int) -> list[tuple]:
+        """Return a row of erased cells."""
+        return [(" ", False, False, False, False, False, WHITE, self._pen[6])] * width
+
+    def _blank_rows(self, height: int) -> list[list[tuple]]:
+        """Return rows of erased cells."""
+        return [self._blank_row(self.size.width) for _ in range(height)]
+
+    def _line_feed(self) -> None:
+        """Move cursor down a row or scroll if cursor is at bottom of scroll region."""
+        if self._y == self._bottom - 1:
+            self._scroll(self._top, self._bottom, 1)
+        elif self._y < self.size.height - 1:
+            self._y += 1
+
+    def _scroll(self, top: int, bottom: int, n: int) -> None:
+        """Scroll rows ``top`` to ``bottom`` (exclusive) up by ``n`` rows."""
+        n = max(-(bottom - top), min(bottom - top, n))
+        rows = self._rows[top:bottom]
+        if n > 0:
+            rows = rows[n:] + self._blank_rows(n)
+        elif n < 0:
+            rows = self._blank_rows(-n) + rows[:n]
+        self._rows[top:bottom] = rows
+
+    def _print(self, text: str) -> None:
+        """Print text at cursor."""
+        h, w = self.size
+        for char in text:
+            if char == "\n":
+                self._line_feed()
+                continue
+            if char == "\r":
+                self._x = 0
+                continue
+            if char == "\b":
+                self._x = max(0, min(self._x, w - 1) - 1)
+                continue
+            if ord(char) < 0x20 or char == "\x7f":
+                continue
+
+            width = char_width(char)
+            if width == 0:
+                continue
+            if self._x + width > w:
+                # Pending wrap or not enough room for a full-width character.
+                self._x = 0
+                self._line_feed()
+            row = self._rows[self._y]
+            x = self._x
+            # Overwriting half of a full-width character erases the other half.
+            if row[x][0] == "" and x > 0:
+                row[x - 1] = (" ", *row[x - 1][1:])
+            end = x + width
+            if end < w and row[end][0] == "":
+                row[end] = (" ", *row[end][1:])
+            row[x] = (char, *self._pen)
+            if width == 2:
+                row[x + 1] = ("", *self._pen)
+            self._x = end
+
+    def _csi(self, private: str, params: str, intermediate: str, final: str) -> None:
+        """Interpret a control sequence."""
+        args = [int(param) if param else 0 for param in params.split(";")]
+        if private == "?":
+            if final in "hl" and not intermediate:
+                self._set_modes(args, final == "h")
+            return
+        if private or intermediate:
+            return
+
+        h, w = self.size
+        n = args[0] or 1
+        if final in "Hf":
+            self._y = min(n, h) - 1
+            self._x = min(args[1] or 1 if len(args) > 1 else 1, w) - 1
+        elif final == "G":
+            self._x = min(n, w) - 1
+        elif final == "A":
+            self._y = max(0, self._y - n)
+        elif final == "B":
+            self._y = min(h - 1, self._y + n)
+        elif final == "C":
+            self._x = min(w - 1, self._x + n)
+        elif final == "D":
+            self._x = max(0, min(self._x, w - 1) - n)
+        elif final == "E":
+            self._y = min(h - 1, self._y + n)
+            self._x = 0
+        elif final == "F":
+            self._y = max(0, self._y - n)
+            self._x = 0
+        elif final == "J":
+            self._erase_in_display(args[0])
+        elif final == "K":
+            self._erase_in_line(args[0])
+        elif final == "m":
+            self._select_graphic_rendition(args)
+        elif final == "r":
+            top = (args[0] or 1) - 1
+            bottom = min(args[1] or h, h) if len(args) > 1 else h
+            if top < bottom - 1:
+                self._top, self._bottom = top, bottom
+                self._y = self._x = 0
+        elif final in "LM":
+            if self._top <= self._y < self._bottom:
+                self._scroll(self._y, self._bottom, n if final == "M" else -n)
+                self._x = 0
+        elif final == "S":
+            self._scroll(self._top, self._bottom, n)
+        elif final == "T":
+            self._scroll(self._top, self._bottom, -n)
+
+    def _set_modes(self, modes: list[int], enable: bool) -> None:
+        """Set or reset private modes."""
+        for mode in modes:
+            if mode == 25:
+                self.cursor_visible = enable
+            elif mode == 2026:
+                if self.in_synchronized_update and not enable:
+                    self.synchronized_updates += 1
+                self.in_synchronized_update = enable
+            elif mode == 1049 and enable != self.in_alternate_screen:
+                self.in_alternate_screen = enable
+                if enable:
+                    self._saved = self._y, self._x, self._pen
+                    self._main_rows = self._rows
+                    self._rows = self._blank_rows(self.size.height)
+                else:
+                    self._rows = self._main_rows
+                    self._main_rows = None
+                    self._y, self._x, self._pen = self._saved
+
+    def _erase_in_display(self, n: int) -> None:
+        """Erase part of the screen."""
+        h, w = self.size
+        if n == 0:
+            self._erase_in_line(0)
+            self._rows[self._y + 1 :] = self._blank_rows(h - self._y - 1)
+        elif n == 1:
+            self._erase_in_line(1)
+            self._rows[: self._y] = self._blank_rows(self._y)
+        else:
+            self._rows[:] = self._blank_rows(h)
+
+    def _erase_in_line(self, n: int) -> None:
+        """Erase part of the cursor's row."""
+        w = self.size.width
+        x = min(self._x, w)
+        row = self._rows[self._y]
+        if n == 0:
+            row[x:] = self._blank_row(w - x)
+        elif n == 1:
+            row[: x + 1] = self._blank_row(min(x + 1, w))
+        else:
+            row[:] = self._blank_row(w)
+
+    def _select_graphic_rendition(self, args: list[int]) -> None:
+        """Set pen from SGR parameters."""
+        styles = list(self._pen[:5])
+        fg, bg = self._pen[5:]
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg == 0:
+                styles = [False] * 5
+                fg, bg = WHITE, BLACK
+            elif arg in _STYLE_SGR:
+                style, value = _STYLE_SGR[arg]
+                styles[style] = value
+            elif arg in (38, 48) and i + 1 < len(args):
+                if args[i + 1] == 2 and i + 4 < len(args):
+                    color = Color(*args[i + 2 : i + 5])
+                    i += 4
+                elif args[i + 1] == 5 and i + 2 < len(args):
+                    color = _PALETTE[args[i + 2]]
+                    i += 2
+                else:
+                    break
+                if arg == 38:
+                    fg = color
+                else:
+                    bg = color
+            elif arg == 39:
+                fg = WHITE
+            elif arg == 49:
+                bg = BLACK
+            elif 30 <= arg <= 37:
+                fg = _PALETTE[arg - 30]
+            elif 90 <= arg <= 97:
+                fg = _PALETTE[arg - 82]
+            elif 40 <= arg <= 47:
+                bg = _PALETTE[arg - 40]
+            elif 100 <= arg <= 107:
+                bg = _PALETTE[arg - 92]
+            i += 1
+        self._pen = (*styles, fg, bg)
@@ -5,9 +5,10 @@ import os
 import re
 import sys
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Callable
 from enum import Enum, auto
-from io import StringIO
+from threading import Lock
 from time import monotonic
 from typing import Final, Literal
 
@@ -26,8 +27,36 @@ from .events import (
 )
 
 CPR_RE: Final[re.Pattern[str]] = re.compile(r"\x1b\[(\d+);(\d+)R")
+DECRPM_RE: Final[re.Pattern[str]] = re.compile(r"\x1b\[\?(\d+);(\d)\$y")
+DECRPM_PREFIX_RE: Final[re.Pattern[str]] = re.compile(
+    r"\x1b\[\?(?:\d+(?:;(?:\d\$?)?)?)?"
+)
+"""Start of a private mode report cut off at the end of input data."""
 MOUSE_SGR_RE: Final[re.Pattern[str]] = re.compile(r"\x1b\[<(\d+);(\d+);(\d+)(m|M)")
-PARAMS_RE: Final[re.Pattern[str]] = re.compile(r"[0-9;]")
+ESCAPE_RE: Final[re.Pattern[str]] = re.compile(
+    r"""
+    \x1b
+    (?:
+        \[
+        (?:
+            \[[^\x1b]             # Linux console keys, e.g., ESC[[A
+            | <[0-9;]*[^0-9;\x1b] # SGR mouse, e.g., ESC[<0;1;1M
+            | [0-9;]+[^0-9;\x1b]  # e.g., ESC[1;5A
+            | [^0-9;<\[\x1b]      # e.g., ESC[A
+        )
+        | O[^\x1b]                # e.g., ESCOP
+        | [^\[O\x1b]              # e.g., ESCa
+    )
+    """,
+    re.VERBOSE,
+)
+"""
+Complete escape sequence. An escape interrupted by another escape is discarded.
+Private mode reports (e.g., ESC[?2026;2$y) aren't included. They're only parsed if
+one was requested.
+"""
+TEXT_RE: Final[re.Pattern[str]] = re.compile(r"[^\x00-\x1f\x7f\x9b]+")
+"""Run of characters that are each a key press."""
 BRACKETED_PASTE_START: Final[str] = "\x1b[200~"
 BRACKETED_PASTE_END: Final[str] = "\x1b[201~"
 FOCUS_IN: Final[str] = "\x1b[I"
@@ -39,6 +68,12 @@ DRS_REQUEST_TIMEOUT: Final[float] = 0.1
 Time in seconds for the input parser to expect a response to a device status report
 request.
 """
+SYNCHRONIZED_UPDATE: Final[int] = 2026
+"""Private mode that batches output into atomically presented frames."""
+BEGIN_SYNCHRONIZED_UPDATE: Final[str] = f"\x1b[?{SYNCHRONIZED_UPDATE}h"
+END_SYNCHRONIZED_UPDATE: Final[str] = f"\x1b[?{SYNCHRONIZED_UPDATE}l"
+DEVICE_STATUS_REPORT: Final[str] = "\x1b[6n"
+"""Request for a cursor position report."""
 
 
 class ParserState(Enum):
@@ -46,16 +81,8 @@ class ParserState(Enum):
 
     GROUND = auto()
     """Initial state."""
-    ESCAPE = auto()
-    """Start of an escape sequence."""
-    CSI = auto()
-    """Start of a control sequence."""
-    PARAMS = auto()
-    """Collecting parameters of a control sequence."""
     PASTE = auto()
     """Collecting paste data."""
-    EXECUTE_NEXT = auto()
-    """Execute escape buffer after receiving next character."""
 
 
 class Vt100Terminal(ABC):
@@ -68,6 +95,14 @@ class Vt100Terminal(ABC):
         Whether the alternate screen buffer is enabled.
     last_cursor_position_response : Point
         Last reported cursor position.
+    supports_synchronized_update : bool
+        Whether terminal reported support for synchronized updates (DEC mode 2026).
+    bytes_written : int
+        Total number of bytes written to the output stream.
+    pending_bytes : int
+        Number of flushed bytes not yet written because the output stream is full.
+    is_behind : bool
+        Whether the output stream can't keep up with flushed output.
 
     Methods
     -------
@@ -111,8 +146,10 @@ class Vt100Terminal(ABC):
         Enable reporting terminal focus.
     disable_reporting_focus()
         Disable reporting terminal focus.
-    request_cursor_position_report()
+    request_cursor_position_report(expected=None)
         Report current cursor position.
+    request_synchronized_update_report()
+        Report whether terminal supports synchronized updates.
     move_cursor(pos)
         Move cursor to ``pos``.
     erase_in_display(n)
@@ -124,32 +161,58 @@ class Vt100Terminal(ABC):
         """Whether the alternate screen buffer is enabled."""
         self.last_cursor_position_response: Point = Point(0, 0)
         """Last reported cursor position."""
-
-        self._escape_buffer: StringIO | None = None
-        """Escape sequence buffer."""
-        self._paste_buffer: StringIO | None = None
-        """Paste buffer."""
+        self.supports_synchronized_update: bool = False
+        """Whether terminal reported support for synchronized updates."""
+        self.bytes_written: int = 0
+        """Total number of bytes written to the output stream."""
+        self.pending_bytes: int = 0
+        """Number of flushed bytes not yet written because the output stream is full."""
+
+        self._escape_buffer: str = ""
+        """
+        Unparsed end of the last input data, an incomplete escape sequence or a
+        possibly incomplete end of a bracketed paste.
+        """
+        self._paste_buffer: list[str] | None = None
+        """Paste data collected so far."""
         self._event_buffer: list[Event] = []
         """Events generated during input parsing."""
-        self._out_buffer: list[str] = []
+        self._out_buffer: deque[str] = deque()
         """
         Output buffer.
 
         Escapes for stdout are collected here before ``flush()`` is called.
         """
+        self._write_lock: Lock = Lock()
+        """Serializes writes to the output stream from multiple threads."""
         self._state: ParserState = ParserState.GROUND
         """State of VT100 input parser."""
         self._reset_timer_handle: asyncio.TimerHandle | None = None
         """Timeout handle for executing escape buffer."""
         self._expect_device_status_report: bool = False
         """Whether input parser should expect a device status report."""
-        self._last_drs_request_time: float = monotonic()
-        """When the last device status report was requested."""
+        self._expected_cursor_position: Point | None = None
+        """Cursor position expected in the pending cursor position report if known."""
+        self._inline_origin: Point | None = None
+        """
+        Origin of the last frame rendered inline or ``None`` if the next inline frame
+        must be fully repainted.
+        """
+        self._inline_rows: int = 0
+        """Number of rows below the inline origin fed by inline rendering."""
+        self._expect_mode_report: bool = False
+        """Whether input parser should expect a report of a private mode's state."""
+        self._last_cursor_report_request_time: float = monotonic()
+        """When the last cursor position report was requested."""
+        self._last_mode_report_request_time: float = monotonic()
+        """When the last private mode report was requested."""
         self._last_y: int = 0
         """Last mouse y-coordinate."""
         self._last_x: int = 0
         """Laste mouse x-coordinate."""
         self._event_handler: Callable[[list[Event]], None] | None = None
+        self._drain_handler: Callable[[], None] | None = None
+        """Called when pending bytes are written after the terminal fell behind."""
 
     @abstractmethod
     def process_stdin(self) -> None:
@@ -178,6 +241,16 @@ class Vt100Terminal(ABC):
     def unattach(self) -> None:
         """Stop generating events from stdin."""
 
+    @property
+    def is_behind(self) -> bool:
+        """
+        Whether the output stream can't keep up with flushed output.
+
+        Renderers should skip frames while the terminal is behind. A skipped frame's
+        changes are included in the next written frame.
+        """
+        return self.pending_bytes > 0
+
     def events(self) -> list[Event]:
         """Return a list of input events and reset the event buffer."""
         events = self._event_buffer
@@ -190,15 +263,59 @@ class Vt100Terminal(ABC):
         return Size(rows, cols)
 
     def _feed(self, data: str) -> None:
-        """Generate events from terminal input data."""
+        """
+        Generate events from terminal input data.
+
+        Input is scanned a chunk at a time: runs of text, complete escape sequences
+        and paste data up to the end of the paste are each handled at once. An
+        incomplete escape sequence at the end of the data is kept until more data is
+        fed or it times out.
+        """
         if self._reset_timer_handle is not None:
             self._reset_timer_handle.cancel()
             self._reset_timer_handle = None
 
-        for char in data:
-            self._feed1(char)
+        if self._escape_buffer:
+            data = self._escape_buffer + data
+            self._escape_buffer = ""
 
-        if self._state is ParserState.GROUND:
+        events = self._event_buffer
+        i = 0
+        n = len(data)
+        while i < n:
+            if self._state is ParserState.PASTE:
+                end = data.find(BRACKETED_PASTE_END, i)
+                if end == -1:
+                    # Keep what may be the start of the paste end for the next feed.
+                    escape = data.rfind("\x1b", max(i, n - len(BRACKETED_PASTE_END)))
+                    if escape != -1 and BRACKETED_PASTE_END.startswith(data[escape:]):
+                        self._escape_buffer = data[escape:]
+                        n = escape
+                    self._paste_buffer.append(data[i:n])
+                    break
+                self._paste_buffer.append(data[i:end])
+                events.append(PasteEvent(_paste_data(self._paste_buffer)))
+                self._paste_buffer = None
+                self._state = ParserState.GROUND
+                i = end + len(BRACKETED_PASTE_END)
+            elif text := TEXT_RE.match(data, i):
+                events.extend(map(KeyEvent, text[0]))
+                i = text.end()
+            elif data[i] != "\x1b":
+                self._execute(data[i])
+                i += 1
+            elif escape := self._match_escape(data, i):
+                self._execute(escape[0])
+                i = escape.end()
+            else:
+                next_escape = data.find("\x1b", i + 1)
+                if next_escape == -1:
+                    self._escape_buffer = data[i:]
+                    break
+                # Escape was canceled by the start of another escape.
+                i = next_escape
+
+        if self._state is ParserState.GROUND and not self._escape_buffer:
             return
 
         try:
@@ -210,75 +327,60 @@ class Vt100Terminal(ABC):
                 ESCAPE_TIMEOUT, self._reset_escape
             )
 
-    def _feed1(self, char: str) -> None:
-        """Feed a single character from terminal input into the parser."""
-        if self._state is not ParserState.PASTE and char == "\x1b":
-            # Start a new escape (possibly canceling previous escape).
-            self._escape_buffer = StringIO()
-            self._escape_buffer.write(char)
-            self._state = ParserState.ESCAPE
-        elif self._state is ParserState.EXECUTE_NEXT:
-            self._escape_buffer.write(char)
-            self._execute()
-        elif self._state is ParserState.PASTE:
-            self._paste_buffer.write(char)
-            if char == "~":
-                paste = self._paste_buffer.getvalue()
-                if paste.endswith(BRACKETED_PASTE_END):
-                    self._event_buffer.append(PasteEvent(paste[:-6]))
-                    self._paste_buffer = None
-                    self._state = ParserState.GROUND
-        elif self._state is ParserState.GROUND:
-            if ord(char) < 0x20 or char == "\x7f" or char == "\x9b":
-                self._escape_buffer = StringIO()
-                self._escape_buffer.write(char)
-                self._execute()
-            else:
-                self._event_buffer.append(KeyEvent(char))
-        elif self._state is ParserState.ESCAPE:
-            self._escape_buffer.write(char)
-            if char == "[":
-                self._state = ParserState.CSI
-            elif char == "O":
-                self._state = ParserState.EXECUTE_NEXT
-            else:
-                self._execute()
-        elif self._state is ParserState.CSI:
-            self._escape_buffer.write(char)
-            if char == "[":
-                self._state = ParserState.EXECUTE_NEXT
-            elif char == "<":
-                self._state = ParserState.PARAMS
-            elif PARAMS_RE.fullmatch(char) is None:
-                self._execute()
-            else:
-                self._state = ParserState.PARAMS
-        elif self._state is ParserState.PARAMS:
-            self._escape_buffer.write(char)
-            if PARAMS_RE.fullmatch(char) is None:
-                self._execute()
-
-    def _execute(self) -> None:
-        """Produce an event from the escape buffer."""
-        self._state = ParserState.GROUND
-        escape = self._escape_buffer.getvalue()
-        self._escape_buffer = None
-
+    def _match_escape(self, data: str, i: int) -> re.Match[str] | None:
+        """
+        Match a complete escape sequence at index `i` of `data` or return ``None`` if
+        the escape sequence is incomplete or discarded.
+        """
+        if self._expect_mode_report and data.startswith("\x1b[?", i):
+            if report := DECRPM_RE.match(data, i):
+                return report
+            if DECRPM_PREFIX_RE.fullmatch(data, i):
+                # Wait for the rest of the report.
+                return None
+        return ESCAPE_RE.match(data, i)
+
+    def _execute(self, escape: str) -> None:
+        """Produce an event from an escape sequence or control character."""
         if self._expect_device_status_report:
-            if monotonic() - self._last_drs_request_time >= DRS_REQUEST_TIMEOUT:
+            if (
+                monotonic() - self._last_cursor_report_request_time
+                >= DRS_REQUEST_TIMEOUT
+            ):
                 self._expect_device_status_report = False
             elif cpr_match := CPR_RE.fullmatch(escape):
                 self._expect_device_status_report = False
                 y, x = cpr_match.groups()
-                self.last_cursor_position_response = Point(int(y) - 1, int(x) - 1)
+                reported = Point(int(y) - 1, int(x) - 1)
+                expected = self._expected_cursor_position
+                self._expected_cursor_position = None
+                if expected is None:
+                    self.last_cursor_position_response = reported
+                else:
+                    # The last response was predicted when the report was requested
+                    # and may have been updated since. Correct it by how far off the
+                    # prediction was.
+                    self.last_cursor_position_response += reported - expected
                 self._event_buffer.append(
                     CursorPositionResponseEvent(self.last_cursor_position_response)
                 )
                 return
 
+        if self._expect_mode_report:
+            if monotonic() - self._last_mode_report_request_time >= DRS_REQUEST_TIMEOUT:
+                self._expect_mode_report = False
+            elif decrpm_match := DECRPM_RE.fullmatch(escape):
+                self._expect_mode_report = False
+                mode, state = decrpm_match.groups()
+                if int(mode) == SYNCHRONIZED_UPDATE:
+                    # 1 and 2 are set and reset, 3 is permanently set. 0 (not
+                    # recognized) and 4 (permanently reset) mean no support.
+                    self.supports_synchronized_update = state in "123"
+                return
+
         if escape == BRACKETED_PASTE_START:
             self._state = ParserState.PASTE
-            self._paste_buffer = StringIO(newline=None)
+            self._paste_buffer = []
         elif escape == FOCUS_IN:
             self._event_buffer.append(FocusEvent("in"))
         elif escape == FOCUS_OUT:
@@ -321,33 +423,35 @@ class Vt100Terminal(ABC):
 
     def _reset_escape(self):
         """Execute escape buffer after a timeout period."""
+        escape = self._escape_buffer
+        self._escape_buffer = ""
         if self._state is ParserState.PASTE:
-            paste = self._paste_buffer.getvalue()
+            # Timed out during a paste. Any partial escape in the escape buffer is
+            # the start of a cutoff BRACKETED_PASTE_END and is dropped.
+            self._event_buffer.append(PasteEvent(_paste_data(self._paste_buffer)))
             self._paste_buffer = None
             self._state = ParserState.GROUND
-
-            # Timed out during a paste. Check if there's a partial escape to remove
-            # (maybe BRACKETED_PASTE_END was cutoff).
-            partial_escape_index = paste.find("\x1b")
-            if partial_escape_index != -1:
-                ending = paste[partial_escape_index:]
-                if BRACKETED_PASTE_END[: len(ending)] == ending:
-                    paste = paste[:partial_escape_index]
-            self._event_buffer.append(PasteEvent(paste))
-            self._paste_buffer = None
         else:
-            self._execute()
+            self._execute(escape)
 
         if self._event_handler is not None:
             self._event_handler(self.events())
 
     def flush(self):
-        """Write buffer to output stream and flush."""
-        if len(self._out_buffer) == 0:
-            return
+        """Write buffer to output stream and flush. Thread-safe."""
+        with self._write_lock:
+            if len(self._out_buffer) == 0:
+                return
+
+            # Only take what's currently buffered, other threads may still be adding
+            # to the buffer.
+            buffer = self._out_buffer
+            self._write("".join([buffer.popleft() for _ in range(len(buffer))]))
 
-        data = "".join(self._out_buffer).encode(errors="replace")
-        self._out_buffer.clear()
+    def _write(self, data: str) -> None:
+        """Write data to output stream and flush."""
+        data = data.encode(errors="replace")
+        self.bytes_written += len(data)
         sys.stdout.buffer.write(data)
         sys.stdout.flush()
 
@@ -411,11 +515,49 @@ class Vt100Terminal(ABC):
         """Disable reporting terminal focus."""
         self._out_buffer.append("\x1b[?1004l")
 
-    def request_cursor_position_report(self):
-        """Report current cursor position."""
+    def request_cursor_position_report(self, expected: Point | None = None):
+        """
+        Report current cursor position.
+
+        Parameters
+        ----------
+        expected : Point | None, default: None
+            The cursor position if it's already known or predicted, e.g., by an
+            inline renderer. If given, :attr:`last_cursor_position_response` is set
+            to it immediately and, once the report is received, corrected by the
+            difference between the reported and expected positions.
+        """
+        self._expect_cursor_position_report(expected)
+        self._out_buffer.append(DEVICE_STATUS_REPORT)
+        self.flush()
+
+    def _expect_cursor_position_report(self, expected: Point | None = None):
+        """
+        Prepare input parser for a requested cursor position report. Must be called
+        on the input parser's thread before the request is written.
+
+        Parameters
+        ----------
+        expected : Point | None, default: None
+            The cursor position if it's already known or predicted.
+        """
+        if expected is not None:
+            self.last_cursor_position_response = expected
+        self._expected_cursor_position = expected
         self._expect_device_status_report = True
-        self._last_drs_request_time = monotonic()
-        self._out_buffer.append("\x1b[6n")
+        self._last_cursor_report_request_time = monotonic()
+
+    def request_synchronized_update_report(self):
+        """
+        Report whether terminal supports synchronized updates.
+
+        Sends a DECRQM query for DEC mode 2026. If the terminal supports the mode,
+        :attr:`supports_synchronized_update` is set once the report is received.
+        Terminals that don't recognize the query don't respond.
+        """
+        self._expect_mode_report = True
+        self._last_mode_report_request_time = monotonic()
+        self._out_buffer.append(f"\x1b[?{SYNCHRONIZED_UPDATE}$p")
         self.flush()
 
     def move_cursor(self, pos: Point | None = None):
@@ -447,3 +589,8 @@ class Vt100Terminal(ABC):
             entire screen and delete all lines in scrollback buffer.
         """
         self._out_buffer.append(f"\x1b[{n}J")
+
+
+def _paste_data(paste: list[str]) -> str:
+    """Join paste data and translate carriage returns to newlines."""
+    return "".join(paste).replace("\r\n", "\n").replace("\r", "\n")
@@ -162,6 +162,14 @@ class WindowsTerminal(Vt100Terminal):
         Whether the alternate screen buffer is enabled.
     last_cursor_position_response : Point
         Last reported cursor position.
+    supports_synchronized_update : bool
+        Whether terminal reported support for synchronized updates (DEC mode 2026).
+    bytes_written : int
+        Total number of bytes written to the output stream.
+    pending_bytes : int
+        Number of flushed bytes not yet written because the output stream is full.
+    is_behind : bool
+        Whether the output stream can't keep up with flushed output.
 
     Methods
     -------
@@ -205,8 +213,10 @@ class WindowsTerminal(Vt100Terminal):
         Enable reporting terminal focus.
     disable_reporting_focus()
         Disable reporting terminal focus.
-    request_cursor_position_report()
+    request_cursor_position_report(expected=None)
         Report current cursor position.
+    request_synchronized_update_report()
+        Report whether terminal supports synchronized updates.
     move_cursor(pos)
         Move cursor to ``pos``.
     erase_in_display(n)
@@ -1,6 +1,7 @@
 """Tools for text."""
 
 from bisect import bisect
+from dataclasses import dataclass
 from functools import lru_cache
 from operator import itemgetter
 
@@ -14,6 +15,7 @@ from .geometry import Size
 
 __all__ = [
     "Cell",
+    "CellPlanes",
     "add_text",
     "binary_to_box",
     "binary_to_braille",
@@ -86,6 +88,44 @@ def str_width(chars: str) -> int:
     return sum(map(char_width, chars))
 
 
+_WIDTH_STARTS = np.array([low for low, _, _ in CHAR_WIDTHS], np.uint32)
+"""First ord of each interval in ``CHAR_WIDTHS``."""
+_WIDTH_ENDS = np.array([high for _, high, _ in CHAR_WIDTHS], np.uint32)
+"""Last ord of each interval in ``CHAR_WIDTHS``."""
+_WIDTH_VALUES = np.array([width for _, _, width in CHAR_WIDTHS], np.uint8)
+"""Width of each interval in ``CHAR_WIDTHS``."""
+_WIDTH_TABLE_SIZE = 0x20000
+"""Number of ords in ``_WIDTH_TABLE``, i.e., the first two unicode planes."""
+
+
+def _width_table() -> NDArray[np.uint8]:
+    """Return the width of every ord less than ``_WIDTH_TABLE_SIZE``."""
+    widths = np.ones(_WIDTH_TABLE_SIZE, np.uint8)
+    for low, high, width in CHAR_WIDTHS:
+        if low >= _WIDTH_TABLE_SIZE:
+            break
+        widths[low : min(high + 1, _WIDTH_TABLE_SIZE)] = width
+    return widths
+
+
+_WIDTH_TABLE = _width_table()
+"""Width of every ord less than ``_WIDTH_TABLE_SIZE``."""
+
+
+def _codepoint_widths(codepoints: NDArray[np.uint32]) -> NDArray[np.uint8]:
+    """
+    Return the column widths of an array of codepoints (``0`` is the empty
+    character). Vectorized equivalent of :func:`char_width`.
+    """
+    widths = _WIDTH_TABLE[np.minimum(codepoints, _WIDTH_TABLE_SIZE - 1)]
+    is_rare = codepoints >= _WIDTH_TABLE_SIZE
+    if is_rare.any():
+        rare = codepoints[is_rare]
+        i = np.searchsorted(_WIDTH_STARTS, rare, "right") - 1
+        widths[is_rare] = np.where(rare <= _WIDTH_ENDS[i], _WIDTH_VALUES[i], 1)
+    return widths
+
+
 def is_word_char(char: str) -> bool:
     """
     Whether `char` is a word character.
@@ -126,6 +166,135 @@ def cell_sans(*names: str) -> list[str]:
     return [name for name in Cell.names if name not in names]
 
 
+STYLES = ("bold", "italic", "underline", "strikethrough", "overline")
+"""Style fields of a Cell in the order of their bits in :attr:`CellPlanes.styles`."""
+
+
+@dataclass(slots=True)
+class CellPlanes:
+    """
+    A canvas of cells stored as a structure of arrays.
+
+    Each field of a ``Cell`` array is stored in its own contiguous array so that
+    comparing, gathering and encoding fields doesn't stride over the other fields.
+    Gadgets render into ``Cell`` arrays; use :meth:`from_cells` and :meth:`to_cells` to
+    convert between layouts.
+
+    Parameters
+    ----------
+    codepoints : NDArray[np.uint32]
+        Codepoint of each cell's character (0 for the empty string).
+    styles : NDArray[np.uint8]
+        Packed style bits of each cell. Bit ``i`` is set if the ``i``-th field of
+        :data:`STYLES` is true.
+    fg_color : NDArray[np.uint8]
+        Foreground color of each cell.
+    bg_color : NDArray[np.uint8]
+        Background color of each cell.
+
+    Attributes
+    ----------
+    codepoints : NDArray[np.uint32]
+        Codepoint of each cell's character (0 for the empty string).
+    styles : NDArray[np.uint8]
+        Packed style bits of each cell.
+    fg_color : NDArray[np.uint8]
+        Foreground color of each cell.
+    bg_color : NDArray[np.uint8]
+        Background color of each cell.
+    chars : NDArray[np.dtype("<U1")]
+        A view of `codepoints` as characters.
+    shape : tuple[int, ...]
+        Shape of canvas.
+
+    Methods
+    -------
+    from_cells(cells)
+        Create planes from a ``Cell`` array.
+    to_cells()
+        Return planes as a ``Cell`` array.
+    copy()
+        Return a copy of planes.
+    """
+
+    codepoints: NDArray[np.uint32]
+    """Codepoint of each cell's character (0 for the empty string)."""
+    styles: NDArray[np.uint8]
+    """Packed style bits of each cell."""
+    fg_color: NDArray[np.uint8]
+    """Foreground color of each cell."""
+    bg_color: NDArray[np.uint8]
+    """Background color of each cell."""
+
+    @classmethod
+    def from_cells(cls, cells: NDArray[Cell]) -> "CellPlanes":
+        """
+        Create planes from a ``Cell`` array.
+
+        Parameters
+        ----------
+        cells : NDArray[Cell]
+            The cells to convert.
+
+        Returns
+        -------
+        CellPlanes
+            Planes with the same contents as `cells`.
+        """
+        styles = cells[STYLES[0]].view(np.uint8).copy()
+        for i, style in enumerate(STYLES[1:], start=1):
+            styles |= cells[style].view(np.uint8) << i
+        return cls(
+            cells["char"].view(np.uint32).copy(),
+            styles,
+            np.ascontiguousarray(cells["fg_color"]),
+            np.ascontiguousarray(cells["bg_color"]),
+        )
+
+    def to_cells(self) -> NDArray[Cell]:
+        """
+        Return planes as a ``Cell`` array.
+
+        Returns
+        -------
+        NDArray[Cell]
+            Cells with the same contents as planes.
+        """
+        cells = np.empty(self.shape, Cell)
+        cells["char"] = self.chars
+        for i, style in enumerate(STYLES):
+            cells[style] = self.styles >> i & 1
+        cells["fg_color"] = self.fg_color
+        cells["bg_color"] = self.bg_color
+        return cells
+
+    def copy(self) -> "CellPlanes":
+        """
+        Return a copy of planes.
+
+        Returns
+        -------
+        CellPlanes
+            A copy of planes.
+        """
+        return CellPlanes(
+            self.codepoints.copy(),
+            self.styles.copy(),
+            self.fg_color.copy(),
+            self.bg_color.copy(),
+        )
+
+    @property
+    def chars(self) -> NDArray[np.dtype("<U1")]:
+        """A view of `codepoints` as characters."""
+        return self.codepoints.view("U1")
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of canvas."""
+        return self.codepoints.shape
+
+
 def new_cell(
     char: str = " ",
     bold: bool = False,
@@ -1,6 +1,8 @@
 """Tools for graphics."""
 
+from functools import cache
 from pathlib import Path
+from threading import local
 from typing import Literal
 
 import cv2
@@ -84,6 +86,43 @@ def resize_texture(
     )
 
 
+class _ScratchBuffers(local):
+    """Per-thread uint16 buffers used by ``_composite``, keyed by shape."""
+
+    def __init__(self):
+        self.buffers: dict[tuple, NDArray[np.uint16]] = {}
+        """Scratch buffers keyed by shape and index."""
+
+    def get(self, shape: tuple[int, ...], index: int = 0) -> NDArray[np.uint16]:
+        """Return an uninitialized uint16 buffer of a given shape."""
+        key = shape, index
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            if len(self.buffers) >= _MAX_SCRATCH_BUFFERS:
+                self.buffers.clear()
+            buffer = self.buffers[key] = np.empty(shape, np.uint16)
+        return buffer
+
+
+_MAX_SCRATCH_BUFFERS = 64
+"""Max number of scratch buffers kept by each thread."""
+_SCRATCH = _ScratchBuffers()
+"""Scratch buffers of ``_composite``."""
+_CHANNELS_FIRST = {n: (n - 1, *range(n - 1)) for n in range(1, 5)}
+"""Axes that move the last (channel) axis of an `n`-dimensional array first."""
+
+
+@cache
+def _weights(scale: int) -> NDArray[np.uint16]:
+    """
+    Return the fixed-point weight of each alpha value from 0 to 255 for an alpha
+    scale from 0 to 256.
+    """
+    a = np.arange(256)
+    # Map 255 to 256 so an opaque source with a scale of 256 has a weight of 256.
+    return (((a + (a >> 7)) * scale + 128) >> 8).astype(np.uint16)
+
+
 def _composite(
     dest: NDArray[np.uint8],
     rgb: tuple[int] | NDArray[np.uint8],
@@ -94,12 +133,53 @@ def _composite(
     Composite a texture onto `dest`.
 
     This is an internal function used in various `_render()` methods.
+
+    Blending is done in 8.8 fixed-point with uint16 scratch buffers: each source
+    alpha (scaled by `alpha`) is mapped to a weight in ``[0, 256]`` and
+    ``dest + (rgb - dest) * weight / 256`` is computed modulo ``2**16`` (the result
+    always fits). Opaque sources with ``alpha == 1`` are copied and fully transparent
+    sources are skipped.
     """
-    buffer = np.subtract(rgb, dest, dtype=float)
-    buffer *= a
-    buffer *= alpha
-    buffer /= 255
-    np.add(buffer, dest, out=dest, casting="unsafe")
+    if alpha <= 0:
+        return
+
+    # Map alpha from [0, 1] to [0, 256]. Any alpha less than 1 stays translucent.
+    scale = 256 if alpha >= 1 else min(round(alpha * 256), 255)
+    weights = _weights(scale)
+    if np.ndim(a) == 0:
+        weight = int(weights[a])
+        if weight == 0:
+            return
+        is_opaque = weight == 256
+    else:
+        if not a.any():
+            return
+        is_opaque = scale == 256 and a.min() == 255
+
+    # Channels are moved to the first axis so that the inner loops of ufuncs run
+    # over pixels instead of over the few channels of each pixel.
+    planes = dest.transpose(_CHANNELS_FIRST[dest.ndim])
+    if isinstance(rgb, np.ndarray):
+        rgb = rgb.transpose(_CHANNELS_FIRST[rgb.ndim])
+    else:
+        rgb = np.reshape(rgb, (-1,) + (1,) * (dest.ndim - 1))
+
+    if is_opaque:
+        np.positive(rgb, out=planes, casting="unsafe", order="C")
+        return
+
+    if np.ndim(a) != 0:
+        a = a.transpose(_CHANNELS_FIRST[a.ndim])
+        weight = _SCRATCH.get(a.shape, 2)
+        np.take(weights, a, out=weight)
+
+    buffer = _SCRATCH.get(planes.shape)
+    np.subtract(rgb, planes, out=buffer, dtype=np.uint16, casting="unsafe")
+    buffer *= weight
+    dest_fixed = _SCRATCH.get(planes.shape, 1)
+    np.left_shift(planes, 8, out=dest_fixed, dtype=np.uint16)
+    buffer += dest_fixed
+    np.right_shift(buffer, 8, out=planes, casting="unsafe", order="C")
 
 
 def composite(